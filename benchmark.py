@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+변환 성능 벤치마크
+저장소의 `ps` 샘플(LCModel, 24페이지)과 이를 키운 변형(여러 부 이어 붙인 파일,
+페이지 수가 많은 파일, 여러 파일 묶음, SVG/EPS)을 품질 프리셋 × DPI × 동시 작업 수
+조합으로 변환해 소요 시간, 페이지/s, 최대 메모리(RSS), 출력 크기를 측정하고
+저장된 기준값과 비교
+
+사용 예:
+    python benchmark.py --save bench_baseline.json --csv bench.csv
+    python benchmark.py --baseline bench_baseline.json --threshold 15
+    python benchmark.py --corpus sample pages --presets ebook --dpi 300 --workers 1 4
+"""
+
+import argparse
+import csv
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+SAMPLE_PS = SCRIPT_DIR / "ps"
+
+# 기본 측정 조합
+DEFAULT_CORPUS = ["sample", "pages", "concat", "batch", "svg", "eps"]
+DEFAULT_PRESETS = ["screen", "ebook", "printer", "prepress"]
+DEFAULT_DPI = [150, 300, 600]
+DEFAULT_WORKERS = [1, 4]
+DEFAULT_COPIES = 10
+
+# 기준값 비교 지표: 이름 → 커질수록 나쁜지 (False면 작아질수록 나쁨)
+METRICS = {
+    "wall": True,
+    "pages_per_sec": False,
+    "peak_rss": True,
+    "output_bytes": True,
+}
+
+CSV_FIELDS = ["case", "corpus", "preset", "dpi", "workers", "files", "pages",
+              "wall", "pages_per_sec", "peak_rss", "output_bytes", "converted", "failed"]
+
+SVG_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" width="595" height="791" viewBox="0 0 595 791">
+  <rect x="40" y="40" width="515" height="711" fill="none" stroke="black" stroke-width="1"/>
+  <text x="60" y="80" font-family="Helvetica" font-size="18">PS2PDF benchmark {n}</text>
+  <polyline fill="none" stroke="blue" stroke-width="0.8" points="{points}"/>
+</svg>
+"""
+
+
+def write_scaled_pages(index, copies, out_path):
+    """DSC 규격을 지키면서 페이지를 copies배로 늘린 PS 파일 (페이지 번호 다시 매김)"""
+    with open(index.path, "rb") as src, open(out_path, "wb") as dst:
+        src.seek(0)
+        dst.write(src.read(index.prolog_end))
+        n = 0
+        for _ in range(copies):
+            for start, end in index.pages:
+                src.seek(start)
+                section = src.read(end - start)
+                n += 1
+                # 첫 줄(%%Page: 라벨 순번)만 새 번호로 교체
+                dst.write(f"%%Page: {n} {n}\n".encode("ascii"))
+                dst.write(section.split(b"\n", 1)[1] if b"\n" in section else b"")
+        if index.trailer:
+            src.seek(index.trailer[0])
+            dst.write(src.read(index.trailer[1] - index.trailer[0]))
+    return n
+
+
+def write_eps(index, out_path):
+    """샘플 첫 페이지로 EPS 파일 생성"""
+    with open(index.path, "rb") as src, open(out_path, "wb") as dst:
+        prolog = src.read(index.prolog_end)
+        dst.write(b"%!PS-Adobe-3.0 EPSF-3.0\n")
+        dst.write(prolog.split(b"\n", 1)[1])
+        src.seek(index.pages[0][0])
+        dst.write(src.read(index.pages[0][1] - index.pages[0][0]))
+        if index.trailer:
+            src.seek(index.trailer[0])
+            dst.write(src.read(index.trailer[1] - index.trailer[0]))
+
+
+def write_svg(n, out_path):
+    """선 그래프가 있는 합성 SVG 파일"""
+    points = " ".join(f"{60 + i},{400 + int(200 * ((i * 37 + n * 11) % 97) / 97)}" for i in range(0, 480, 2))
+    with open(out_path, "w", encoding="utf-8") as fh:
+        fh.write(SVG_TEMPLATE.format(n=n, points=points))
+
+
+def build_corpus(names, work_dir, copies):
+    """측정용 입력 생성 → {이름: {"inputs": [...], "pages": 총 페이지 수, "ghostscript": bool}}"""
+    from ps_dsc import scan_dsc
+
+    index = scan_dsc(str(SAMPLE_PS))
+    if index is None:
+        raise RuntimeError(f"샘플 파일이 DSC 규격이 아닙니다: {SAMPLE_PS}")
+    corpus = {}
+    for name in names:
+        folder = os.path.join(work_dir, "in", name)
+        os.makedirs(folder, exist_ok=True)
+        if name == "sample":
+            path = os.path.join(folder, "sample.ps")
+            with open(SAMPLE_PS, "rb") as src, open(path, "wb") as dst:
+                dst.write(src.read())
+            corpus[name] = {"inputs": [path], "pages": index.page_count, "ghostscript": True}
+        elif name == "pages":
+            # 페이지 수가 많은 파일 하나 (DSC 규격, 페이지 분할 가능)
+            path = os.path.join(folder, f"pages_x{copies}.ps")
+            pages = write_scaled_pages(index, copies, path)
+            corpus[name] = {"inputs": [path], "pages": pages, "ghostscript": True}
+        elif name == "concat":
+            # 문서를 통째로 여러 번 이어 붙인 파일 (DSC 위반: 통째 변환 경로)
+            path = os.path.join(folder, f"concat_x{copies}.ps")
+            with open(SAMPLE_PS, "rb") as src:
+                data = src.read()
+            with open(path, "wb") as dst:
+                for _ in range(copies):
+                    dst.write(data)
+            corpus[name] = {"inputs": [path], "pages": index.page_count * copies, "ghostscript": True}
+        elif name == "batch":
+            # 같은 샘플 여러 파일 (작업자 수/병합 측정)
+            inputs = []
+            for i in range(copies):
+                path = os.path.join(folder, f"sample_{i:03d}.ps")
+                with open(SAMPLE_PS, "rb") as src, open(path, "wb") as dst:
+                    dst.write(src.read())
+                inputs.append(path)
+            corpus[name] = {"inputs": inputs, "pages": index.page_count * copies, "ghostscript": True}
+        elif name == "svg":
+            inputs = []
+            for i in range(copies):
+                path = os.path.join(folder, f"chart_{i:03d}.svg")
+                write_svg(i, path)
+                inputs.append(path)
+            corpus[name] = {"inputs": inputs, "pages": copies, "ghostscript": False}
+        elif name == "eps":
+            path = os.path.join(folder, "page1.eps")
+            write_eps(index, path)
+            # EPS도 Ghostscript 벡터 변환 (BACKENDS[".eps"])
+            corpus[name] = {"inputs": [path], "pages": 1, "ghostscript": True}
+        else:
+            raise ValueError(f"알 수 없는 입력 종류: {name}")
+    return corpus
+
+
+def peak_rss_bytes():
+    """이 프로세스와 기다린 자식 프로세스(Ghostscript, SVG/EPS 작업 프로세스) 중 최대 RSS (바이트, 측정 불가면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    scale = 1 if sys.platform == "darwin" else 1024
+    return max(own, children) * scale
+
+
+def run_case(spec):
+    """측정 한 건 (별도 프로세스에서 실행되어 RSS가 다른 조합과 섞이지 않음)"""
+    from ps2pdf_engine import ConversionJob, run_job, PRESETS
+
+    out_dir = tempfile.mkdtemp(prefix="ps2pdf_bench_out_", dir=spec["work_dir"])
+    job = ConversionJob(
+        inputs=spec["inputs"],
+        output_dir=out_dir,
+        quality=PRESETS[spec["preset"]],
+        resolution=str(spec["dpi"]),
+        workers=spec["workers"],
+        use_cache=False,
+        gs_command=spec.get("gs_command")
+    )
+    started = time.perf_counter()
+    job_result = run_job(job)
+    wall = time.perf_counter() - started
+    # SVG/EPS 작업 프로세스를 정리해야 자식 프로세스 RSS에 잡힘
+    from render_pool import shared_pool
+    shared_pool().close()
+
+    outputs = job_result.outputs + ([job_result.merged_path] if job_result.merged_path else [])
+    output_bytes = sum(os.path.getsize(p) for p in outputs if os.path.exists(p))
+    return {
+        "wall": wall,
+        "pages_per_sec": spec["pages"] / wall if wall > 0 else 0.0,
+        "peak_rss": peak_rss_bytes(),
+        "output_bytes": output_bytes,
+        "converted": len(job_result.outputs),
+        "failed": len(job_result.failed),
+        "errors": [r.message for r in job_result.failed][:3],
+    }
+
+
+def measure(spec, runs):
+    """같은 조합을 runs번 측정해 중앙값 반환 (실패하면 None)"""
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, str(Path(__file__).resolve()), "--run-case", json.dumps(spec)],
+                              cwd=SCRIPT_DIR, capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "측정 실패")
+            return None
+        samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    result = dict(samples[-1])
+    for metric in METRICS:
+        values = [s[metric] for s in samples if s[metric] is not None]
+        result[metric] = statistics.median(values) if values else None
+    return result
+
+
+def case_key(corpus, preset, dpi, workers):
+    return f"{corpus}/{preset}/{dpi}dpi/j{workers}"
+
+
+def compare(current, baseline, threshold):
+    """기준값 대비 threshold% 이상 나빠진 (조합, 지표) 목록"""
+    old_cases = {c["case"]: c for c in baseline.get("cases", [])}
+    regressions = []
+    for case in current["cases"]:
+        old = old_cases.get(case["case"])
+        if old is None:
+            continue
+        for metric, higher_is_worse in METRICS.items():
+            before, after = old.get(metric), case.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * 100
+            worse = change > threshold if higher_is_worse else change < -threshold
+            if worse:
+                regressions.append((case["case"], metric, before, after, change))
+    return regressions
+
+
+def format_value(metric, value):
+    if value is None:
+        return "-"
+    if metric == "wall":
+        return f"{value:.2f}s"
+    if metric == "pages_per_sec":
+        return f"{value:.1f} p/s"
+    return f"{value / (1024 * 1024):.1f} MB"
+
+
+def main(argv=None):
+    """메인 함수 (기준값 대비 나빠진 지표가 있으면 종료 코드 1)"""
+    parser = argparse.ArgumentParser(description="PS2PDF 변환 성능 벤치마크")
+    parser.add_argument("--corpus", nargs="+", choices=DEFAULT_CORPUS, default=DEFAULT_CORPUS,
+                        help="측정할 입력 종류 (기본값: 전부)")
+    parser.add_argument("--presets", nargs="+", choices=DEFAULT_PRESETS, default=DEFAULT_PRESETS)
+    parser.add_argument("--dpi", nargs="+", type=int, default=DEFAULT_DPI)
+    parser.add_argument("--workers", nargs="+", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--copies", type=int, default=DEFAULT_COPIES,
+                        help=f"변형 입력의 배수 (기본값: {DEFAULT_COPIES})")
+    parser.add_argument("--runs", type=int, default=1, help="조합마다 반복 횟수, 중앙값 사용 (기본값: 1)")
+    parser.add_argument("--gs", help="Ghostscript 실행 파일 (기본값: 자동 탐색)")
+    parser.add_argument("--save", "--json", dest="save", help="결과를 JSON으로 저장")
+    parser.add_argument("--csv", help="결과를 CSV로 저장")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=20.0,
+                        help="나빠짐으로 판단할 변화율 %% (기본값: 20)")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        print(json.dumps(run_case(json.loads(args.run_case))))
+        return 0
+
+    from ps2pdf_engine import find_ghostscript, gs_version
+
+    gs_command = args.gs or find_ghostscript() or ""
+    print(f"Ghostscript: {gs_command or '없음'} {gs_version(gs_command) if gs_command else ''}")
+
+    report = {
+        "gs_command": gs_command,
+        "gs_version": gs_version(gs_command) if gs_command else "",
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "cpu_count": os.cpu_count(),
+        "copies": args.copies,
+        "cases": [],
+    }
+    with tempfile.TemporaryDirectory(prefix="ps2pdf_bench_") as work_dir:
+        corpus = build_corpus(args.corpus, work_dir, args.copies)
+        for name, item in corpus.items():
+            if item["ghostscript"] and not gs_command:
+                print(f"{name}: Ghostscript가 없어 건너뜀")
+                continue
+            # SVG는 품질 프리셋(-dPDFSETTINGS)과 무관하므로 첫 프리셋만 측정
+            presets = args.presets[:1] if name == "svg" else args.presets
+            for preset in presets:
+                for dpi in args.dpi:
+                    for workers in args.workers:
+                        key = case_key(name, preset, dpi, workers)
+                        spec = {
+                            "inputs": item["inputs"],
+                            "pages": item["pages"],
+                            "preset": preset,
+                            "dpi": dpi,
+                            "workers": workers,
+                            "work_dir": work_dir,
+                            "gs_command": gs_command,
+                        }
+                        result = measure(spec, args.runs)
+                        if result is None:
+                            print(f"  {key:32s} 측정 실패")
+                            continue
+                        result.update(case=key, corpus=name, preset=preset, dpi=dpi, workers=workers,
+                                      files=len(item["inputs"]), pages=item["pages"])
+                        report["cases"].append(result)
+                        print(f"  {key:32s} {format_value('wall', result['wall']):>9s} "
+                              f"{format_value('pages_per_sec', result['pages_per_sec']):>11s} "
+                              f"RSS {format_value('peak_rss', result['peak_rss']):>9s} "
+                              f"출력 {format_value('output_bytes', result['output_bytes']):>9s}"
+                              + (f"  실패 {result['failed']}개" if result["failed"] else ""))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.save}")
+    if args.csv:
+        with open(args.csv, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(report["cases"])
+        print(f"CSV 저장: {args.csv}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        print(f"\n기준값 비교 ({args.baseline}, Ghostscript {baseline.get('gs_version') or '?'} → "
+              f"{report['gs_version'] or '?'}, 허용 {args.threshold:.0f}%):")
+        regressions = compare(report, baseline, args.threshold)
+        for key, metric, before, after, change in regressions:
+            print(f"  ✗ {key:32s} {metric:14s} {format_value(metric, before)} → "
+                  f"{format_value(metric, after)} ({change:+.1f}%)")
+        if regressions:
+            print(f"✗ 나빠진 지표 {len(regressions)}개")
+            return 1
+        print("✓ 기준값 대비 나빠진 지표 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -69,6 +69,7 @@ def build_exe():
                 print("   https://www.ghostscript.com/download/gsdnld.html")
                 print("2. PS2PDF_Converter.exe를 실행하세요.")
                 print("3. PS 파일을 선택하고 변환 버튼을 클릭하세요.")
+                print("4. 시작 시간 확인: python startup_benchmark.py --exe dist/PS2PDF_Converter.exe")
                 
                 return True
             else:
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+변환 취소/일시 정지
+실행 중인 Ghostscript 프로세스를 등록해 두었다가 취소하면 프로세스 트리째 바로 종료
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+
+
+class ConversionCancelled(Exception):
+    """사용자가 작업을 취소함"""
+
+
+def process_group_kwargs():
+    """자식 프로세스까지 한꺼번에 종료할 수 있도록 새 프로세스 그룹으로 띄우는 Popen 인자"""
+    if sys.platform.startswith('win'):
+        return {"creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0)
+                | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)}
+    return {"start_new_session": True}
+
+
+def kill_process_tree(proc):
+    """proc와 그 자식 프로세스를 모두 강제 종료"""
+    if proc.poll() is not None:
+        return
+    try:
+        if sys.platform.startswith('win'):
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                           capture_output=True,
+                           creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        pass
+    if proc.poll() is None:
+        try:
+            proc.kill()
+        except OSError:
+            pass
+
+
+class CancelToken:
+    """작업 취소/일시 정지 신호
+
+    cancel()은 어느 스레드에서 불러도 되며, 등록된 프로세스를 바로 종료한다.
+    일시 정지 중에는 새 파일을 시작하지 않는다 (실행 중인 파일은 끝까지 변환).
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+        self._procs = set()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        self._running.set()  # 일시 정지 중인 작업자도 깨워서 정리하게 함
+        with self._lock:
+            procs = list(self._procs)
+        for proc in procs:
+            kill_process_tree(proc)
+
+    def pause(self):
+        if not self.cancelled:
+            self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def wait_if_paused(self):
+        """일시 정지가 풀리거나 취소될 때까지 대기"""
+        self._running.wait()
+
+    def check(self):
+        """취소되었으면 ConversionCancelled"""
+        if self.cancelled:
+            raise ConversionCancelled("사용자가 취소했습니다.")
+
+    def register(self, proc):
+        """실행 중인 프로세스 등록 (이미 취소되었으면 바로 종료)"""
+        with self._lock:
+            self._procs.add(proc)
+        if self.cancelled:
+            kill_process_tree(proc)
+
+    def unregister(self, proc):
+        with self._lock:
+            self._procs.discard(proc)
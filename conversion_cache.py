@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+변환 결과 캐시
+입력 내용 해시 + 변환 옵션을 키로 PDF를 저장해 같은 입력은 다시 변환하지 않음
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import uuid
+
+# 키 형식이 바뀌면 올려서 예전 캐시를 무효화
+CACHE_FORMAT = 1
+
+# 기본 캐시 용량 상한 (1GB)
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def user_cache_dir():
+    """사용자별 캐시 폴더 경로"""
+    if sys.platform.startswith('win'):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return os.path.join(base, "PS2PDF")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "ps2pdf")
+
+
+def file_digest(path, block_size=1024 * 1024, cancel=None):
+    """파일 내용의 SHA-256 해시 (cancel(CancelToken)을 주면 블록마다 확인해 ConversionCancelled)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(block_size), b""):
+            if cancel is not None:
+                cancel.check()
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _temp_name(path):
+    """같은 폴더의 임시 파일 이름 (원자적 교체용)"""
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+
+
+class ConversionCache:
+    """내용 주소 기반 PDF 캐시 (용량 상한 초과 시 오래 안 쓴 항목부터 삭제)"""
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or os.path.join(user_cache_dir(), "pdf_cache")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total = None  # 첫 저장 시 계산
+
+    def reset_stats(self):
+        """적중/미적중 횟수 초기화"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def key(self, in_file, params):
+        """입력 내용 해시와 변환 옵션으로 캐시 키 생성"""
+        options = json.dumps({"format": CACHE_FORMAT, **params}, sort_keys=True)
+        digest = hashlib.sha256()
+        digest.update(file_digest(in_file).encode("ascii"))
+        digest.update(options.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.pdf")
+
+    def fetch(self, key, out_path):
+        """캐시에 있으면 out_path로 하드링크(안 되면 복사)하고 True 반환"""
+        entry = self._entry_path(key)
+        try:
+            # 최근 사용 시각 갱신 (LRU 기준)
+            os.utime(entry)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return False
+
+        tmp_path = _temp_name(out_path)
+        try:
+            try:
+                os.link(entry, tmp_path)
+            except OSError:
+                # 다른 드라이브/파일 시스템이면 복사
+                shutil.copyfile(entry, tmp_path)
+            os.replace(tmp_path, out_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def store(self, key, pdf_path):
+        """변환된 PDF를 캐시에 복사 저장"""
+        entry = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        tmp_path = _temp_name(entry)
+        try:
+            shutil.copyfile(pdf_path, tmp_path)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, entry)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._entries())
+            else:
+                self._total += size
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """(경로, 크기, 최근 사용 시각) 목록"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for sub in os.scandir(self.cache_dir):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".pdf"):
+                    st = entry.stat()
+                    entries.append((entry.path, st.st_size, st.st_mtime))
+        return entries
+
+    def _evict(self):
+        """용량 상한의 90%까지 오래 안 쓴 항목부터 삭제 (잠금 상태에서 호출)"""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+        self._total = total
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            if os.path.isdir(self.cache_dir):
+                shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self._total = 0
+
+    def size(self):
+        """현재 캐시 사용량 (바이트)"""
+        return sum(size for _, size, _ in self._entries())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+입력 형식 판별
+파일 이름이 아니라 앞부분 바이트(매직 바이트)로 PS / EPS / SVG / PDF를 가려내고,
+gzip / bz2 / xz로 압축된 파일은 앞부분만 풀어서 안쪽 형식을 판별함
+
+새 형식은 register_format()으로 판별 함수를 추가하면 됨
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+import re
+import threading
+from dataclasses import dataclass
+
+# 판별에 읽는 앞부분 크기
+SNIFF_BYTES = 4096
+
+# 압축 해제 후 Ghostscript 표준 입력 등으로 넘길 때 한 번에 읽는 크기
+STREAM_CHUNK = 1024 * 1024
+
+# 압축 형식: 이름 → (매직 바이트, 스트림 열기 함수)
+COMPRESSIONS = {
+    "gzip": (b"\x1f\x8b", gzip.open),
+    "bz2": (b"BZh", bz2.open),
+    "xz": (b"\xfd7zXZ\x00", lzma.open),
+}
+
+# 압축 파일 확장자 (출력 이름에서 떼어 냄: report.ps.gz → report.pdf)
+COMPRESSED_SUFFIXES = (".gz", ".bz2", ".xz")
+
+# DOS 바이너리 EPS 헤더 (C5 D0 D3 C6 + PostScript 위치/길이)
+DOS_EPS_MAGIC = b"\xc5\xd0\xd3\xc6"
+
+SVG_RE = re.compile(rb"<svg[\s>/]")
+
+
+@dataclass(frozen=True)
+class InputFormat:
+    """판별된 입력 형식"""
+    name: str                 # ps / eps / svg / pdf
+    ext: str                  # 대표 확장자 (.ps, .eps, .svg, .pdf)
+    compression: str = None   # gzip / bz2 / xz, 압축되지 않았으면 None
+
+    @property
+    def compressed(self):
+        return self.compression is not None
+
+
+# (이름, 대표 확장자, 판별 함수(앞부분 바이트) → bool). 앞에서부터 검사
+_formats = []
+_memo = {}  # (절대 경로, 크기, 수정 시각) → InputFormat 또는 None
+_memo_lock = threading.Lock()
+MEMO_SIZE = 1024
+
+
+def register_format(name, ext, test, first=False):
+    """판별 함수 등록 (first=True면 기존 형식보다 먼저 검사)"""
+    entry = (name, ext, test)
+    if first:
+        _formats.insert(0, entry)
+    else:
+        _formats.append(entry)
+    with _memo_lock:
+        _memo.clear()
+
+
+def _strip_ps_prefix(head):
+    # Windows 프린터 드라이버가 앞에 붙이는 Ctrl-D 제거
+    return head.lstrip(b"\x04")
+
+
+def _is_eps(head):
+    if head.startswith(DOS_EPS_MAGIC):
+        return True
+    first_line = _strip_ps_prefix(head).split(b"\n", 1)[0].split(b"\r", 1)[0]
+    return first_line.startswith(b"%!PS-Adobe-") and b"EPSF-" in first_line
+
+
+def _is_ps(head):
+    head = _strip_ps_prefix(head)
+    if head.startswith(b"\x1b%-12345X"):
+        # 프린터로 보내던 PJL 작업 헤더 뒤에 PostScript가 오는 경우
+        return b"\n%!" in head or b"\r%!" in head
+    return head.startswith(b"%!")
+
+
+def _is_pdf(head):
+    # 앞에 쓰레기 바이트가 조금 붙은 PDF도 읽히므로 처음 1KB 안에서 찾음
+    return b"%PDF-" in head[:1024]
+
+
+def _is_svg(head):
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    return text.startswith(b"<") and SVG_RE.search(head) is not None
+
+
+register_format("eps", ".eps", _is_eps)
+register_format("ps", ".ps", _is_ps)
+register_format("pdf", ".pdf", _is_pdf)
+register_format("svg", ".svg", _is_svg)
+
+
+def compression_of(head):
+    """앞부분 바이트로 압축 형식 판별 (압축이 아니면 None)"""
+    for name, (magic, _) in COMPRESSIONS.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def sniff_bytes(head):
+    """앞부분 바이트(압축이 풀린 상태)로 형식 이름과 확장자 판별 (모르면 None)"""
+    for name, ext, test in _formats:
+        if test(head):
+            return name, ext
+    return None
+
+
+def open_stream(path, compression=None):
+    """압축을 풀면서 읽는 이진 스트림 (compression이 None이면 파일 그대로)"""
+    if compression is None:
+        return open(path, "rb")
+    return COMPRESSIONS[compression][1](path, "rb")
+
+
+def _sniff(path):
+    with open(path, "rb") as fh:
+        head = fh.read(SNIFF_BYTES)
+    compression = compression_of(head)
+    if compression is not None:
+        try:
+            with open_stream(path, compression) as fh:
+                head = fh.read(SNIFF_BYTES)
+        except (OSError, EOFError, lzma.LZMAError):
+            return None
+    found = sniff_bytes(head)
+    if found is None:
+        return None
+    return InputFormat(found[0], found[1], compression)
+
+
+def detect_format(path):
+    """파일 내용으로 입력 형식 판별 (알 수 없거나 읽을 수 없으면 None)
+
+    크기/수정 시각이 같으면 이전 판별 결과를 그대로 사용한다.
+    """
+    abs_path = os.path.abspath(path)
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        return None
+    key = (abs_path, st.st_size, st.st_mtime)
+    with _memo_lock:
+        if key in _memo:
+            return _memo[key]
+    try:
+        fmt = _sniff(abs_path)
+    except OSError:
+        return None
+    with _memo_lock:
+        if len(_memo) >= MEMO_SIZE:
+            _memo.pop(next(iter(_memo)))
+        _memo[key] = fmt
+    return fmt
+
+
+def output_stem(path):
+    """출력 PDF 이름에 쓸 파일 이름 (압축 확장자와 원래 확장자를 뗀 것)"""
+    name = os.path.basename(path)
+    root, ext = os.path.splitext(name)
+    if ext.lower() in COMPRESSED_SUFFIXES:
+        name = root
+        root, ext = os.path.splitext(name)
+    return root if ext else name
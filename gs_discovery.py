@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ghostscript 탐색 및 캐시
+찾은 실행 파일 경로, 버전, 지원 장치, 공유 라이브러리 위치를 사용자 캐시 파일에 저장해
+다음 실행부터는 프로세스를 띄우지 않고 바로 사용 (실행 파일의 수정 시각/크기가 바뀌면 다시 확인)
+"""
+
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass, field, asdict
+
+from conversion_cache import user_cache_dir
+
+# 탐색할 실행 파일 이름 (Windows 64bit → 32bit → 기타)
+GS_COMMANDS = ['gswin64c', 'gswin32c', 'gs']
+
+# 캐시 파일 형식 버전
+CACHE_VERSION = 1
+
+_lock = threading.Lock()
+_memo = None  # 이번 프로세스에서 확인을 마친 정보
+
+
+@dataclass
+class GhostscriptInfo:
+    """Ghostscript 설치 정보"""
+    command: str                 # 실행 파일 전체 경로
+    version: str = ""
+    devices: list = field(default_factory=list)
+    library: str = ""            # 공유 라이브러리(gsdll64.dll, libgs.so) 경로, 없으면 ""
+    mtime: float = 0.0
+    size: int = 0
+
+    @property
+    def name(self):
+        """로그 표시용 실행 파일 이름"""
+        return os.path.basename(self.command)
+
+    def has_device(self, device):
+        return device in self.devices
+
+    def is_current(self):
+        """실행 파일이 캐시할 때와 같은지 (수정 시각/크기 비교)"""
+        try:
+            st = os.stat(self.command)
+        except OSError:
+            return False
+        return st.st_mtime == self.mtime and st.st_size == self.size
+
+
+def cache_path():
+    """탐색 결과 캐시 파일 경로"""
+    return os.path.join(user_cache_dir(), "gs_discovery.json")
+
+
+def candidate_paths():
+    """프로세스를 띄우지 않고 찾은 Ghostscript 실행 파일 후보 (우선순위 순)"""
+    found = []
+    for cmd in GS_COMMANDS:
+        path = shutil.which(cmd)
+        if path:
+            found.append(os.path.abspath(path))
+    if sys.platform.startswith('win'):
+        # PATH에 추가하지 않은 기본 설치 위치
+        for base in (os.environ.get("ProgramFiles"), os.environ.get("ProgramFiles(x86)")):
+            if not base:
+                continue
+            for exe in ("gswin64c.exe", "gswin32c.exe"):
+                found.extend(sorted(glob.glob(os.path.join(base, "gs", "gs*", "bin", exe)), reverse=True))
+    unique = []
+    for path in found:
+        if path not in unique:
+            unique.append(path)
+    return unique
+
+
+def find_library(command):
+    """실행 파일에 대응하는 Ghostscript 공유 라이브러리 경로"""
+    if sys.platform.startswith('win'):
+        bin_dir = os.path.dirname(command)
+        for dll in ("gsdll64.dll", "gsdll32.dll"):
+            path = os.path.join(bin_dir, dll)
+            if os.path.exists(path):
+                return path
+        return ""
+    import ctypes.util
+    return ctypes.util.find_library("gs") or ""
+
+
+def parse_devices(help_text):
+    """'gs -h' 출력의 Available devices: 목록 파싱"""
+    devices = []
+    in_devices = False
+    for line in help_text.splitlines():
+        if line.startswith("Available devices:"):
+            in_devices = True
+            continue
+        if in_devices:
+            if not line.startswith(" "):
+                break
+            devices.extend(line.split())
+    return devices
+
+
+def probe(command):
+    """실행 파일을 실제로 실행해 정보를 확인 (실패 시 None)"""
+    try:
+        proc = subprocess.run([command, '--version'], capture_output=True, text=True, timeout=5)
+        if proc.returncode != 0:
+            return None
+        version = proc.stdout.strip().split('\n')[0]
+        help_proc = subprocess.run([command, '-h'], capture_output=True, text=True, timeout=5)
+        st = os.stat(command)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return GhostscriptInfo(
+        command=command,
+        version=version,
+        devices=parse_devices(help_proc.stdout),
+        library=find_library(command),
+        mtime=st.st_mtime,
+        size=st.st_size
+    )
+
+
+def load_cached():
+    """캐시 파일의 정보 (검증 없이 읽기만 함, 없으면 None)"""
+    try:
+        with open(cache_path(), "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if data.get("version") != CACHE_VERSION or not data.get("info"):
+            return None
+        return GhostscriptInfo(**data["info"])
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_cached(info):
+    """탐색 결과를 캐시 파일에 저장 (None이면 캐시 삭제)"""
+    path = cache_path()
+    try:
+        if info is None:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"version": CACHE_VERSION, "info": asdict(info)}, fh, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def discover(refresh=False):
+    """Ghostscript 정보 반환 (없으면 None)
+
+    캐시가 있고 실행 파일이 그대로면 프로세스를 띄우지 않는다.
+    refresh=True면 캐시를 무시하고 다시 확인한다.
+    """
+    global _memo
+    with _lock:
+        if not refresh:
+            if _memo is not None:
+                return _memo
+            cached = load_cached()
+            if cached is not None and cached.is_current():
+                _memo = cached
+                return cached
+
+        info = None
+        for path in candidate_paths():
+            info = probe(path)
+            if info is not None:
+                break
+        save_cached(info)
+        _memo = info
+        return info
+
+
+def cached_info():
+    """이번 프로세스에서 이미 확인한 정보 또는 (검증 전) 캐시 파일 정보"""
+    return _memo if _memo is not None else load_cached()
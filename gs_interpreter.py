@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상주 Ghostscript 인터프리터
+gs 프로세스 하나를 계속 띄워 두고 표준 입력으로 작업을 넘겨
+파일마다 프로세스 시작/초기화 파일/폰트 맵 로딩 비용을 내지 않도록 함
+"""
+
+import collections
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+
+from cancellation import kill_process_tree, process_group_kwargs
+
+# 이 횟수만큼 변환하면 인터프리터를 다시 띄움 (메모리 증가 방지)
+DEFAULT_MAX_JOBS = 200
+
+# --permit-file-* 옵션은 Ghostscript 9.50부터 지원
+MIN_VERSION = (9, 50)
+
+# 페이지를 끝낼 때마다 출력하는 줄
+# (Ghostscript의 "Page N" 줄은 -q이거나 PS/EPS 입력이면 나오지 않으므로 EndPage에서 직접 출력)
+PAGE_MARKER = "PS2PDF_PAGE"
+
+# reason 2 = 장치 비활성화는 페이지가 아님, PLRM 기본 동작과 같이 true/false 반환
+END_PAGE_PROC = "{ exch pop 2 ne dup { (%s) = flush } if }" % PAGE_MARKER
+
+
+def parse_version(text):
+    """'10.02.1' → (10, 2, 1)"""
+    parts = []
+    for piece in text.strip().split("."):
+        if not piece.isdigit():
+            break
+        parts.append(int(piece))
+    return tuple(parts)
+
+
+def supports_resident(version_text):
+    """상주 인터프리터 사용 가능 여부 (Ghostscript 버전 기준)"""
+    version = parse_version(version_text or "")
+    return bool(version) and version >= MIN_VERSION
+
+
+def ps_string(text):
+    """PostScript 문자열 리터럴로 변환 (괄호/역슬래시/비ASCII 이스케이프)"""
+    out = ["("]
+    for byte in text.encode("utf-8"):
+        ch = chr(byte)
+        if ch in "()\\":
+            out.append("\\" + ch)
+        elif 32 <= byte < 127:
+            out.append(ch)
+        else:
+            out.append("\\%03o" % byte)
+    out.append(")")
+    return "".join(out)
+
+
+def permit_dir(path):
+    """--permit-file-* 에 넘길 폴더 경로 (하위 전체 허용을 위해 구분자로 끝남)"""
+    path = os.path.abspath(path)
+    return path if path.endswith(os.sep) else path + os.sep
+
+
+class GhostscriptInterpreter:
+    """표준 입력으로 작업을 받는 상주 gs 프로세스 (pdfwrite 전용)
+
+    작업마다 OutputFile을 바꾸고 save/restore로 인터프리터 상태를 되돌린다.
+    read_dirs/write_dirs 밖의 파일은 -dSAFER 때문에 열 수 없다.
+    """
+
+    def __init__(self, gs_command, device_args, read_dirs, write_dirs, max_jobs=DEFAULT_MAX_JOBS):
+        self.gs_command = gs_command
+        self.device_args = list(device_args)
+        self.read_dirs = sorted({permit_dir(d) for d in read_dirs})
+        self.write_dirs = sorted({permit_dir(d) for d in write_dirs})
+        self.max_jobs = max_jobs
+        self.jobs_done = 0
+        self.proc = None
+        self._lines = None
+        self._stderr = collections.deque(maxlen=50)
+        self._idle_dir = None
+
+    def start(self):
+        """gs 프로세스 시작"""
+        self._idle_dir = tempfile.mkdtemp(prefix="ps2pdf_gs_")
+        self._idle_pdf = os.path.join(self._idle_dir, "idle.pdf")
+        cmd = [
+            self.gs_command,
+            "-q",
+            "-dNOPAUSE",
+            "-dSAFER",
+            *self.device_args,
+            *[f"--permit-file-read={d}" for d in self.read_dirs],
+            *[f"--permit-file-write={d}" for d in self.write_dirs + [permit_dir(self._idle_dir)]],
+            f"-sOutputFile={self._idle_pdf}",
+            "-"
+        ]
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE, **process_group_kwargs())
+        self._lines = queue.Queue()
+        self._stderr.clear()
+        threading.Thread(target=self._pump, args=(self.proc.stdout, self._lines),
+                         daemon=True).start()
+        threading.Thread(target=self._pump, args=(self.proc.stderr, None),
+                         daemon=True).start()
+        self.jobs_done = 0
+
+    def _pump(self, stream, sink):
+        """gs 출력 읽기 (표준 출력은 큐로, 표준 오류는 최근 줄만 보관)"""
+        for raw in iter(stream.readline, b""):
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            if sink is not None:
+                sink.put(line)
+            else:
+                self._stderr.append(line)
+        if sink is not None:
+            sink.put(None)  # 프로세스 종료 표시
+
+    @property
+    def alive(self):
+        return self.proc is not None and self.proc.poll() is None
+
+    def convert(self, in_file, out_pdf, timeout, on_page=None, cancel=None):
+        """in_file을 out_pdf로 변환 (실패 시 RuntimeError, 시간 초과 시 subprocess.TimeoutExpired)
+
+        on_page(N)은 페이지를 하나 끝낼 때마다 호출된다.
+        cancel(CancelToken)이 취소되면 프로세스가 종료되어 RuntimeError가 난다.
+        """
+        if not self.alive:
+            self.start()
+        if cancel is None:
+            return self._convert(in_file, out_pdf, timeout, on_page)
+        proc = self.proc
+        cancel.register(proc)
+        try:
+            return self._convert(in_file, out_pdf, timeout, on_page)
+        finally:
+            cancel.unregister(proc)
+
+    def _convert(self, in_file, out_pdf, timeout, on_page):
+
+        token = uuid.uuid4().hex
+        program = "\n".join([
+            f"<< /OutputFile {ps_string(os.path.abspath(out_pdf))} /EndPage {END_PAGE_PROC} >> setpagedevice",
+            "/ps2pdf_state save def",
+            f"{{ {ps_string(os.path.abspath(in_file))} run }} stopped",
+            f"{{ (PS2PDF_ERROR {token} ) print $error /errorname get == flush }} if",
+            "clear cleardictstack",
+            "ps2pdf_state restore",
+            # OutputFile을 바꾸면 이전 PDF가 닫히면서 완성됨
+            f"<< /OutputFile {ps_string(self._idle_pdf)} >> setpagedevice",
+            f"(PS2PDF_DONE {token}) = flush",
+            ""
+        ])
+        try:
+            self.proc.stdin.write(program.encode("ascii"))
+            self.proc.stdin.flush()
+        except OSError:
+            self.close()
+            raise RuntimeError("Ghostscript 인터프리터가 종료되었습니다.")
+
+        error = None
+        pages = 0
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                # 걸려 있는 gs는 표준 입력을 닫아도 끝나지 않으므로 기다리지 않고 바로 종료
+                self.kill()
+                raise subprocess.TimeoutExpired(self.gs_command, timeout)
+            if line is None:
+                detail = "\n".join(self._stderr) or "Ghostscript 인터프리터가 종료되었습니다."
+                self.close()
+                raise RuntimeError(detail)
+            if line == PAGE_MARKER:
+                pages += 1
+                if on_page:
+                    on_page(pages)
+            elif line.startswith(f"PS2PDF_ERROR {token}"):
+                error = line.split(" ", 2)[-1]
+            elif line == f"PS2PDF_DONE {token}":
+                break
+
+        self.jobs_done += 1
+        if error is not None:
+            # 오류 후에는 인터프리터 상태를 믿을 수 없으므로 다시 띄움
+            self.close()
+            raise RuntimeError(f"Ghostscript 오류: {error}")
+        if self.jobs_done >= self.max_jobs:
+            self.close()
+
+    def kill(self):
+        """gs 프로세스를 (자식 프로세스까지) 바로 강제 종료"""
+        if self.proc is not None:
+            kill_process_tree(self.proc)
+            self.proc.wait()
+            try:
+                self.proc.stdin.close()
+            except OSError:
+                pass
+        self.close()
+
+    def close(self):
+        """gs 프로세스 종료"""
+        if self.proc is not None:
+            try:
+                if self.proc.poll() is None:
+                    self.proc.stdin.close()
+                    try:
+                        self.proc.wait(timeout=10)
+                    except subprocess.TimeoutExpired:
+                        kill_process_tree(self.proc)
+                        self.proc.wait()
+            except OSError:
+                kill_process_tree(self.proc)
+            self.proc = None
+        if self._idle_dir:
+            for name in os.listdir(self._idle_dir):
+                try:
+                    os.remove(os.path.join(self._idle_dir, name))
+                except OSError:
+                    pass
+            try:
+                os.rmdir(self._idle_dir)
+            except OSError:
+                pass
+            self._idle_dir = None
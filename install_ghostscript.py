@@ -8,28 +8,24 @@ Windows에서 Ghostscript 다운로드 및 설치 안내
 import os
 import sys
 import webbrowser
-import subprocess
 import urllib.request
 import tempfile
 from pathlib import Path
 
+from gs_discovery import discover
+
 def check_ghostscript():
     """Ghostscript 설치 확인"""
     print("Ghostscript 설치 상태 확인 중...")
     
-    gs_commands = ['gswin64c', 'gswin32c', 'gs']
-    
-    for cmd in gs_commands:
-        try:
-            result = subprocess.run([cmd, '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                version = result.stdout.strip().split('\n')[0]
-                print(f"✓ Ghostscript 발견: {cmd}")
-                print(f"✓ 버전: {version}")
-                return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            continue
+    # 설치 직후일 수 있으므로 캐시를 무시하고 다시 확인 (결과는 변환기와 공유하는 캐시에 저장)
+    info = discover(refresh=True)
+    if info is not None:
+        print(f"✓ Ghostscript 발견: {info.command}")
+        print(f"✓ 버전: {info.version}")
+        if info.library:
+            print(f"✓ 공유 라이브러리: {info.library}")
+        return True
     
     print("✗ Ghostscript가 설치되지 않았거나 PATH에 없습니다.")
     return False
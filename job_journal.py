@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+작업 기록 (SQLite)
+작업마다 입력 목록, 변환 옵션, 상태와 파일별 결과(출력 경로, 출력 내용 해시)를 기록해 두고,
+프로그램이 중간에 종료되거나 컴퓨터가 재시작된 뒤에는 끝나지 않은 파일만 이어서 변환함
+(이미 변환된 출력은 해시로 확인하고, 병합 PDF는 다시 변환하지 않고 기존 출력으로 다시 만듦)
+
+사용 예:
+    python -m job_journal            # 끝나지 않은 작업 목록
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, fields
+
+from conversion_cache import file_digest, user_cache_dir
+
+# 스키마가 바뀌면 올림 (user_version)
+SCHEMA_VERSION = 1
+
+# 끝난 작업은 최근 것만 남김
+KEEP_FINISHED_JOBS = 100
+
+# 작업 상태: running(진행 중 또는 비정상 종료), done, failed, cancelled, abandoned(이어서 하지 않기로 함)
+RESUMABLE_STATES = ("running", "failed", "cancelled")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    params TEXT NOT NULL,
+    state TEXT NOT NULL,
+    merged_path TEXT,
+    merged_sha256 TEXT
+);
+CREATE TABLE IF NOT EXISTS files (
+    job_id TEXT NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    input_path TEXT NOT NULL,
+    input_size INTEGER,
+    input_mtime REAL,
+    state TEXT NOT NULL,
+    output_path TEXT,
+    output_size INTEGER,
+    output_sha256 TEXT,
+    message TEXT,
+    PRIMARY KEY (job_id, idx)
+);
+"""
+
+
+@dataclass
+class JournalEntry:
+    """끝나지 않은 작업 요약"""
+    job_id: str
+    created: float
+    state: str
+    total: int
+    done: int
+    output_dir: str
+
+    def summary(self):
+        created = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.created))
+        return f"{self.job_id} ({created}, {self.state}): {self.done}/{self.total} 파일 완료 → {self.output_dir}"
+
+
+def default_journal_path():
+    """기본 작업 기록 파일 경로"""
+    return os.path.join(user_cache_dir(), "journal.sqlite")
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+        return st.st_size, st.st_mtime
+    except OSError:
+        return None, None
+
+
+class JobJournal:
+    """작업/파일 결과 기록 (여러 작업자 스레드에서 record를 불러도 됨)"""
+
+    def __init__(self, path=None):
+        self.path = path or default_journal_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # WAL에서 NORMAL이면 전원이 꺼져도 기록 파일이 깨지지 않음 (마지막 몇 건만 잃을 수 있음)
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._db.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS jobs;" + SCHEMA
+                                   + f"PRAGMA user_version={SCHEMA_VERSION};")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def start(self, job):
+        """새 작업 기록 후 작업 ID 반환"""
+        job_id = uuid.uuid4().hex[:12]
+        params = asdict(job)
+        # Ghostscript 경로는 이어서 할 때 다시 찾고, 경로는 다른 폴더에서 이어서 해도 되도록 절대 경로로
+        params.pop("gs_command", None)
+        params["inputs"] = [os.path.abspath(p) for p in job.inputs]
+        params["output_dir"] = os.path.abspath(job.output_dir)
+        now = time.time()
+        rows = []
+        for i, path in enumerate(params["inputs"]):
+            size, mtime = _stat(path)
+            rows.append((job_id, i, path, size, mtime, "pending"))
+        with self._lock:
+            self._db.execute("BEGIN")
+            self._db.execute("INSERT INTO jobs (id, created, updated, params, state) VALUES (?, ?, ?, ?, ?)",
+                             (job_id, now, now, json.dumps(params, ensure_ascii=False), "running"))
+            self._db.executemany("INSERT INTO files (job_id, idx, input_path, input_size, input_mtime, state) "
+                                 "VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._db.execute("COMMIT")
+        self._prune()
+        return job_id
+
+    def reopen(self, job_id):
+        """이어서 변환할 작업을 다시 진행 중으로 표시"""
+        self._execute("UPDATE jobs SET state = 'running', updated = ? WHERE id = ?", (time.time(), job_id))
+
+    def record(self, job_id, index, result, digest=None):
+        """파일 하나의 결과 기록 (성공이면 출력 해시도 저장)"""
+        size = sha = None
+        if result.ok and result.output_path:
+            size, _ = _stat(result.output_path)
+            if digest is None and size is not None:
+                try:
+                    digest = file_digest(result.output_path)
+                except OSError:
+                    digest = None
+            sha = digest
+        self._execute("UPDATE files SET state = ?, output_path = ?, output_size = ?, output_sha256 = ?, "
+                      "message = ? WHERE job_id = ? AND idx = ?",
+                      (result.status, result.output_path, size, sha, result.message, job_id, index))
+
+    def finish(self, job_id, job_result):
+        """작업 상태와 병합 PDF 기록"""
+        if job_result.cancelled:
+            state = "cancelled"
+        elif job_result.failed or job_result.merge_error:
+            # 병합만 실패했으면 이어서 할 때 변환된 출력으로 병합만 다시 함
+            state = "failed"
+        else:
+            state = "done"
+        merged_sha = None
+        if job_result.merged_path and os.path.exists(job_result.merged_path):
+            merged_sha = file_digest(job_result.merged_path)
+        self._execute("UPDATE jobs SET state = ?, updated = ?, merged_path = ?, merged_sha256 = ? WHERE id = ?",
+                      (state, time.time(), job_result.merged_path, merged_sha, job_id))
+
+    def abandon(self, job_id):
+        """이어서 하지 않을 작업으로 표시"""
+        self._execute("UPDATE jobs SET state = 'abandoned', updated = ? WHERE id = ?", (time.time(), job_id))
+
+    def unfinished(self):
+        """이어서 변환할 수 있는 작업 목록 (최근 것부터)"""
+        placeholders = ",".join("?" * len(RESUMABLE_STATES))
+        rows = self._execute(
+            f"SELECT j.id, j.created, j.state, j.params, COUNT(f.idx), "
+            f"SUM(CASE WHEN f.state = 'ok' THEN 1 ELSE 0 END) "
+            f"FROM jobs j JOIN files f ON f.job_id = j.id "
+            f"WHERE j.state IN ({placeholders}) GROUP BY j.id ORDER BY j.created DESC", RESUMABLE_STATES)
+        return [JournalEntry(job_id, created, state, total, done or 0, json.loads(params).get("output_dir", ""))
+                for job_id, created, state, params, total, done in rows]
+
+    def load_job(self, job_id):
+        """기록된 옵션으로 ConversionJob 다시 만들기 (없으면 KeyError)"""
+        from ps2pdf_engine import ConversionJob
+        rows = self._execute("SELECT params FROM jobs WHERE id = ?", (job_id,))
+        if not rows:
+            raise KeyError(job_id)
+        params = json.loads(rows[0][0])
+        known = {f.name for f in fields(ConversionJob)}
+        return ConversionJob(**{k: v for k, v in params.items() if k in known})
+
+    def verified_outputs(self, job_id):
+        """이미 변환되어 그대로 쓸 수 있는 파일 {순번: 출력 경로}
+
+        입력 크기/수정 시각이 기록과 같고, 출력이 남아 있으며 크기와 내용 해시가 기록과 같은 것만.
+        """
+        rows = self._execute("SELECT idx, input_path, input_size, input_mtime, output_path, output_size, "
+                             "output_sha256 FROM files WHERE job_id = ? AND state = 'ok'", (job_id,))
+        verified = {}
+        digests = {}  # 바로 병합한 작업은 여러 파일이 같은 출력을 가리킴
+        for idx, in_path, in_size, in_mtime, out_path, out_size, sha in rows:
+            if not out_path or not sha or _stat(in_path) != (in_size, in_mtime):
+                continue
+            if _stat(out_path)[0] != out_size:
+                continue
+            if out_path not in digests:
+                try:
+                    digests[out_path] = file_digest(out_path)
+                except OSError:
+                    digests[out_path] = None
+            if digests[out_path] == sha:
+                verified[idx] = out_path
+        return verified
+
+    def _prune(self):
+        """오래된 끝난 작업 삭제"""
+        self._execute("DELETE FROM jobs WHERE state IN ('done', 'abandoned') AND id NOT IN "
+                      "(SELECT id FROM jobs WHERE state IN ('done', 'abandoned') "
+                      "ORDER BY updated DESC LIMIT ?)", (KEEP_FINISHED_JOBS,))
+
+
+def main(argv=None):
+    """명령줄: 끝나지 않은 작업 목록 출력"""
+    journal = JobJournal()
+    entries = journal.unfinished()
+    if not entries:
+        print("이어서 변환할 작업이 없습니다.")
+    for entry in entries:
+        print(entry.summary())
+    journal.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 PDF 병합
+PdfMerger처럼 모든 문서를 메모리에 모아 두지 않고, 입력 PDF를 하나씩 열어
+페이지와 객체를 바로 출력 파일에 쓰고 닫음 (메모리 사용량이 입력 수와 무관)
+출력은 같은 폴더의 임시 파일에 쓰고 끝나면 교체하므로, 실패해도 덜 쓰인 PDF가 남지 않고
+기존 출력(입력으로 함께 들어온 이전 병합 PDF 포함)도 병합이 끝날 때까지 그대로 남음
+"""
+
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from PyPDF2 import PdfReader
+from PyPDF2.generic import (ArrayObject, DecodedStreamObject, DictionaryObject,
+                            EncodedStreamObject, IndirectObject, NameObject,
+                            NullObject, NumberObject, StreamObject)
+
+# 다른 문서의 페이지 트리/카탈로그를 끌고 오지 않도록 복사에서 제외할 객체 유형
+SKIP_TYPES = ("/Pages", "/Catalog")
+
+
+@dataclass
+class MergeStats:
+    """병합 결과 통계"""
+    documents: int = 0
+    pages: int = 0
+    bytes_written: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def pages_per_sec(self):
+        return self.pages / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mb_per_sec(self):
+        return self.bytes_written / (1024 * 1024) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self):
+        """로그용 한 줄 요약"""
+        return (f"{self.documents}개 문서, {self.pages}페이지, "
+                f"{self.bytes_written / (1024 * 1024):.1f} MB, {self.elapsed:.1f}초 "
+                f"({self.pages_per_sec:.1f} 페이지/s, {self.mb_per_sec:.1f} MB/s)")
+
+
+class StreamingPdfMerger:
+    """입력 PDF의 페이지를 순서대로 출력 파일에 바로 써 나가는 병합기
+
+    close()에서 임시 파일을 out_path로 교체하고, 예외로 빠져나가면 임시 파일을 지운다.
+
+    사용법:
+        with StreamingPdfMerger(out_path) as merger:
+            for pdf in pdf_files:
+                merger.append(pdf)
+    """
+
+    def __init__(self, out_path):
+        self.out_path = out_path
+        self.stats = MergeStats()
+        self._started = time.perf_counter()
+        self._tmp_path = f"{out_path}.{os.getpid()}.tmp"
+        self._fh = open(self._tmp_path, "wb")
+        self._fh.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        self._offsets = [None]   # 객체 번호 → 파일 내 위치 (0번은 사용 안 함)
+        self._kids = []          # 출력 페이지 객체 번호
+        self._pages_num = self._alloc()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            try:
+                self.close()
+            except BaseException:
+                self.abort()
+                raise
+        else:
+            self.abort()
+
+    def _alloc(self):
+        self._offsets.append(None)
+        return len(self._offsets) - 1
+
+    def _write_object(self, num, obj):
+        self._offsets[num] = self._fh.tell()
+        self._fh.write(f"{num} 0 obj\n".encode("ascii"))
+        obj.write_to_stream(self._fh, None)
+        self._fh.write(b"\nendobj\n")
+
+    def append(self, pdf_path):
+        """PDF 하나의 모든 페이지를 출력 끝에 추가"""
+        with open(pdf_path, "rb") as src:
+            reader = PdfReader(src)
+            if reader.is_encrypted:
+                raise ValueError(f"암호화된 PDF는 병합할 수 없습니다: {pdf_path}")
+
+            # 입력 객체 (번호, 세대) → 출력 객체 번호. 문서 하나가 끝나면 버림
+            mapping = {}
+            pending = deque()
+
+            def remap(obj):
+                if isinstance(obj, IndirectObject):
+                    key = (obj.idnum, obj.generation)
+                    if key not in mapping:
+                        mapping[key] = self._alloc()
+                        pending.append(obj)
+                    return IndirectObject(mapping[key], 0, None)
+                if isinstance(obj, StreamObject):
+                    copy = EncodedStreamObject() if isinstance(obj, EncodedStreamObject) else DecodedStreamObject()
+                    copy._data = obj._data
+                    for k, v in obj.items():
+                        copy[NameObject(k)] = remap(v)
+                    return copy
+                if isinstance(obj, DictionaryObject):
+                    copy = DictionaryObject()
+                    for k, v in obj.items():
+                        copy[NameObject(k)] = remap(v)
+                    return copy
+                if isinstance(obj, ArrayObject):
+                    return ArrayObject(remap(v) for v in obj)
+                return obj
+
+            def drain():
+                while pending:
+                    ref = pending.popleft()
+                    num = mapping[(ref.idnum, ref.generation)]
+                    obj = ref.get_object()
+                    if isinstance(obj, DictionaryObject) and obj.get("/Type") in SKIP_TYPES:
+                        obj = NullObject()
+                    self._write_object(num, remap(obj))
+
+            pages = reader.pages
+            # 페이지 끼리 참조(링크 등)할 수 있으므로 페이지 번호를 먼저 배정
+            page_nums = []
+            for page in pages:
+                num = self._alloc()
+                ref = page.indirect_reference
+                if ref is not None:
+                    mapping[(ref.idnum, ref.generation)] = num
+                page_nums.append(num)
+
+            for page, num in zip(pages, page_nums):
+                copy = DictionaryObject()
+                for k, v in page.items():
+                    if k == "/Parent":
+                        continue
+                    copy[NameObject(k)] = remap(v)
+                copy[NameObject("/Parent")] = IndirectObject(self._pages_num, 0, None)
+                self._write_object(num, copy)
+                drain()
+                self._kids.append(num)
+                self.stats.pages += 1
+
+        self.stats.documents += 1
+
+    def close(self):
+        """페이지 트리, 카탈로그, 상호 참조 표를 쓰고 파일을 닫음"""
+        if self._fh.closed:
+            return self.stats
+        pages = DictionaryObject({
+            NameObject("/Type"): NameObject("/Pages"),
+            NameObject("/Kids"): ArrayObject(IndirectObject(n, 0, None) for n in self._kids),
+            NameObject("/Count"): NumberObject(len(self._kids)),
+        })
+        self._write_object(self._pages_num, pages)
+        catalog_num = self._alloc()
+        self._write_object(catalog_num, DictionaryObject({
+            NameObject("/Type"): NameObject("/Catalog"),
+            NameObject("/Pages"): IndirectObject(self._pages_num, 0, None),
+        }))
+        # 배정만 되고 쓰이지 않은 번호는 null 객체로 채움
+        for num, offset in enumerate(self._offsets):
+            if num and offset is None:
+                self._write_object(num, NullObject())
+
+        xref_offset = self._fh.tell()
+        count = len(self._offsets)
+        self._fh.write(f"xref\n0 {count}\n".encode("ascii"))
+        self._fh.write(b"0000000000 65535 f \n")
+        for offset in self._offsets[1:]:
+            self._fh.write(f"{offset:010d} 00000 n \n".encode("ascii"))
+        self._fh.write(f"trailer\n<< /Size {count} /Root {catalog_num} 0 R >>\n"
+                       f"startxref\n{xref_offset}\n%%EOF\n".encode("ascii"))
+        self.stats.bytes_written = self._fh.tell()
+        self._fh.close()
+        os.replace(self._tmp_path, self.out_path)
+        self.stats.elapsed = time.perf_counter() - self._started
+        return self.stats
+
+
+    def abort(self):
+        """쓰던 임시 파일을 지우고 끝냄 (out_path는 건드리지 않음)"""
+        if not self._fh.closed:
+            self._fh.close()
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+
+def merge_pdfs(pdf_files, merged_path):
+    """여러 PDF를 순서대로 하나로 스트리밍 병합하고 MergeStats 반환"""
+    with StreamingPdfMerger(merged_path) as merger:
+        for pdf in pdf_files:
+            merger.append(pdf)
+    return merger.stats
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+병합 PDF 최적화
+입력 PDF마다 따로 들어 있던 같은 글꼴/이미지/리소스를 하나로 합치고,
+스트림이 아닌 객체를 객체 스트림(/ObjStm)에 모아 압축해 다시 씀
+
+같은 객체 판별: 객체 내용(스트림은 원본 데이터 해시)과 참조하는 객체들의 판별 결과를 함께 해시하는
+과정을 더 나뉘지 않을 때까지 반복 (순환 참조가 있어도 동작). 페이지/페이지 트리/카탈로그는 합치지 않음
+
+사용 예:
+    python -m pdf_optimize merged_output.pdf
+"""
+
+import hashlib
+import io
+import os
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+
+from PyPDF2 import PdfReader
+from PyPDF2.generic import (ArrayObject, DecodedStreamObject, DictionaryObject,
+                            EncodedStreamObject, IndirectObject, NameObject,
+                            NullObject, NumberObject, StreamObject)
+
+# 합치지 않을 객체 유형 (페이지는 페이지 트리에 한 번만 나와야 함)
+UNIQUE_TYPES = ("/Page", "/Pages", "/Catalog")
+
+# 객체 스트림 하나에 넣는 최대 객체 수
+OBJSTM_SIZE = 100
+
+
+@dataclass
+class OptimizeStats:
+    """최적화 결과 통계"""
+    bytes_before: int = 0
+    bytes_after: int = 0
+    objects_before: int = 0
+    objects_after: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def bytes_saved(self):
+        return self.bytes_before - self.bytes_after
+
+    @property
+    def duplicates(self):
+        return self.objects_before - self.objects_after
+
+    def summary(self):
+        """로그용 한 줄 요약"""
+        ratio = self.bytes_saved / self.bytes_before * 100 if self.bytes_before else 0.0
+        return (f"중복 객체 {self.duplicates}개 제거, "
+                f"{self.bytes_before / (1024 * 1024):.1f} MB → {self.bytes_after / (1024 * 1024):.1f} MB "
+                f"({self.bytes_saved / (1024 * 1024):.1f} MB, {ratio:.0f}% 절약), {self.elapsed:.1f}초")
+
+
+def _key(ref):
+    return ref.idnum, ref.generation
+
+
+def _shape(obj, refs, out):
+    """참조를 자리표시로 바꾼 정규화된 객체 내용 (사전은 키 순서와 무관)"""
+    if isinstance(obj, IndirectObject):
+        refs.append(_key(obj))
+        out.write(b"\x00R ")
+    elif isinstance(obj, DictionaryObject):
+        out.write(b"<<")
+        for k in sorted(obj.keys()):
+            if k == "/Length" and isinstance(obj, StreamObject):
+                continue
+            out.write(k.encode("utf-8", "surrogateescape") + b" ")
+            _shape(obj.raw_get(k), refs, out)
+        out.write(b">>")
+        if isinstance(obj, StreamObject):
+            out.write(b"stream" + hashlib.sha256(obj._data).digest())
+    elif isinstance(obj, ArrayObject):
+        out.write(b"[")
+        for v in obj:
+            _shape(v, refs, out)
+        out.write(b"]")
+    else:
+        obj.write_to_stream(out, None)
+        out.write(b" ")
+
+
+def _is_unique(obj):
+    return isinstance(obj, DictionaryObject) and obj.get("/Type") in UNIQUE_TYPES
+
+
+def _collect(reader):
+    """루트에서 닿는 객체들의 {키: (객체, 참조 목록, 내용 해시)} (루트부터 찾은 순서)"""
+    nodes = {}
+    root = reader.trailer.raw_get("/Root")
+    stack = [_key(root)]
+    order = []
+    while stack:
+        key = stack.pop()
+        if key in nodes:
+            continue
+        obj = reader.get_object(IndirectObject(key[0], key[1], reader))
+        if obj is None:
+            obj = NullObject()
+        refs = []
+        out = io.BytesIO()
+        _shape(obj, refs, out)
+        digest = hashlib.sha256(out.getvalue()).digest()
+        if _is_unique(obj):
+            digest = hashlib.sha256(digest + repr(key).encode("ascii")).digest()
+        nodes[key] = (obj, refs, digest)
+        order.append(key)
+        # 참조 순서대로 방문하도록 거꾸로 쌓음
+        stack.extend(reversed([r for r in refs if r not in nodes]))
+    return nodes, order
+
+
+def _classify(nodes):
+    """키 → 같은 객체 묶음 ID (내용과 참조 대상의 묶음이 모두 같으면 같은 묶음)"""
+    classes = {key: digest for key, (_, _, digest) in nodes.items()}
+    count = len(set(classes.values()))
+    while True:
+        refined = {}
+        for key, (_, refs, _) in nodes.items():
+            h = hashlib.sha256(classes[key])
+            for r in refs:
+                h.update(classes.get(r, b"null"))
+            refined[key] = h.digest()
+        new_count = len(set(refined.values()))
+        classes = refined
+        if new_count == count:
+            return classes
+        count = new_count
+
+
+class _ObjectStreamWriter:
+    """객체 스트림과 상호 참조 스트림으로 PDF를 씀"""
+
+    def __init__(self, fh, first_free):
+        self.fh = fh
+        self.entries = {}        # 객체 번호 → (1, 위치, 0) 또는 (2, 객체 스트림 번호, 순번)
+        self.next_num = first_free
+        self._pending = []       # 객체 스트림에 넣을 (번호, 직렬화된 객체)
+        fh.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+
+    def _alloc(self):
+        num = self.next_num
+        self.next_num += 1
+        return num
+
+    def write_direct(self, num, obj):
+        self.entries[num] = (1, self.fh.tell(), 0)
+        self.fh.write(f"{num} 0 obj\n".encode("ascii"))
+        obj.write_to_stream(self.fh, None)
+        self.fh.write(b"\nendobj\n")
+
+    def add(self, num, obj):
+        if isinstance(obj, StreamObject):
+            self.write_direct(num, obj)
+            return
+        out = io.BytesIO()
+        obj.write_to_stream(out, None)
+        self._pending.append((num, out.getvalue()))
+        if len(self._pending) >= OBJSTM_SIZE:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        stm_num = self._alloc()
+        header = []
+        body = io.BytesIO()
+        for i, (num, data) in enumerate(self._pending):
+            header.append(f"{num} {body.tell()}")
+            body.write(data + b"\n")
+            self.entries[num] = (2, stm_num, i)
+        header = (" ".join(header) + "\n").encode("ascii")
+        stm = EncodedStreamObject()
+        stm._data = zlib.compress(header + body.getvalue())
+        stm.update({
+            NameObject("/Type"): NameObject("/ObjStm"),
+            NameObject("/N"): NumberObject(len(self._pending)),
+            NameObject("/First"): NumberObject(len(header)),
+            NameObject("/Filter"): NameObject("/FlateDecode"),
+        })
+        self._pending = []
+        self.write_direct(stm_num, stm)
+
+    def close(self, trailer):
+        """남은 객체를 쓰고 상호 참조 스트림으로 마무리 (trailer: /Root 등)"""
+        self.flush()
+        xref_num = self._alloc()
+        xref_offset = self.fh.tell()
+        self.entries[xref_num] = (1, xref_offset, 0)
+        size = self.next_num
+        width = max(4, (max(v[1] for v in self.entries.values()).bit_length() + 7) // 8)
+        rows = io.BytesIO()
+        rows.write(b"\x00" + b"\x00" * width + b"\xff\xff")
+        for num in range(1, size):
+            kind, field2, field3 = self.entries.get(num, (0, 0, 0))
+            rows.write(bytes([kind]) + field2.to_bytes(width, "big") + field3.to_bytes(2, "big"))
+        xref = EncodedStreamObject()
+        xref._data = zlib.compress(rows.getvalue())
+        xref.update(trailer)
+        xref.update({
+            NameObject("/Type"): NameObject("/XRef"),
+            NameObject("/Size"): NumberObject(size),
+            NameObject("/W"): ArrayObject([NumberObject(1), NumberObject(width), NumberObject(2)]),
+            NameObject("/Filter"): NameObject("/FlateDecode"),
+        })
+        self.fh.write(f"{xref_num} 0 obj\n".encode("ascii"))
+        xref.write_to_stream(self.fh, None)
+        self.fh.write(f"\nendobj\nstartxref\n{xref_offset}\n%%EOF\n".encode("ascii"))
+
+
+def optimize_pdf(in_path, out_path=None):
+    """같은 객체를 합치고 객체 스트림으로 압축해 다시 쓰고 OptimizeStats 반환
+
+    out_path를 주지 않으면 in_path를 바꿔 쓴다 (결과가 더 크면 원본을 그대로 둠).
+    """
+    started = time.perf_counter()
+    target = out_path or in_path
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    stats = OptimizeStats(bytes_before=os.path.getsize(in_path))
+    with open(in_path, "rb") as src:
+        reader = PdfReader(src)
+        if reader.is_encrypted:
+            raise ValueError(f"암호화된 PDF는 최적화할 수 없습니다: {in_path}")
+        nodes, order = _collect(reader)
+        classes = _classify(nodes)
+
+        # 묶음마다 처음 나온 객체를 남기고 새 번호를 차례로 배정
+        numbers = {}
+        keep = []
+        for key in order:
+            cls = classes[key]
+            if cls not in numbers:
+                numbers[cls] = len(keep) + 1
+                keep.append(key)
+        stats.objects_before = len(order)
+        stats.objects_after = len(keep)
+
+        def remap(obj):
+            if isinstance(obj, IndirectObject):
+                cls = classes.get(_key(obj))
+                return IndirectObject(numbers[cls], 0, None) if cls is not None else NullObject()
+            if isinstance(obj, StreamObject):
+                copy = EncodedStreamObject() if isinstance(obj, EncodedStreamObject) else DecodedStreamObject()
+                copy._data = obj._data
+                for k, v in obj.items():
+                    if k != "/Length":
+                        copy[NameObject(k)] = remap(v)
+                return copy
+            if isinstance(obj, DictionaryObject):
+                copy = DictionaryObject()
+                for k, v in obj.items():
+                    copy[NameObject(k)] = remap(v)
+                return copy
+            if isinstance(obj, ArrayObject):
+                return ArrayObject(remap(v) for v in obj)
+            return obj
+
+        trailer = DictionaryObject({NameObject("/Root"): remap(reader.trailer.raw_get("/Root"))})
+        info = reader.trailer.raw_get("/Info") if "/Info" in reader.trailer else None
+        try:
+            with open(tmp_path, "wb") as fh:
+                writer = _ObjectStreamWriter(fh, len(keep) + 1)
+                for key in keep:
+                    writer.add(numbers[classes[key]], remap(nodes[key][0]))
+                if isinstance(info, IndirectObject):
+                    # 문서 정보는 루트에서 닿지 않으므로 따로 씀
+                    info_num = writer._alloc()
+                    writer.add(info_num, remap(info.get_object()))
+                    trailer[NameObject("/Info")] = IndirectObject(info_num, 0, None)
+                writer.close(trailer)
+                stats.bytes_after = fh.tell()
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    if stats.bytes_after < stats.bytes_before or out_path:
+        os.replace(tmp_path, target)
+    else:
+        os.remove(tmp_path)
+        stats.bytes_after = stats.bytes_before
+    stats.elapsed = time.perf_counter() - started
+    return stats
+
+
+def main(argv=None):
+    """명령줄: PDF 파일을 제자리에서 최적화하고 결과 출력"""
+    for path in (argv if argv is not None else sys.argv[1:]):
+        print(f"{path}: {optimize_pdf(path).summary()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+성능 프로필
+컴퓨터(코어 수, 메모리)를 확인하고 함께 배포되는 `ps` 샘플을 한 번 변환해 본 결과로
+동시 작업 수와 Ghostscript 메모리/스레드 인자를 정해 사용자 캐시 폴더에 저장함
+
+모드:
+    throughput   최대 처리량 - 파일이 많을 때. 코어 수만큼 Ghostscript를 돌리고 메모리가 허락하는 만큼 사용
+    low_memory   저메모리    - 다른 작업과 함께 돌릴 때. 동시 작업을 줄이고 밴드 렌더링 + 메모리 상한 사용
+    low_latency  저지연      - 파일 하나를 빨리 받아야 할 때. 페이지 분할 + 상주 Ghostscript, 렌더링 스레드 사용
+
+사용 예:
+    python -m perf_profile               # 모든 모드 측정/저장 후 출력
+    python -m perf_profile low_memory    # 한 모드만
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+from conversion_cache import user_cache_dir
+
+MODES = {
+    "throughput": "최대 처리량",
+    "low_memory": "저메모리",
+    "low_latency": "저지연",
+}
+DEFAULT_MODE = "throughput"
+
+# 저장 형식이 바뀌면 올려서 예전 프로필을 무효화
+PROFILE_VERSION = 1
+
+# 측정할 수 없을 때 쓰는 Ghostscript 프로세스 하나의 메모리 사용량 추정값
+GS_MEMORY_ESTIMATE = 150 * 1024 * 1024
+
+# 모드별로 Ghostscript 프로세스들이 쓸 수 있는 전체 메모리 비율
+MEMORY_SHARE = {"throughput": 0.6, "low_memory": 0.25, "low_latency": 0.5}
+
+# 측정 변환 제한 시간 (초)
+CALIBRATION_TIMEOUT = 120
+
+_lock = threading.Lock()
+
+
+@dataclass
+class MachineInfo:
+    """컴퓨터 사양"""
+    cores: int
+    ram_bytes: int  # 알 수 없으면 0
+
+
+@dataclass
+class PerfProfile:
+    """모드별 변환 설정"""
+    mode: str
+    workers: int
+    split_pages: bool
+    persistent: bool
+    gs_args: list = field(default_factory=list)
+    cores: int = 0
+    ram_bytes: int = 0
+    gs_version: str = ""
+    sec_per_page: float = None   # 측정 변환의 페이지당 시간 (측정하지 않았으면 None)
+    gs_peak_bytes: int = None    # 측정 변환의 Ghostscript 최대 메모리 (측정 불가면 None)
+    created: float = 0.0
+
+    @property
+    def label(self):
+        return MODES.get(self.mode, self.mode)
+
+    def summary(self):
+        """로그용 한 줄 요약"""
+        measured = (f"측정 {self.sec_per_page * 1000:.0f}ms/페이지" if self.sec_per_page is not None
+                    else "측정 안 함")
+        if self.gs_peak_bytes:
+            measured += f", Ghostscript {self.gs_peak_bytes / (1024 * 1024):.0f} MB"
+        return (f"{self.label}: 동시 작업 {self.workers}개, "
+                f"페이지 분할 {'사용' if self.split_pages else '안 함'}, "
+                f"상주 Ghostscript {'사용' if self.persistent else '안 함'}, "
+                f"Ghostscript 인자 {' '.join(self.gs_args) or '없음'} ({measured})")
+
+
+def probe_machine():
+    """코어 수와 실제 메모리 크기"""
+    cores = os.cpu_count() or 1
+    ram = 0
+    if sys.platform.startswith("win"):
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            ram = status.ullTotalPhys
+    else:
+        try:
+            ram = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        except (ValueError, OSError, AttributeError):
+            ram = 0
+    return MachineInfo(cores, int(ram))
+
+
+def sample_path():
+    """함께 배포되는 `ps` 샘플 경로 (없으면 None)"""
+    candidates = [os.path.dirname(os.path.abspath(__file__))]
+    if getattr(sys, "frozen", False):
+        # PyInstaller는 압축 해제 폴더, MSI(cx_Freeze)는 실행 파일 폴더에 둠
+        candidates.insert(0, getattr(sys, "_MEIPASS", os.path.dirname(sys.executable)))
+        candidates.insert(1, os.path.dirname(sys.executable))
+    for directory in candidates:
+        path = os.path.join(directory, "ps")
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _children_peak_bytes():
+    """지금까지 기다린 자식 프로세스의 최대 RSS (측정 불가면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak * (1 if sys.platform == "darwin" else 1024)
+
+
+def calibrate(gs_command, sample=None):
+    """샘플을 Ghostscript로 한 번 변환해 (페이지당 초, 최대 메모리 바이트 또는 None) 반환
+
+    샘플이나 Ghostscript가 없거나 변환에 실패하면 (None, None).
+    """
+    from ps2pdf_engine import DEFAULT_QUALITY, build_gs_command, count_pages, run_gs
+    sample = sample or sample_path()
+    if not gs_command or sample is None:
+        return None, None
+    pages = count_pages(sample) or 1
+    before = _children_peak_bytes()
+    with tempfile.TemporaryDirectory(prefix="ps2pdf_calib_") as tmp_dir:
+        cmd = build_gs_command(gs_command, sample, os.path.join(tmp_dir, "calib.pdf"), "300", DEFAULT_QUALITY)
+        started = time.perf_counter()
+        try:
+            run_gs(cmd, None, CALIBRATION_TIMEOUT)
+        except Exception:
+            return None, None
+        elapsed = time.perf_counter() - started
+    after = _children_peak_bytes()
+    # 자식 최대 RSS가 늘지 않았으면 이번 Ghostscript가 그보다 작았다는 것만 알 수 있음
+    peak = after if after is not None and after > (before or 0) else None
+    return elapsed / pages, peak
+
+
+def build_profile(mode, machine, gs_command=None, sec_per_page=None, gs_peak_bytes=None):
+    """사양과 측정값으로 모드별 설정 계산"""
+    from gs_interpreter import supports_resident
+    from ps2pdf_engine import gs_version
+    if mode not in MODES:
+        raise ValueError(f"알 수 없는 성능 프로필: {mode} (가능한 값: {', '.join(MODES)})")
+    cores = max(1, machine.cores)
+    per_gs = max(gs_peak_bytes or 0, GS_MEMORY_ESTIMATE)
+    # 메모리를 모르면 코어 수로만 제한
+    by_memory = int(machine.ram_bytes * MEMORY_SHARE[mode] // per_gs) if machine.ram_bytes else cores
+    version = gs_version(gs_command)
+    resident = supports_resident(version)
+    mb = 1024 * 1024
+
+    if mode == "throughput":
+        # 파일 단위 병렬로 코어를 채우므로 Ghostscript 안의 렌더링 스레드는 쓰지 않음
+        workers = max(1, min(cores, by_memory))
+        band = 32 * mb if machine.ram_bytes >= 8 * 1024 * mb else 16 * mb
+        gs_args = ["-dNumRenderingThreads=1", f"-dBufferSpace={band}", f"-dMaxBitmap={band * 4}"]
+        split_pages, persistent = True, resident
+    elif mode == "low_memory":
+        workers = max(1, min(max(1, cores // 4), by_memory))
+        # 작은 밴드로 나눠 렌더링하고, 한 프로세스의 메모리 상한을 둠 (-K, 킬로바이트)
+        limit_kb = max(512 * mb, 4 * per_gs) // 1024
+        gs_args = ["-dNumRenderingThreads=1", f"-dBufferSpace={4 * mb}", f"-dMaxBitmap={8 * mb}",
+                   f"-K{limit_kb}"]
+        split_pages, persistent = False, False
+    else:
+        # 파일 하나를 페이지 분할로 모든 코어에 나누고, 밴드 없이 한 번에 렌더링
+        workers = max(1, min(cores, by_memory))
+        threads = max(1, min(4, cores // 2))
+        gs_args = [f"-dNumRenderingThreads={threads}", f"-dBufferSpace={64 * mb}",
+                   f"-dMaxBitmap={512 * mb}"]
+        split_pages, persistent = True, resident
+
+    return PerfProfile(mode=mode, workers=workers, split_pages=split_pages, persistent=persistent,
+                       gs_args=gs_args, cores=machine.cores, ram_bytes=machine.ram_bytes,
+                       gs_version=version, sec_per_page=sec_per_page, gs_peak_bytes=gs_peak_bytes,
+                       created=time.time())
+
+
+def profile_path():
+    return os.path.join(user_cache_dir(), "perf_profile.json")
+
+
+def _read_saved():
+    try:
+        with open(profile_path(), "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != PROFILE_VERSION:
+        return {}
+    return data.get("profiles", {})
+
+
+def save_profile(profile):
+    """모드별 프로필 저장 (다른 모드는 유지)"""
+    with _lock:
+        profiles = _read_saved()
+        profiles[profile.mode] = asdict(profile)
+        path = profile_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump({"version": PROFILE_VERSION, "profiles": profiles}, fh, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+def load_profile(mode, gs_command=None):
+    """저장된 프로필 (사양이나 Ghostscript 버전이 바뀌었으면 None)"""
+    from ps2pdf_engine import gs_version
+    data = _read_saved().get(mode)
+    if not data:
+        return None
+    try:
+        profile = PerfProfile(**data)
+    except TypeError:
+        return None
+    machine = probe_machine()
+    if (profile.cores, profile.ram_bytes) != (machine.cores, machine.ram_bytes):
+        return None
+    if profile.gs_version != gs_version(gs_command):
+        return None
+    return profile
+
+
+def get_profile(mode, gs_command=None, recalibrate=False, log=None):
+    """저장된 프로필을 쓰고, 없거나 recalibrate면 샘플을 변환해 측정한 뒤 저장"""
+    log = log or (lambda message: None)
+    if not recalibrate:
+        profile = load_profile(mode, gs_command)
+        if profile is not None:
+            return profile
+    machine = probe_machine()
+    log(f"성능 프로필 측정 중: 코어 {machine.cores}개, 메모리 "
+        + (f"{machine.ram_bytes / (1024 ** 3):.1f} GB" if machine.ram_bytes else "알 수 없음"))
+    sec_per_page, peak = calibrate(gs_command)
+    if sec_per_page is None:
+        log("  샘플 변환을 할 수 없어 사양만으로 설정합니다.")
+    profile = build_profile(mode, machine, gs_command, sec_per_page, peak)
+    save_profile(profile)
+    return profile
+
+
+def main(argv=None):
+    """명령줄: 프로필 측정/저장 후 출력"""
+    from ps2pdf_engine import find_ghostscript
+    argv = argv if argv is not None else sys.argv[1:]
+    modes = argv or list(MODES)
+    for mode in modes:
+        if mode not in MODES:
+            print(f"알 수 없는 성능 프로필: {mode} (가능한 값: {', '.join(MODES)})", file=sys.stderr)
+            return 2
+    gs_command = find_ghostscript()
+    machine = probe_machine()
+    # 측정은 한 번만 하고 모든 모드에 사용
+    sec_per_page, peak = calibrate(gs_command)
+    for mode in modes:
+        profile = build_profile(mode, machine, gs_command, sec_per_page, peak)
+        save_profile(profile)
+        print(profile.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
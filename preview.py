@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+첫 페이지 미리 보기
+선택한 파일의 첫 페이지를 낮은 해상도 PNG로 렌더링 (PS/EPS/PDF는 Ghostscript png16m, SVG는 CairoSVG)
+결과는 입력 내용 해시를 키로 메모리 + 디스크 LRU 캐시에 저장
+
+렌더링은 백그라운드 스레드 하나에서 돌고, 새 요청이 오면 진행 중인 렌더링은 취소하고
+밀려 있던 요청은 버림 (목록을 빠르게 훑어도 마지막으로 고른 파일만 렌더링)
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+
+from cancellation import CancelToken, ConversionCancelled
+from conversion_cache import _temp_name, file_digest, user_cache_dir
+from formats import detect_format, open_stream
+from ps_dsc import load_index, write_page_range
+
+# 미리 보기 해상도 (A4가 약 300x420 픽셀)
+PREVIEW_DPI = 36
+
+# 미리 보기 1개 렌더링 제한 시간 (초)
+PREVIEW_TIMEOUT = 30
+
+# 메모리에 보관할 미리 보기 수와 디스크 캐시 용량 상한
+MEMORY_ITEMS = 256
+DISK_MAX_BYTES = 100 * 1024 * 1024
+
+# 키 형식이 바뀌면 올려서 예전 캐시를 무효화
+THUMBNAIL_FORMAT = 1
+
+
+class ThumbnailCache:
+    """미리 보기 PNG 캐시 (메모리 LRU + 디스크, 디스크는 용량 상한 초과 시 오래 안 쓴 항목부터 삭제)"""
+
+    def __init__(self, cache_dir=None, memory_items=MEMORY_ITEMS, max_bytes=DISK_MAX_BYTES):
+        self.cache_dir = cache_dir or os.path.join(user_cache_dir(), "thumbnails")
+        self.memory_items = memory_items
+        self.max_bytes = max_bytes
+        self._memory = OrderedDict()  # 키 → PNG bytes
+        self._digests = {}            # (절대 경로, 크기, 수정 시각) → 내용 해시
+        self._lock = threading.Lock()
+        self._total = None
+
+    def key(self, path, dpi=PREVIEW_DPI, cancel=None):
+        """입력 내용 해시와 해상도로 캐시 키 생성 (크기/수정 시각이 같으면 이전 해시 재사용)
+
+        큰 파일은 해시에도 시간이 걸리므로 cancel(CancelToken)이 취소되면 중간에 ConversionCancelled
+        """
+        abs_path = os.path.abspath(path)
+        st = os.stat(abs_path)
+        stamp = (abs_path, st.st_size, st.st_mtime)
+        with self._lock:
+            digest = self._digests.get(stamp)
+        if digest is None:
+            digest = file_digest(abs_path, cancel=cancel)
+            with self._lock:
+                if len(self._digests) >= self.memory_items * 4:
+                    self._digests.pop(next(iter(self._digests)))
+                self._digests[stamp] = digest
+        return hashlib.sha256(f"{THUMBNAIL_FORMAT}:{dpi}:{digest}".encode("ascii")).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.png")
+
+    def _remember(self, key, data):
+        # 잠금 상태에서 호출
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """캐시된 PNG bytes (없으면 None). 디스크에서 찾으면 메모리에도 올려 둠"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "rb") as fh:
+                data = fh.read()
+            # 최근 사용 시각 갱신 (LRU 기준)
+            os.utime(entry)
+        except OSError:
+            return None
+        with self._lock:
+            self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        with self._lock:
+            self._remember(key, data)
+        entry = self._entry_path(key)
+        tmp_path = _temp_name(entry)
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            with open(tmp_path, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_path, entry)
+        except OSError:
+            # 디스크에 못 써도 메모리에는 남아 있음
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._entries())
+            else:
+                self._total += len(data)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """(경로, 크기, 최근 사용 시각) 목록"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for sub in os.scandir(self.cache_dir):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".png"):
+                    st = entry.stat()
+                    entries.append((entry.path, st.st_size, st.st_mtime))
+        return entries
+
+    def _evict(self):
+        """용량 상한의 90%까지 오래 안 쓴 항목부터 삭제 (잠금 상태에서 호출)"""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+        self._total = total
+
+    def clear(self):
+        """메모리/디스크 캐시 전체 삭제"""
+        with self._lock:
+            self._memory.clear()
+            if os.path.isdir(self.cache_dir):
+                shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self._total = 0
+
+
+def render_thumbnail(path, gs_command, dpi=PREVIEW_DPI, timeout=PREVIEW_TIMEOUT, cancel=None):
+    """첫 페이지를 PNG bytes로 렌더링 (ValueError: 지원되지 않는 형식, RuntimeError: 렌더링 실패)"""
+    from ps2pdf_engine import run_gs
+    fmt = detect_format(path)
+    if fmt is None:
+        raise ValueError("지원되지 않는 형식")
+    if fmt.name == "svg":
+        from render_pool import shared_pool
+        return shared_pool().render("svg_png", path, None, fmt.compression, dpi, timeout, cancel)
+    if not gs_command:
+        raise RuntimeError("Ghostscript가 없어 미리 보기를 만들 수 없습니다.")
+
+    with tempfile.TemporaryDirectory(prefix="ps2pdf_preview_") as tmp_dir:
+        src = path
+        if fmt.name == "ps" and not fmt.compressed:
+            # DSC 규격이면 첫 페이지만 뽑아 나머지 페이지는 해석하지 않음
+            index = load_index(path)
+            if index is not None:
+                src = write_page_range(index, 0, 1, os.path.join(tmp_dir, "first.ps"))
+        out_png = os.path.join(tmp_dir, "page.png")
+        cmd = [
+            gs_command, "-dNOPAUSE", "-dBATCH", "-dSAFER", "-q",
+            "-sDEVICE=png16m", f"-r{dpi}", "-dFirstPage=1", "-dLastPage=1",
+            "-dTextAlphaBits=4", "-dGraphicsAlphaBits=4",
+            *(["-dEPSCrop"] if fmt.name == "eps" else []),
+            f"-sOutputFile={out_png}",
+            "-" if fmt.compressed else src,
+        ]
+        if fmt.compressed:
+            with open_stream(path, fmt.compression) as stream:
+                run_gs(cmd, None, timeout, cancel, stdin=stream)
+        else:
+            run_gs(cmd, None, timeout, cancel)
+        try:
+            with open(out_png, "rb") as fh:
+                return fh.read()
+        except OSError:
+            raise RuntimeError("Ghostscript가 페이지를 출력하지 않았습니다.")
+
+
+class PreviewRenderer:
+    """미리 보기 요청을 백그라운드 스레드 하나에서 처리
+
+    request(path, callback)를 부르면 callback(path, PNG bytes 또는 None, 오류 메시지)이
+    렌더링 스레드에서 호출된다 (GUI에서는 메인 스레드로 넘겨서 표시해야 함).
+    새 요청이 오면 진행 중인 렌더링은 취소되고 그 callback은 호출되지 않는다.
+    """
+
+    def __init__(self, gs_command=None, cache=None, dpi=PREVIEW_DPI):
+        self.gs_command = gs_command
+        self.cache = cache or ThumbnailCache()
+        self.dpi = dpi
+        self._pending = None        # 아직 시작하지 않은 마지막 요청 (경로, callback)
+        self._current = None        # 진행 중인 렌더링의 CancelToken
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._loop, name="ps2pdf-preview", daemon=True)
+        self._thread.start()
+
+    def request(self, path, callback):
+        with self._cond:
+            if self._current is not None:
+                self._current.cancel()
+            self._pending = (path, callback)
+            self._cond.notify()
+
+    def cancel(self):
+        """밀려 있거나 진행 중인 요청 취소"""
+        with self._cond:
+            self._pending = None
+            if self._current is not None:
+                self._current.cancel()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._pending = None
+            if self._current is not None:
+                self._current.cancel()
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                (path, callback), self._pending = self._pending, None
+                token = self._current = CancelToken()
+            data = error = None
+            try:
+                data = self._render(path, token)
+            except ConversionCancelled:
+                continue
+            except subprocess.TimeoutExpired:
+                error = "미리 보기 시간 초과"
+            except Exception as e:
+                if token.cancelled:
+                    continue
+                error = str(e) or type(e).__name__
+            finally:
+                with self._cond:
+                    if self._current is token:
+                        self._current = None
+            if not token.cancelled:
+                callback(path, data, error)
+
+    def _render(self, path, token):
+        # 다른 파일을 고르면 해시 계산도 바로 멈춤 (큰 PS 파일이 다음 미리 보기를 막지 않도록)
+        key = self.cache.key(path, self.dpi, token)
+        data = self.cache.get(key)
+        if data is None:
+            data = render_thumbnail(path, self.gs_command, self.dpi, cancel=token)
+            token.check()
+            self.cache.put(key, data)
+        return data
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+변환 진행률 추적
+Ghostscript EndPage 훅이 출력하는 페이지 표시 줄과 DSC %%Pages: 수로 파일별/작업 전체의
+진행률, 처리 속도(페이지/s, MB/s), 남은 시간을 계산
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+# 진행 이벤트를 내보내는 최소 간격 (초). 파일 시작/완료는 항상 내보냄
+PROGRESS_INTERVAL = 0.25
+
+
+def format_eta(seconds):
+    """남은 시간 표시 문자열 (모르면 "--:--")"""
+    if seconds is None:
+        return "--:--"
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+@dataclass
+class FileProgress:
+    """파일 하나의 진행 상황"""
+    index: int
+    name: str
+    size: int = 0
+    pages_total: int = None      # DSC %%Pages: 수 (모르면 None)
+    pages_done: int = 0
+    started: float = 0.0
+    finished: bool = False
+
+    @property
+    def fraction(self):
+        """완료 비율 0~1 (페이지 수를 모르면 끝나기 전까지 0)"""
+        if self.finished:
+            return 1.0
+        if self.pages_total:
+            return min(self.pages_done / self.pages_total, 0.99)
+        return 0.0
+
+    def eta(self, now):
+        if self.finished:
+            return 0.0
+        if not self.pages_total or not self.pages_done:
+            return None
+        elapsed = now - self.started
+        return elapsed * max(0, self.pages_total - self.pages_done) / self.pages_done
+
+
+@dataclass
+class ProgressSnapshot:
+    """진행 이벤트에 실리는 한 시점의 진행 상황"""
+    file: FileProgress
+    files_done: int
+    files_total: int
+    pages_done: int
+    bytes_done: float
+    bytes_total: int
+    elapsed: float
+    file_eta: float = None
+    eta: float = None
+
+    @property
+    def fraction(self):
+        """작업 전체 완료 비율 0~1 (입력 크기 기준)"""
+        if self.bytes_total > 0:
+            return min(self.bytes_done / self.bytes_total, 1.0)
+        return self.files_done / self.files_total if self.files_total else 0.0
+
+    @property
+    def pages_per_sec(self):
+        return self.pages_done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mb_per_sec(self):
+        return self.bytes_done / (1024 * 1024) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self):
+        """상태 표시줄/콘솔용 한 줄 요약"""
+        f = self.file
+        pages = f"{f.pages_done}/{f.pages_total}" if f.pages_total else f"{f.pages_done}"
+        return (f"{self.files_done}/{self.files_total} 파일 · {f.name} {pages}페이지 "
+                f"(남은 시간 {format_eta(self.file_eta)}) · "
+                f"{self.pages_per_sec:.1f} 페이지/s, {self.mb_per_sec:.1f} MB/s · "
+                f"전체 {self.fraction * 100:.0f}%, 남은 시간 {format_eta(self.eta)}")
+
+
+class ProgressTracker:
+    """작업자 스레드들이 보고하는 페이지/파일 완료를 모아 ProgressSnapshot을 만듦
+
+    on_progress(snapshot)는 보고한 작업자 스레드에서 호출된다.
+    """
+
+    def __init__(self, sizes, on_progress=None, interval=PROGRESS_INTERVAL):
+        self.sizes = list(sizes)
+        self.on_progress = on_progress
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.files = {}
+        self.files_done = 0
+        self.pages_done = 0
+        self.bytes_finished = 0
+        self._last_emit = 0.0
+        self._lock = threading.Lock()
+
+    def file_started(self, index, name, pages_total=None):
+        with self._lock:
+            progress = FileProgress(index, name, size=self.sizes[index], pages_total=pages_total,
+                                    started=time.perf_counter())
+            self.files[index] = progress
+            self._emit(progress, force=True)
+
+    def page_done(self, index):
+        """Ghostscript가 한 페이지를 마쳤을 때 (분할 변환이면 여러 스레드에서 호출)"""
+        with self._lock:
+            progress = self.files.get(index)
+            if progress is None or progress.finished:
+                return
+            progress.pages_done += 1
+            self.pages_done += 1
+            self._emit(progress)
+
+    def file_done(self, index):
+        with self._lock:
+            progress = self.files.get(index)
+            if progress is None or progress.finished:
+                return
+            progress.finished = True
+            if progress.pages_total and progress.pages_done < progress.pages_total:
+                # 캐시 적중 등으로 페이지 줄 없이 끝난 경우
+                self.pages_done += progress.pages_total - progress.pages_done
+                progress.pages_done = progress.pages_total
+            self.files_done += 1
+            self.bytes_finished += progress.size
+            self._emit(progress, force=True)
+
+    def snapshot(self, progress):
+        """현재 진행 상황 (잠금을 잡은 상태에서 호출)"""
+        now = time.perf_counter()
+        elapsed = now - self.started
+        bytes_done = self.bytes_finished + sum(
+            p.size * p.fraction for p in self.files.values() if not p.finished)
+        bytes_total = sum(self.sizes)
+        eta = None
+        if bytes_total and bytes_done > 0:
+            eta = elapsed * (bytes_total - bytes_done) / bytes_done
+        return ProgressSnapshot(
+            file=FileProgress(**vars(progress)),
+            files_done=self.files_done,
+            files_total=len(self.sizes),
+            pages_done=self.pages_done,
+            bytes_done=bytes_done,
+            bytes_total=bytes_total,
+            elapsed=elapsed,
+            file_eta=progress.eta(now),
+            eta=eta
+        )
+
+    def _emit(self, progress, force=False):
+        if self.on_progress is None:
+            return
+        now = time.perf_counter()
+        if not force and now - self._last_emit < self.interval:
+            return
+        self._last_emit = now
+        self.on_progress(self.snapshot(progress))
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PS2PDF 명령줄 변환기
+GUI(Tk) 없이 변환 엔진을 실행 (서버/예약 작업용)
+
+사용 예:
+    python -m ps2pdf_cli "data/**/*.ps" -o out -p printer -r 600 -j 8 --json summary.json
+    python -m ps2pdf_cli --resume                      # 중단된 마지막 작업 이어서 변환
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+
+from conversion_cache import ConversionCache
+from job_journal import JobJournal
+from perf_profile import MODES
+from ps2pdf_engine import ConversionJob, run_job_interruptible, PRESETS
+from ps_dsc import parse_page_spec
+from tracing import Metrics, Tracer
+
+
+def expand_inputs(patterns):
+    """글로브 패턴을 입력 파일 목록으로 확장 (순서 유지, 중복 제거)"""
+    inputs = []
+    seen = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+        else:
+            matches = [pattern]
+        for path in matches:
+            if os.path.isfile(path) and path not in seen:
+                seen.add(path)
+                inputs.append(path)
+    return inputs
+
+
+def build_parser():
+    """명령줄 인자 정의"""
+    parser = argparse.ArgumentParser(
+        prog="ps2pdf_cli",
+        description="PostScript/SVG/EPS 파일을 PDF로 변환합니다.")
+    parser.add_argument("inputs", nargs="*",
+                        help="입력 파일 또는 글로브 패턴 (예: \"data/**/*.ps\")")
+    parser.add_argument("-o", "--output-dir",
+                        help="출력 폴더 (기본값: 첫 입력 파일의 폴더)")
+    parser.add_argument("-p", "--preset", choices=list(PRESETS), default="ebook",
+                        help="PDF 품질 프리셋 (기본값: ebook)")
+    parser.add_argument("-r", "--dpi", type=int, default=300,
+                        help="해상도 DPI (기본값: 300)")
+    parser.add_argument("-j", "--workers", type=int,
+                        help="동시 작업 수 (기본값: CPU 코어 수, --profile이면 프로필 값)")
+    parser.add_argument("--no-split", action="store_true",
+                        help="여러 페이지 PS 파일을 페이지 단위로 나누지 않음")
+    parser.add_argument("--persistent-gs", action="store_true",
+                        help="작업자마다 상주 Ghostscript를 띄워 재사용 (Ghostscript 9.50 이상)")
+    parser.add_argument("--timeout", type=float, metavar="SEC",
+                        help="Ghostscript 제한 시간 (초, 기본값: 입력 크기/페이지 수에 맞춰 자동)")
+    parser.add_argument("--pages", metavar="SPEC",
+                        help="PS 파일에서 변환할 페이지 범위 (예: 1-3,7,10-, 기본값: 전체)")
+    parser.add_argument("--compare-eps", action="store_true",
+                        help="EPS를 Pillow 래스터로도 변환해 벡터 변환과 크기/시간 차이를 출력")
+    parser.add_argument("--no-merge", action="store_true",
+                        help="merged_output.pdf를 만들지 않음")
+    parser.add_argument("--direct-merge", action="store_true",
+                        help="파일별 PDF 없이 Ghostscript 한 번에 병합 PDF만 바로 생성 "
+                             "(캐시/페이지 분할/상주 Ghostscript를 쓰지 않음, 기본값: 파일별 PDF도 저장)")
+    parser.add_argument("--optimize", action="store_true",
+                        help="병합 PDF에서 같은 글꼴/이미지를 하나로 합치고 객체 스트림으로 압축")
+    parser.add_argument("--profile", choices=list(MODES),
+                        help="성능 프로필: 사양/샘플 측정으로 동시 작업 수와 Ghostscript 메모리/스레드 인자를 정함 "
+                             "(-j를 주면 동시 작업 수는 -j 우선)")
+    parser.add_argument("--recalibrate", action="store_true",
+                        help="저장된 성능 프로필을 쓰지 않고 다시 측정")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="변환 캐시를 사용하지 않음")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="변환 전에 캐시를 비움")
+    parser.add_argument("--resume", nargs="?", const="latest", metavar="JOB_ID",
+                        help="중단된 작업을 기록된 입력/옵션으로 이어서 변환 (JOB_ID를 주지 않으면 마지막 작업, "
+                             "출력이 확인된 파일은 다시 변환하지 않음)")
+    parser.add_argument("--list-jobs", action="store_true",
+                        help="이어서 변환할 수 있는 작업 목록을 출력하고 종료")
+    parser.add_argument("--no-journal", action="store_true",
+                        help="작업 기록을 남기지 않음 (중단되면 이어서 변환할 수 없음)")
+    parser.add_argument("--json", metavar="PATH",
+                        help="JSON 요약을 파일에 저장 ('-'이면 표준 출력)")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="파일/단계별 소요 시간을 JSON-lines로 추가 기록")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="백엔드/프리셋별 집계 지표를 Prometheus 텍스트 파일로 저장")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="진행 메시지를 출력하지 않음")
+    parser.add_argument("--progress", action="store_true",
+                        help="페이지 단위 진행률, 처리 속도, 남은 시간을 표준 오류에 출력")
+    return parser
+
+
+def main(argv=None):
+    """메인 함수 (종료 코드 반환: 0 성공, 1 변환 실패, 2 인자 오류, 130 취소)"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    journal = None if args.no_journal and not (args.resume or args.list_jobs) else JobJournal()
+    if args.list_jobs:
+        entries = journal.unfinished()
+        for entry in entries:
+            print(entry.summary())
+        if not entries:
+            print("이어서 변환할 작업이 없습니다.")
+        return 0
+
+    resume = None
+    if args.resume:
+        if args.inputs:
+            parser.error("--resume은 입력 파일과 함께 쓸 수 없습니다 (기록된 입력을 사용).")
+        if args.resume == "latest":
+            entries = journal.unfinished()
+            if not entries:
+                parser.error("이어서 변환할 작업이 없습니다.")
+            resume = entries[0].job_id
+        else:
+            resume = args.resume
+        try:
+            job = journal.load_job(resume)
+        except KeyError:
+            parser.error(f"작업 기록을 찾을 수 없습니다: {resume}")
+        os.makedirs(job.output_dir, exist_ok=True)
+    else:
+        inputs = expand_inputs(args.inputs)
+        if not inputs:
+            parser.error("입력 파일을 찾을 수 없습니다.")
+
+        if args.pages:
+            try:
+                parse_page_spec(args.pages)
+            except ValueError as e:
+                parser.error(str(e))
+
+        output_dir = args.output_dir or os.path.dirname(os.path.abspath(inputs[0]))
+        os.makedirs(output_dir, exist_ok=True)
+
+        job = ConversionJob(
+            inputs=inputs,
+            output_dir=output_dir,
+            quality=PRESETS[args.preset],
+            resolution=str(args.dpi),
+            workers=args.workers,
+            split_pages=not args.no_split,
+            use_cache=not args.no_cache,
+            persistent=args.persistent_gs,
+            merge=not args.no_merge,
+            per_file=not args.direct_merge,
+            optimize=args.optimize,
+            profile=args.profile,
+            recalibrate=args.recalibrate,
+            timeout=args.timeout,
+            pages=args.pages,
+            compare_eps=args.compare_eps
+        )
+
+    # JSON을 표준 출력으로 내보낼 때는 진행 메시지를 표준 오류로 보냄
+    log_stream = sys.stderr if args.json == "-" else sys.stdout
+
+    # 터미널이면 진행 줄을 제자리에서 갱신
+    progress_inline = sys.stderr.isatty()
+
+    def on_event(event):
+        if event.kind == "progress":
+            if args.progress:
+                line = event.progress.summary()
+                if progress_inline:
+                    print(f"\r\033[K{line}", end="", file=sys.stderr, flush=True)
+                else:
+                    print(line, file=sys.stderr, flush=True)
+            return
+        if args.quiet:
+            return
+        if args.progress and progress_inline:
+            print("\r\033[K", end="", file=sys.stderr)
+        if event.kind == "file_done":
+            r = event.result
+            name = os.path.basename(r.input_path)
+            if r.resumed:
+                print(f"  ✓ 이전 출력 사용: {name}", file=log_stream, flush=True)
+            elif r.cached:
+                print(f"  ✓ 캐시 사용: {name}", file=log_stream, flush=True)
+            elif r.passthrough:
+                print(f"  ✓ PDF 그대로 사용: {name}", file=log_stream, flush=True)
+            elif r.ok:
+                print(f"  ✓ 변환 성공: {name} ({r.elapsed:.1f}초)", file=log_stream, flush=True)
+            else:
+                print(f"  ✗ {name}: {r.message}", file=log_stream, flush=True)
+        elif event.message:
+            print(event.message, file=log_stream, flush=True)
+
+    cache = None
+    if not args.no_cache or args.clear_cache:
+        cache = ConversionCache()
+        if args.clear_cache:
+            cache.clear()
+
+    tracer = Tracer(args.trace, Metrics() if args.metrics else None)
+    try:
+        job_result = run_job_interruptible(
+            job, on_event=on_event, cache=cache, tracer=tracer, journal=journal, resume=resume,
+            on_interrupt=lambda: print("\n취소 중...", file=sys.stderr, flush=True))
+    finally:
+        tracer.close()
+        if journal is not None:
+            journal.close()
+    if args.metrics:
+        tracer.metrics.write(args.metrics)
+
+    summary = job_result.to_dict()
+    if args.json == "-":
+        json.dump(summary, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(summary, fh, ensure_ascii=False, indent=2)
+
+    if not args.quiet:
+        print(f"완료: 변환 {summary['converted']}개, 실패 {summary['failed']}개, "
+              f"스킵 {summary['skipped']}개, 취소 {summary['cancelled']}개 ({summary['elapsed']:.1f}초)",
+              file=log_stream)
+    if job_result.cancelled:
+        if not args.quiet and job_result.job_id:
+            print(f"이어서 변환하려면: ps2pdf_cli --resume {job_result.job_id}", file=log_stream)
+        return 130
+    return 1 if job_result.failed or job_result.merge_error else 0
+
+
+if __name__ == "__main__":
+    # 실행 파일로 묶였을 때 SVG/EPS 작업 프로세스(spawn)가 프로그램을 다시 띄우지 않도록
+    multiprocessing.freeze_support()
+    sys.exit(main())
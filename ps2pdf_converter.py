@@ -5,28 +5,84 @@ PS to PDF Converter
 Windows용 PostScript 파일을 PDF로 변환하는 GUI 프로그램
 """
 
+import time
+_IMPORT_STARTED = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import base64
+import json
 import os
-import subprocess
+import multiprocessing
+import queue
 import threading
-from pathlib import Path
-import webbrowser
 
-# 서드파티 라이브러리
-import cairosvg
-from PIL import Image
-from PyPDF2 import PdfMerger
+from ps2pdf_engine import (ConversionJob, run_job,
+                           QUALITY_SETTINGS, DEFAULT_QUALITY, default_workers)
+from gs_discovery import discover, cached_info
+from conversion_cache import ConversionCache, user_cache_dir
+from cancellation import CancelToken
+from job_journal import JobJournal
+from ps_dsc import parse_page_spec
+from perf_profile import MODES
+from preview import PreviewRenderer
+from tracing import Metrics, Tracer
+
+# 로그 창에 남길 최대 줄 수 (넘으면 오래된 줄부터 삭제, 전체 로그는 파일에 저장)
+LOG_MAX_LINES = 2000
+# 로그 큐를 비우는 주기 (밀리초)와 한 번에 처리할 최대 항목 수
+LOG_PUMP_INTERVAL = 100
+LOG_PUMP_BATCH = 1000
+# 로그 파일 회전 설정
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+# 미리 보기: 선택이 바뀐 뒤 렌더링을 요청하기까지 기다리는 시간 (밀리초, 목록을 훑는 동안은 요청 안 함)과
+# 표시 영역 최대 크기 (픽셀, 넘으면 축소)
+PREVIEW_DELAY = 150
+PREVIEW_MAX_SIZE = 320
+
+# 시작 시간 측정 (startup_benchmark.py에서 사용)
+# PS2PDF_STARTUP_PROBE=결과 JSON 경로, PS2PDF_STARTUP_T0=실행 직전 시각(time.time())
+STARTUP_PROBE = os.environ.get("PS2PDF_STARTUP_PROBE")
+_startup_marks = {"imports": time.perf_counter() - _IMPORT_STARTED}
+_startup_origin = time.time() - time.perf_counter()  # perf_counter → 벽시계 변환
+
 
 class PS2PDFConverter:
     def __init__(self, root):
         self.root = root
         self.root.title("PS to PDF 변환기")
-        self.root.geometry("750x650")
+        self.root.geometry("1080x650")
         self.root.resizable(True, True)
         
         # Ghostscript 사용 가능 여부 플래그
         self.gs_available = False
+        self.gs_command = None
+        self.gs_checked = False  # 백그라운드 확인 완료 여부
+
+        # 변환 결과 캐시
+        self.cache = ConversionCache()
+
+        # 진행 중인 작업의 취소/일시 정지 신호 (작업이 없으면 None)
+        self.cancel_token = None
+
+        # 작업 기록 (중단된 작업 이어서 변환). 창이 뜬 뒤 백그라운드에서 열고, 열기 전에 시작한 작업은 기록 안 함
+        self.journal = None
+
+        # 단계별 시간 추적 (logs/trace.jsonl)과 누적 지표 (작업이 끝날 때마다 logs/metrics.prom 갱신)
+        log_dir = os.path.join(user_cache_dir(), "logs")
+        self.tracer = Tracer(os.path.join(log_dir, "trace.jsonl"), Metrics())
+        self.metrics_path = os.path.join(log_dir, "metrics.prom")
+
+        # 로그/엔진 이벤트 큐: 어느 스레드에서든 넣고, 메인 루프가 주기적으로 모아서 표시
+        self.event_queue = queue.Queue()
+        self.file_logger = None
+
+        # 첫 페이지 미리 보기 (백그라운드 렌더링, 메모리+디스크 캐시)
+        self.previewer = PreviewRenderer()
+        self.preview_paths = []
+        self.preview_after = None
+        self.preview_image = None
         
         # 스타일 설정
         style = ttk.Style()
@@ -35,6 +91,8 @@ class PS2PDFConverter:
         
         self.setup_ui()
         self.check_ghostscript()
+        self.root.after(500, lambda: threading.Thread(target=self.check_unfinished_jobs, daemon=True).start())
+        self.root.after(LOG_PUMP_INTERVAL, self.pump_events)
         
     def setup_ui(self):
         """UI 구성 요소 설정"""
@@ -49,7 +107,7 @@ class PS2PDFConverter:
         # 링크 & 테마 설정 행
         link_label = ttk.Label(main_frame, text="Ghostscript 다운로드", foreground="blue", cursor="hand2")
         link_label.grid(row=1, column=0, sticky=tk.W)
-        link_label.bind("<Button-1>", lambda e: webbrowser.open_new("https://www.ghostscript.com/download/gsdnld.html"))
+        link_label.bind("<Button-1>", lambda e: self.open_download_page())
 
         ttk.Label(main_frame, text="테마:").grid(row=1, column=2, sticky=tk.E)
         self.theme_var = tk.StringVar(value="light")
@@ -86,6 +144,8 @@ class PS2PDFConverter:
                   command=self.browse_output_folder).grid(row=0, column=1)
         
         output_frame.columnconfigure(0, weight=1)
+
+        self.setup_preview(main_frame)
         
         # 옵션 설정
         options_frame = ttk.LabelFrame(main_frame, text="변환 옵션", padding="10")
@@ -93,13 +153,8 @@ class PS2PDFConverter:
         
         # PDF 품질 설정
         ttk.Label(options_frame, text="PDF 품질:").grid(row=0, column=0, sticky=tk.W)
-        self.quality = tk.StringVar(value="전자책(보통)")
-        quality_labels = [
-            "화면(저화질)",
-            "전자책(보통)",
-            "프린터(고화질)",
-            "인쇄소(최고)"
-        ]
+        self.quality = tk.StringVar(value=DEFAULT_QUALITY)
+        quality_labels = list(QUALITY_SETTINGS)
         quality_combo = ttk.Combobox(options_frame, textvariable=self.quality,
                                     values=quality_labels,
                                     state="readonly", width=20)
@@ -111,6 +166,67 @@ class PS2PDFConverter:
         resolution_spin = ttk.Spinbox(options_frame, from_=72, to=1200, increment=50,
                                     textvariable=self.resolution, width=15)
         resolution_spin.grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=(10, 0))
+
+        # 동시 작업 수 설정
+        ttk.Label(options_frame, text="동시 작업 수:").grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
+        self.workers = tk.StringVar(value=str(default_workers()))
+        workers_spin = ttk.Spinbox(options_frame, from_=1, to=max(64, default_workers()), increment=1,
+                                   textvariable=self.workers, width=15)
+        workers_spin.grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=(10, 0))
+
+        # 페이지 분할 변환 (여러 페이지 PS 파일을 나눠서 동시에 변환)
+        self.split_pages = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="여러 페이지 PS 파일을 페이지 단위로 나눠 동시 변환",
+                        variable=self.split_pages).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+
+        # 상주 Ghostscript (작은 파일이 많을 때 프로세스 시작 비용 절감)
+        self.persistent_gs = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="상주 Ghostscript 사용 (작은 파일이 많을 때 빠름)",
+                        variable=self.persistent_gs).grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+
+        # 변환 캐시 (같은 입력+옵션이면 다시 변환하지 않음)
+        self.use_cache = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="변환 캐시 사용",
+                        variable=self.use_cache).grid(row=4, column=0, sticky=tk.W, pady=(10, 0))
+        ttk.Button(options_frame, text="캐시 비우기",
+                   command=self.clear_cache).grid(row=4, column=1, sticky=tk.W, padx=(10, 0), pady=(10, 0))
+
+        # Ghostscript 제한 시간 (0이면 입력 크기/페이지 수에 맞춰 자동)
+        ttk.Label(options_frame, text="제한 시간 (초, 0=자동):").grid(row=6, column=0, sticky=tk.W, pady=(10, 0))
+        self.timeout = tk.StringVar(value="0")
+        timeout_spin = ttk.Spinbox(options_frame, from_=0, to=86400, increment=30,
+                                   textvariable=self.timeout, width=15)
+        timeout_spin.grid(row=6, column=1, sticky=tk.W, padx=(10, 0), pady=(10, 0))
+
+        # PS 파일에서 변환할 페이지 범위 (비우면 전체)
+        ttk.Label(options_frame, text="페이지 범위 (예: 1-3,7,10-):").grid(row=7, column=0, sticky=tk.W, pady=(10, 0))
+        self.page_range = tk.StringVar(value="")
+        ttk.Entry(options_frame, textvariable=self.page_range,
+                  width=17).grid(row=7, column=1, sticky=tk.W, padx=(10, 0), pady=(10, 0))
+
+        # 끄면 여러 파일을 파일별 PDF 없이 Ghostscript 한 번에 바로 병합
+        # (캐시/페이지 분할/상주 Ghostscript를 쓰지 않으므로 기본값은 켜 둠)
+        self.per_file = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="파일별 PDF도 저장 (끄면 병합 PDF만 바로 생성)",
+                        variable=self.per_file).grid(row=8, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+
+        # 병합 PDF 최적화 (입력마다 들어 있는 같은 글꼴/이미지를 하나로 합침)
+        self.optimize = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="병합 PDF 최적화 (중복 글꼴/이미지 제거)",
+                        variable=self.optimize).grid(row=9, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+
+        # 성능 프로필 (고르면 사양/샘플 측정 결과로 동시 작업 수 등을 채움)
+        ttk.Label(options_frame, text="성능 프로필:").grid(row=10, column=0, sticky=tk.W, pady=(10, 0))
+        profile_frame = ttk.Frame(options_frame)
+        profile_frame.grid(row=10, column=1, sticky=tk.W, padx=(10, 0), pady=(10, 0))
+        self.profile_labels = {"사용 안 함": None, **{label: mode for mode, label in MODES.items()}}
+        self.profile = tk.StringVar(value="사용 안 함")
+        profile_combo = ttk.Combobox(profile_frame, textvariable=self.profile, values=list(self.profile_labels),
+                                     state="readonly", width=12)
+        profile_combo.grid(row=0, column=0)
+        profile_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_profile())
+        ttk.Button(profile_frame, text="다시 측정",
+                   command=lambda: self.apply_profile(recalibrate=True)).grid(row=0, column=1, padx=(10, 0))
         
         # 변환/종료 버튼
         button_frame = ttk.Frame(main_frame)
@@ -121,16 +237,25 @@ class PS2PDFConverter:
                                        style="Accent.TButton")
         self.convert_button.grid(row=0, column=0, padx=10)
         
+        self.pause_button = ttk.Button(button_frame, text="일시 정지",
+                                       command=self.toggle_pause, state='disabled')
+        self.pause_button.grid(row=0, column=1, padx=10)
+
+        self.cancel_button = ttk.Button(button_frame, text="취소",
+                                        command=self.cancel_conversion, state='disabled')
+        self.cancel_button.grid(row=0, column=2, padx=10)
+
         self.clear_button = ttk.Button(button_frame, text="초기화", 
                                      command=self.clear_fields)
-        self.clear_button.grid(row=0, column=1, padx=10)
+        self.clear_button.grid(row=0, column=3, padx=10)
 
-        exit_btn = ttk.Button(button_frame, text="종료", command=self.root.destroy)
-        exit_btn.grid(row=0, column=2, padx=10)
+        exit_btn = ttk.Button(button_frame, text="종료", command=self.exit_app)
+        exit_btn.grid(row=0, column=4, padx=10)
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
 
         # 진행 표시줄
         progress_row = 8
-        self.progress = ttk.Progressbar(main_frame, mode='indeterminate')
+        self.progress = ttk.Progressbar(main_frame, mode='determinate', maximum=100)
         self.progress.grid(row=progress_row, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=10)
         
         # 상태 메시지
@@ -158,33 +283,191 @@ class PS2PDFConverter:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
     
+    def setup_preview(self, main_frame):
+        """미리 보기 영역: 선택한 파일 목록과 첫 페이지 이미지"""
+        preview_frame = ttk.LabelFrame(main_frame, text="미리 보기", padding="5")
+        preview_frame.grid(row=2, column=4, rowspan=6, sticky=(tk.N, tk.S, tk.E, tk.W), padx=(15, 0))
+
+        list_frame = ttk.Frame(preview_frame)
+        list_frame.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self.preview_list = tk.Listbox(list_frame, height=6, width=40, exportselection=False)
+        list_scroll = ttk.Scrollbar(list_frame, orient="vertical", command=self.preview_list.yview)
+        self.preview_list.configure(yscrollcommand=list_scroll.set)
+        self.preview_list.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        list_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        list_frame.columnconfigure(0, weight=1)
+        self.preview_list.bind("<<ListboxSelect>>", lambda e: self.schedule_preview())
+
+        self.preview_label = ttk.Label(preview_frame, text="파일을 선택하면 첫 페이지를 표시합니다.",
+                                       anchor=tk.CENTER, compound=tk.TOP)
+        self.preview_label.grid(row=1, column=0, pady=(10, 0))
+        preview_frame.columnconfigure(0, weight=1)
+
+        # 입력 칸이 바뀌면 (찾아보기, 직접 입력, 초기화) 목록 갱신
+        self.input_path.trace_add("write", lambda *args: self.refresh_preview_list())
+
+    def refresh_preview_list(self):
+        """입력 파일 목록을 미리 보기 목록에 반영하고 첫 파일 선택"""
+        paths = [p for p in self.input_path.get().split(";") if p]
+        if paths == self.preview_paths:
+            return
+        self.preview_paths = paths
+        self.preview_list.delete(0, tk.END)
+        for path in paths:
+            self.preview_list.insert(tk.END, os.path.basename(path))
+        if paths:
+            self.preview_list.selection_set(0)
+        self.schedule_preview()
+
+    def schedule_preview(self):
+        """선택이 잠시 멈추면 미리 보기 요청 (목록을 빠르게 훑는 동안은 렌더링하지 않음)"""
+        if self.preview_after is not None:
+            self.root.after_cancel(self.preview_after)
+        self.preview_after = self.root.after(PREVIEW_DELAY, self.request_preview)
+
+    def selected_preview_path(self):
+        selection = self.preview_list.curselection()
+        if not selection or selection[0] >= len(self.preview_paths):
+            return None
+        return self.preview_paths[selection[0]]
+
+    def request_preview(self):
+        """선택한 파일의 미리 보기를 백그라운드에서 렌더링 (이전 요청은 취소)"""
+        self.preview_after = None
+        path = self.selected_preview_path()
+        if path is None or not os.path.isfile(path):
+            self.previewer.cancel()
+            self.show_preview(path, None, None if path is None else "파일을 찾을 수 없습니다.")
+            return
+        self.previewer.gs_command = self.gs_command if self.gs_available else None
+        self.preview_label.configure(text="미리 보기 만드는 중...")
+        self.previewer.request(path, lambda p, data, error: self.event_queue.put(
+            lambda: self.show_preview(p, data, error)))
+
+    def show_preview(self, path, data, error):
+        """미리 보기 표시 (메인 스레드, 그사이 선택이 바뀌었으면 무시)"""
+        if path != self.selected_preview_path():
+            return
+        image = None
+        if data is not None:
+            try:
+                image = tk.PhotoImage(data=base64.b64encode(data).decode("ascii"))
+                factor = -(-max(image.width(), image.height()) // PREVIEW_MAX_SIZE)
+                if factor > 1:
+                    image = image.subsample(factor)
+            except tk.TclError as e:
+                image, error = None, f"이미지를 표시할 수 없습니다: {e}"
+        self.preview_image = image
+        if image is not None:
+            self.preview_label.configure(image=image, text=os.path.basename(path))
+        else:
+            self.preview_label.configure(image="", text=error or "파일을 선택하면 첫 페이지를 표시합니다.")
+
+    def apply_profile(self, recalibrate=False):
+        """선택한 성능 프로필을 불러오거나 측정해 옵션에 반영 (측정은 백그라운드 스레드)"""
+        mode = self.profile_labels.get(self.profile.get())
+        if mode is None:
+            return
+        gs_command = self.gs_command if self.gs_available else None
+
+        def work():
+            from perf_profile import get_profile
+            try:
+                profile = get_profile(mode, gs_command, recalibrate=recalibrate, log=self.log_message)
+            except Exception as e:
+                self.log_message(f"성능 프로필 오류: {e}")
+                return
+            self.log_message(f"성능 프로필 {profile.summary()}")
+
+            def apply():
+                self.workers.set(str(profile.workers))
+                self.split_pages.set(profile.split_pages)
+                self.persistent_gs.set(profile.persistent)
+                self.status_var.set(f"성능 프로필 적용: {profile.label}")
+            self.event_queue.put(apply)
+
+        if recalibrate:
+            self.status_var.set("성능 프로필 측정 중...")
+        threading.Thread(target=work, daemon=True).start()
+
     def check_ghostscript(self):
-        """Ghostscript 설치 확인"""
+        """Ghostscript 설치 확인
+
+        캐시된 탐색 결과를 바로 사용하고, 실제 확인은 창이 뜬 뒤 백그라운드에서 수행
+        """
+        info = cached_info()
+        if info is not None:
+            self.gs_command = info.command
+            self.gs_available = True
+        self.root.after(100, lambda: threading.Thread(target=self.validate_ghostscript, daemon=True).start())
+
+    def validate_ghostscript(self):
+        """Ghostscript 탐색 결과 확인 (백그라운드 스레드, 결과는 이벤트 큐로 메인 스레드에 넘김)"""
         try:
-            # Windows에서 Ghostscript 경로 확인
-            gs_commands = ['gswin64c', 'gswin32c', 'gs']
-            gs_found = False
-            
-            for cmd in gs_commands:
-                try:
-                    subprocess.run([cmd, '--version'], 
-                                 capture_output=True, check=True, timeout=5)
-                    self.gs_command = cmd
-                    gs_found = True
-                    break
-                except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                    continue
-            
-            if not gs_found:
-                self.gs_available = False
-                self.log_message("경고: Ghostscript가 설치되지 않았거나 PATH에 없습니다. PS 파일 변환은 제한됩니다.")
-                self.log_message("Ghostscript 다운로드: https://www.ghostscript.com/download/gsdnld.html")
-            else:
-                self.gs_available = True
-                self.log_message(f"Ghostscript 발견: {self.gs_command}")
-                
+            info = discover()
+            self.event_queue.put(lambda: self.apply_ghostscript(info))
         except Exception as e:
             self.log_message(f"Ghostscript 확인 중 오류: {str(e)}")
+            self.event_queue.put(lambda: mark_startup("ready", self.root))
+
+    def check_unfinished_jobs(self):
+        """작업 기록을 열고 중단된 작업 확인 (백그라운드 스레드)"""
+        try:
+            journal = JobJournal()
+            entries = journal.unfinished()
+        except Exception as e:
+            self.log_message(f"작업 기록을 열 수 없습니다 (이어서 변환 사용 안 함): {str(e)}")
+            return
+        self.event_queue.put(lambda: self.offer_resume(journal, entries))
+
+    def offer_resume(self, journal, entries):
+        """중단된 마지막 작업을 이어서 변환할지 묻기 (메인 스레드)"""
+        self.journal = journal
+        if not entries or self.cancel_token is not None:
+            return
+        entry = entries[0]
+        if messagebox.askyesno(
+                "중단된 작업",
+                f"끝나지 않은 변환 작업이 있습니다.\n\n{entry.summary()}\n\n"
+                "이어서 변환할까요? (이미 변환된 파일은 출력을 확인하고 다시 변환하지 않습니다)\n"
+                "아니요를 누르면 중단된 작업 기록을 지웁니다."):
+            self.resume_job(entry.job_id)
+        else:
+            for e in entries:
+                journal.abandon(e.job_id)
+
+    def resume_job(self, job_id):
+        """기록된 입력/옵션으로 작업 이어서 변환"""
+        try:
+            job = self.journal.load_job(job_id)
+            os.makedirs(job.output_dir, exist_ok=True)
+        except (KeyError, OSError) as e:
+            messagebox.showerror("오류", f"작업을 이어서 변환할 수 없습니다: {e}")
+            return
+        job.gs_command = self.gs_command if self.gs_available else ("" if self.gs_checked else None)
+        self.input_path.set(";".join(job.inputs))
+        self.output_path.set(job.output_dir)
+        self.log_message(f"=== 중단된 작업 {job_id} 이어서 변환 ===")
+        self.begin_job(job, resume=job_id)
+
+    def open_download_page(self):
+        """Ghostscript 다운로드 페이지 열기"""
+        import webbrowser
+        webbrowser.open_new("https://www.ghostscript.com/download/gsdnld.html")
+
+    def apply_ghostscript(self, info):
+        """Ghostscript 확인 결과 반영 (메인 스레드)"""
+        self.gs_checked = True
+        if info is None:
+            self.gs_command = None
+            self.gs_available = False
+            self.log_message("경고: Ghostscript가 설치되지 않았거나 PATH에 없습니다. PS 파일 변환은 제한됩니다.")
+            self.log_message("Ghostscript 다운로드: https://www.ghostscript.com/download/gsdnld.html")
+        else:
+            self.gs_command = info.command
+            self.gs_available = True
+            self.log_message(f"Ghostscript 발견: {info.name} {info.version}")
+        mark_startup("ready", self.root)
     
     def browse_input_file(self):
         """입력 파일 선택"""
@@ -193,6 +476,8 @@ class PS2PDFConverter:
             filetypes=[("PS 파일(확장자 .ps 및 없는 파일)", ("*.ps", "ps")),
                        ("SVG 파일", "*.svg"),
                        ("EPS 파일", "*.eps"),
+                       ("PDF 파일 (그대로 병합)", "*.pdf"),
+                       ("압축 파일 (.gz/.bz2/.xz)", ("*.gz", "*.bz2", "*.xz")),
                        ("모든 파일", "*.*")],
             multiple=True,
             initialfile="ps"
@@ -224,11 +509,84 @@ class PS2PDFConverter:
         self.status_var.set("변환할 PS 파일을 선택하세요.")
         self.log_text.delete(1.0, tk.END)
     
+    def clear_cache(self):
+        """변환 캐시 비우기"""
+        size_mb = self.cache.size() / (1024 * 1024)
+        self.cache.clear()
+        self.log_message(f"캐시를 비웠습니다 ({size_mb:.1f} MB)")
+
     def log_message(self, message):
-        """로그 메시지 추가"""
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """로그 메시지 추가 (어느 스레드에서 불러도 됨)"""
+        self.event_queue.put(message)
+
+    def pump_events(self):
+        """쌓인 로그/엔진 이벤트를 한꺼번에 표시 (메인 루프에서 주기적으로 실행)
+
+        큐에는 문자열, EngineEvent, 또는 로그를 다 표시한 뒤 실행할 함수가 들어온다.
+        """
+        lines = []
+        progress = None
+        actions = []
+        try:
+            for _ in range(LOG_PUMP_BATCH):
+                item = self.event_queue.get_nowait()
+                if isinstance(item, str):
+                    lines.append(item)
+                elif callable(item):
+                    actions.append(item)
+                elif item.kind == "progress":
+                    # 진행 표시는 가장 최근 것만 반영
+                    progress = item.progress
+                else:
+                    if item.kind == "merge_start":
+                        progress = None
+                    line = self.format_event(item)
+                    if line:
+                        lines.append(line)
+        except queue.Empty:
+            pass
+
+        if progress is not None:
+            self.progress["value"] = progress.fraction * 100
+            self.status_var.set(progress.summary())
+
+        if lines:
+            self.write_log_file(lines)
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            # 화면에는 최근 LOG_MAX_LINES 줄만 유지
+            excess = int(self.log_text.index("end-1c").split(".")[0]) - 1 - LOG_MAX_LINES
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+            self.log_text.see(tk.END)
+
+        for action in actions:
+            action()
+
+        # 아직 남아 있으면 바로 이어서, 아니면 다음 주기에
+        delay = 1 if not self.event_queue.empty() else LOG_PUMP_INTERVAL
+        self.root.after(delay, self.pump_events)
+
+    def write_log_file(self, lines):
+        """전체 로그를 회전 로그 파일에 저장"""
+        if self.file_logger is None:
+            import logging
+            import logging.handlers
+            log_dir = os.path.join(user_cache_dir(), "logs")
+            logger = logging.getLogger("ps2pdf")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            try:
+                os.makedirs(log_dir, exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    os.path.join(log_dir, "ps2pdf.log"), maxBytes=LOG_FILE_MAX_BYTES,
+                    backupCount=LOG_FILE_BACKUPS, encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                logger.addHandler(handler)
+            except OSError:
+                logger.addHandler(logging.NullHandler())
+            self.file_logger = logger
+        for line in lines:
+            self.file_logger.info(line)
     
     def start_conversion(self):
         """변환 시작 (별도 스레드에서 실행)"""
@@ -250,123 +608,164 @@ class PS2PDFConverter:
             messagebox.showerror("오류", "출력 폴더가 존재하지 않습니다.")
             return
         
-        # UI 상태 변경
+        try:
+            workers = int(self.workers.get())
+        except ValueError:
+            workers = default_workers()
+        try:
+            timeout = float(self.timeout.get()) or None
+        except ValueError:
+            timeout = None
+        pages = self.page_range.get().strip() or None
+        if pages:
+            try:
+                parse_page_spec(pages)
+            except ValueError as e:
+                messagebox.showerror("오류", f"페이지 범위가 올바르지 않습니다: {e}")
+                return
+
+        # Tk 변수는 메인 스레드에서만 읽고, 작업 스레드에는 작업 명세만 넘김
+        job = ConversionJob(
+            inputs=input_paths,
+            output_dir=self.output_path.get(),
+            quality=self.quality.get(),
+            resolution=self.resolution.get(),
+            workers=workers,
+            split_pages=self.split_pages.get(),
+            use_cache=self.use_cache.get(),
+            persistent=self.persistent_gs.get(),
+            timeout=timeout,
+            pages=pages,
+            per_file=self.per_file.get(),
+            optimize=self.optimize.get(),
+            profile=self.profile_labels.get(self.profile.get()),
+            # 확인이 끝나기 전이면 None: 엔진이 작업 스레드에서 탐색
+            gs_command=self.gs_command if self.gs_available else ("" if self.gs_checked else None)
+        )
+
         self.log_message("=== 변환 작업 시작 ===")
+        self.begin_job(job)
+
+    def begin_job(self, job, resume=None):
+        """UI를 작업 중 상태로 바꾸고 작업 스레드 시작"""
         self.convert_button.configure(state='disabled')
-        self.progress.start()
+        self.pause_button.configure(state='normal', text="일시 정지")
+        self.cancel_button.configure(state='normal')
+        self.progress["value"] = 0
         self.status_var.set("변환 중...")
+        self.cancel_token = CancelToken()
         
         # 별도 스레드에서 변환 실행
-        threading.Thread(target=self.convert_file, daemon=True).start()
+        threading.Thread(target=self.convert_file, args=(job, self.cancel_token, resume), daemon=True).start()
+
+    def toggle_pause(self):
+        """새 파일 시작을 멈추거나 다시 시작 (실행 중인 파일은 끝까지 변환)"""
+        token = self.cancel_token
+        if token is None or token.cancelled:
+            return
+        if token.paused:
+            token.resume()
+            self.pause_button.configure(text="일시 정지")
+            self.log_message("작업을 계속합니다.")
+        else:
+            token.pause()
+            self.pause_button.configure(text="계속")
+            self.log_message("일시 정지: 실행 중인 파일이 끝나면 멈춥니다.")
+
+    def cancel_conversion(self):
+        """실행 중인 Ghostscript를 바로 종료하고 남은 파일을 건너뜀"""
+        token = self.cancel_token
+        if token is None or token.cancelled:
+            return
+        token.cancel()
+        self.pause_button.configure(state='disabled')
+        self.cancel_button.configure(state='disabled')
+        self.status_var.set("취소 중...")
+        self.log_message("취소 요청: 실행 중인 변환을 종료합니다.")
+
+    def exit_app(self):
+        """종료 (실행 중인 Ghostscript가 남지 않도록 먼저 취소)"""
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+        self.previewer.close()
+        self.tracer.close()
+        self.root.destroy()
     
-    def convert_file(self):
-        """실제 파일 변환 수행 (여러 파일 및 다양한 포맷 지원)"""
-        self.log_message("변환 스레드 실행 중 ...")
+    def convert_file(self, job, cancel, resume=None):
+        """변환 엔진 실행 (작업 스레드). 엔진 이벤트는 메인 스레드로 넘겨 표시"""
         try:
-            input_paths = [p for p in self.input_path.get().split(";") if p]
-            output_dir = self.output_path.get()
-
-            if not input_paths:
-                raise ValueError("입력 파일 목록이 비어 있습니다.")
-
-            pdf_files = []  # 생성된 PDF 목록
-
-            # PDF 품질 매핑 (Ghostscript 전용)
-            quality_settings = {
-                "화면(저화질)": ["-dPDFSETTINGS=/screen"],
-                "전자책(보통)": ["-dPDFSETTINGS=/ebook"],
-                "프린터(고화질)": ["-dPDFSETTINGS=/printer"],
-                "인쇄소(최고)": ["-dPDFSETTINGS=/prepress"]
-            }
-
-            for in_file in input_paths:
-                ext = Path(in_file).suffix.lower()
-                base_name = Path(in_file).stem
-                out_pdf = os.path.join(output_dir, f"{base_name}.pdf")
-
-                self.log_message(f"▶ {os.path.basename(in_file)} 변환 시작 → {os.path.basename(out_pdf)}")
-
-                # 확장자가 없으면 파일 내용 앞부분을 검사해 PS 여부를 추정하거나 기본적으로 PS로 간주
-                if ext == "":
-                    # 간단히 파일 서두 확인 ("%!PS" 여부). 실패해도 PS로 처리.
-                    try:
-                        with open(in_file, "rb") as fh:
-                            header = fh.read(4)
-                        if header.startswith(b"%!PS"):
-                            ext = ".ps"  # PS로 간주
-                    except Exception:
-                        ext = ".ps"
-
-                if ext == ".ps":
-                    if not self.gs_available:
-                        self.log_message("  ✗ Ghostscript가 없어 PS 변환 불가: 스킵")
-                        continue
-                    # Ghostscript 사용
-                    cmd = [
-                        self.gs_command,
-                        "-dNOPAUSE",
-                        "-dBATCH",
-                        "-dSAFER",
-                        "-sDEVICE=pdfwrite",
-                        f"-r{self.resolution.get()}",
-                        *quality_settings.get(self.quality.get(), ["-dPDFSETTINGS=/ebook"]),
-                        f"-sOutputFile={out_pdf}",
-                        in_file
-                    ]
-                    self.log_message(f"  실행: {' '.join(cmd)}")
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-                    if result.returncode != 0:
-                        raise RuntimeError(result.stderr or result.stdout or "Ghostscript 오류")
-                elif ext == ".svg":
-                    # CairoSVG 사용
-                    cairosvg.svg2pdf(url=in_file, write_to=out_pdf)
-                elif ext == ".eps":
-                    # Pillow 사용 (Ghostscript 필요할 수 있음)
-                    img = Image.open(in_file)
-                    img.save(out_pdf, "PDF", resolution=int(self.resolution.get()))
-                else:
-                    self.log_message(f"  ✗ 지원되지 않는 확장자: {ext}")
-                    continue
-
-                self.log_message("  ✓ 변환 성공")
-                pdf_files.append(out_pdf)
-
-            # 여러 PDF를 하나로 병합
-            if len(pdf_files) > 1:
-                merged_path = os.path.join(output_dir, "merged_output.pdf")
-                self.log_message("PDF 병합 시작 ...")
-                merger = PdfMerger()
-                for pdf in pdf_files:
-                    merger.append(pdf)
-                merger.write(merged_path)
-                merger.close()
-                self.log_message(f"✓ 병합 완료 → {merged_path}")
-
-                self.root.after(0, lambda: messagebox.showinfo(
+            try:
+                job_result = run_job(job, on_event=self.event_queue.put, cache=self.cache, cancel=cancel,
+                                     tracer=self.tracer, journal=self.journal, resume=resume)
+            finally:
+                try:
+                    self.tracer.metrics.write(self.metrics_path)
+                except OSError:
+                    pass
+
+            if job_result.cancelled:
+                self.event_queue.put(lambda: self.status_var.set("변환 취소됨"))
+                return
+
+            failed = job_result.failed
+            if failed:
+                raise RuntimeError("\n".join(
+                    f"{os.path.basename(r.input_path)}: {r.message}" for r in failed))
+
+            if job_result.merge_error:
+                raise RuntimeError(f"파일은 변환했지만 병합하지 못했습니다: {job_result.merge_error}")
+
+            pdf_files = job_result.outputs
+            if job_result.merged_path:
+                merged_path = job_result.merged_path
+                self.event_queue.put(lambda: messagebox.showinfo(
                     "완료", f"모든 파일 변환 및 병합이 완료되었습니다!\n\n출력 파일: {merged_path}"))
             elif len(pdf_files) == 1:
-                self.root.after(0, lambda: messagebox.showinfo(
+                self.event_queue.put(lambda: messagebox.showinfo(
                     "완료", f"변환이 완료되었습니다!\n\n출력 파일: {pdf_files[0]}"))
 
-            self.root.after(0, lambda: self.status_var.set("변환 완료"))
-        except subprocess.TimeoutExpired:
-            self.log_message("✗ 변환 시간 초과 (120초)")
-            self.root.after(0, lambda: messagebox.showerror(
-                "시간 초과", "변환 시간이 120초를 초과했습니다."))
-            self.root.after(0, lambda: self.status_var.set("변환 시간 초과"))
+            self.event_queue.put(lambda: self.status_var.set("변환 완료"))
         except Exception as e:
             self.log_message(f"✗ 예외 발생: {str(e)}")
-            self.root.after(0, lambda: messagebox.showerror(
-                "오류", f"예기치 않은 오류가 발생했습니다:\n{str(e)}"))
-            self.root.after(0, lambda: self.status_var.set("변환 오류"))
-            
+            message = str(e)
+            self.event_queue.put(lambda: self.status_var.set("변환 오류"))
+            self.event_queue.put(lambda: messagebox.showerror(
+                "오류", f"예기치 않은 오류가 발생했습니다:\n{message}"))
+
         finally:
-            # UI 상태 복원
-            self.root.after(0, self.reset_ui)
+            # UI 상태 복원 (남은 진행 이벤트를 표시한 뒤)
+            self.event_queue.put(self.reset_ui)
     
+    def format_event(self, event):
+        """엔진 이벤트를 로그 한 줄로 변환 (표시할 것이 없으면 None)"""
+        if event.kind == "file_done":
+            return self.format_result(event.result)
+        if event.kind == "merge_start":
+            self.progress["value"] = 100
+            self.status_var.set("PDF 병합 중...")
+        return event.message or None
+
+    def format_result(self, result):
+        """파일별 변환 결과 로그 문자열"""
+        name = os.path.basename(result.input_path)
+        if result.resumed:
+            return f"  ✓ 이전 출력 사용: {name}"
+        elif result.cached:
+            return f"  ✓ 캐시 사용: {name}"
+        elif result.passthrough:
+            return f"  ✓ PDF 그대로 사용: {name}"
+        elif result.ok:
+            return f"  ✓ 변환 성공: {name} ({result.elapsed:.1f}초)"
+        elif result.status in ("skipped", "cancelled"):
+            return f"  ✗ {name}: {result.message}"
+        else:
+            return f"  ✗ 변환 실패: {name}: {result.message}"
+
     def reset_ui(self):
         """UI 상태 복원"""
-        self.progress.stop()
+        self.cancel_token = None
+        self.pause_button.configure(state='disabled', text="일시 정지")
+        self.cancel_button.configure(state='disabled')
         self.convert_button.configure(state='normal')
 
     def apply_theme(self):
@@ -422,10 +821,31 @@ class PS2PDFConverter:
         self.style.map("TCombobox", fieldbackground=[("readonly", entry_bg)])
         self.style.configure("TSpinbox", fieldbackground=entry_bg, foreground=fg, arrowsize=12)
 
+def mark_startup(name, root=None):
+    """시작 단계 시각 기록. PS2PDF_STARTUP_PROBE가 있으면 'ready'에서 결과를 저장하고 종료"""
+    if not STARTUP_PROBE or name in _startup_marks:
+        return
+    _startup_marks[name] = time.perf_counter() - _IMPORT_STARTED
+    if name != "ready":
+        return
+    t0 = os.environ.get("PS2PDF_STARTUP_T0")
+    # 프로세스 시작부터 모듈 로딩 시작까지 (인터프리터 시작, onefile 압축 해제 등)
+    launch = (_startup_origin + _IMPORT_STARTED) - float(t0) if t0 else None
+    result = {"launch": launch, **_startup_marks}
+    try:
+        with open(STARTUP_PROBE, "w", encoding="utf-8") as fh:
+            json.dump(result, fh)
+    finally:
+        if root is not None:
+            root.after(0, root.destroy)
+
+
 def main():
     """메인 함수"""
     root = tk.Tk()
     app = PS2PDFConverter(root)
+    # 메인 루프가 돌기 시작하면 첫 창이 표시된 것으로 봄
+    root.after(0, lambda: mark_startup("first_window"))
     
     # 아이콘 설정 시도 (실패해도 계속 진행)
     try:
@@ -437,4 +857,6 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # 실행 파일로 묶였을 때 SVG/EPS 작업 프로세스(spawn)가 프로그램을 다시 띄우지 않도록
+    multiprocessing.freeze_support()
     main()
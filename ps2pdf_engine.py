@@ -0,0 +1,1234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PS2PDF 변환 엔진
+GUI 없이 동작하는 변환 엔진: 작업 명세(ConversionJob)를 받아
+작업자 풀에서 동시에 PDF로 변환하고 결과와 이벤트를 돌려줌
+"""
+
+import collections
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+# 서드파티 라이브러리(cairosvg, PIL, PyPDF2)는 시작 시간을 줄이기 위해
+# 처음 필요한 작업에서 가져옴
+
+from cancellation import CancelToken, kill_process_tree, process_group_kwargs
+from conversion_cache import ConversionCache, file_digest
+from formats import detect_format, open_stream, output_stem, STREAM_CHUNK
+from gs_discovery import discover, cached_info
+from gs_interpreter import GhostscriptInterpreter, supports_resident, DEFAULT_MAX_JOBS, END_PAGE_PROC, PAGE_MARKER
+from progress import ProgressTracker
+from render_pool import shared_pool
+from ps_dsc import load_index, header_page_count, page_ranges, parse_page_spec, write_pages, write_page_range
+from tracing import NULL_TRACER
+
+# PDF 품질 매핑 (Ghostscript 전용)
+QUALITY_SETTINGS = {
+    "화면(저화질)": ["-dPDFSETTINGS=/screen"],
+    "전자책(보통)": ["-dPDFSETTINGS=/ebook"],
+    "프린터(고화질)": ["-dPDFSETTINGS=/printer"],
+    "인쇄소(최고)": ["-dPDFSETTINGS=/prepress"]
+}
+DEFAULT_QUALITY = "전자책(보통)"
+
+# CLI 등에서 쓰는 영문 프리셋 이름 → 품질 라벨
+PRESETS = {
+    "screen": "화면(저화질)",
+    "ebook": "전자책(보통)",
+    "printer": "프린터(고화질)",
+    "prepress": "인쇄소(최고)"
+}
+
+# 확장자 → 변환 백엔드 이름 (추적/지표 라벨). EPS는 Ghostscript가 없을 때만 Pillow
+BACKENDS = {".ps": "ghostscript", ".svg": "cairosvg", ".eps": "ghostscript", ".pdf": "passthrough"}
+
+# 병합 결과 파일 이름
+MERGED_NAME = "merged_output.pdf"
+
+# 입력에 이전 병합 PDF가 섞여 있을 때 (와일드카드, 출력 폴더를 입력 폴더로 사용)
+MERGED_INPUT_MESSAGE = "이번에 만들 병합 PDF와 같은 파일이므로 제외"
+
+# Ghostscript 1회 실행 제한 시간 (초): 기본값 + 입력 MB당 + 페이지당, 최대값으로 제한
+TIMEOUT_BASE = 30
+TIMEOUT_PER_MB = 20
+TIMEOUT_PER_PAGE = 3
+TIMEOUT_MAX = 4 * 3600
+
+# 압축 입력은 풀린 크기를 미리 알 수 없으므로 압축 크기의 이 배수로 어림해 제한 시간 계산
+COMPRESSED_SIZE_FACTOR = 4
+
+# 페이지 분할 변환 시 구간당 최소 페이지 수
+MIN_PAGES_PER_CHUNK = 4
+
+# 바로 병합할 때 Ghostscript 1회 실행에 넣는 최소 파일 수 (이보다 적으면 나눠 돌리지 않음)
+MIN_FILES_PER_GROUP = 4
+
+# Ghostscript 명령줄에 입력 경로를 직접 넣을 최대 길이 (넘으면 @응답 파일 사용)
+GS_MAX_ARGS_CHARS = 24000
+
+# 페이지마다 표시 줄을 출력하도록 입력 앞에서 실행하는 PostScript
+# (Ghostscript 자체의 "Page N" 줄은 PDF 입력에서만 나오므로 PS/EPS 진행률에 쓸 수 없음)
+GS_PAGE_HOOK = ["-c", f"<< /EndPage {END_PAGE_PROC} >> setpagedevice", "-f"]
+
+
+def default_workers():
+    """기본 동시 작업 수 (CPU 코어 수)"""
+    return os.cpu_count() or 1
+
+
+def backend_name(ext, gs_command):
+    """실제로 쓰일 변환 백엔드 이름 (추적/지표 라벨, 캐시 키)"""
+    if ext == ".eps" and not gs_command:
+        return "pillow"
+    return BACKENDS.get(ext, "none")
+
+
+def format_bytes(size):
+    """로그용 크기 문자열"""
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    return f"{size / 1024:.1f} KB"
+
+
+def preset_name(quality):
+    """품질 라벨 → 영문 프리셋 이름 (지표 라벨용, 없으면 라벨 그대로)"""
+    for name, label in PRESETS.items():
+        if label == quality:
+            return name
+    return quality
+
+
+@dataclass
+class FileResult:
+    """파일 하나의 변환 결과"""
+    index: int
+    input_path: str
+    output_path: str
+    status: str = "pending"  # ok / skipped / failed
+    message: str = ""
+    elapsed: float = 0.0
+    cached: bool = False
+    passthrough: bool = False  # 입력이 이미 PDF라 변환 없이 그대로 병합에 사용 (output_path = input_path)
+    resumed: bool = False      # 이어서 변환할 때 이전 작업의 출력을 확인하고 그대로 사용
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+    @property
+    def cancelled(self):
+        return self.status == "cancelled"
+
+
+def find_ghostscript():
+    """Ghostscript 실행 파일 경로 (없으면 None, 탐색 결과는 gs_discovery가 캐시)"""
+    info = discover()
+    return info.command if info else None
+
+
+@lru_cache(maxsize=None)
+def gs_version(gs_command):
+    """Ghostscript 버전 문자열 (확인 실패 시 빈 문자열)"""
+    if not gs_command:
+        return ""
+    info = cached_info()
+    if info is not None and info.command == gs_command and info.version:
+        return info.version
+    try:
+        proc = subprocess.run([gs_command, "--version"], capture_output=True, text=True, timeout=5)
+        return proc.stdout.strip()
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+
+
+def detect_extension(in_file):
+    """파일 내용으로 판별한 대표 확장자 (.ps / .eps / .svg / .pdf, 압축 파일은 안쪽 형식, 모르면 "")"""
+    fmt = detect_format(in_file)
+    return fmt.ext if fmt is not None else ""
+
+
+def same_path(a, b):
+    """두 경로가 같은 파일을 가리키는지 (대소문자를 구분하지 않는 파일 시스템 포함, 파일이 없어도 됨)"""
+    return os.path.normcase(os.path.abspath(a)) == os.path.normcase(os.path.abspath(b))
+
+
+def plan_outputs(input_paths, output_dir, reserved=()):
+    """입력 순서대로 출력 PDF 경로 결정 (같은 이름이 겹치면 번호를 붙임)
+
+    reserved에 든 파일 이름(병합 PDF 등)은 출력으로 쓰지 않는다.
+    """
+    used = {name.lower() for name in reserved}
+    outputs = []
+    for in_file in input_paths:
+        base_name = output_stem(in_file)
+        candidate = f"{base_name}.pdf"
+        n = 2
+        while candidate.lower() in used:
+            candidate = f"{base_name}_{n}.pdf"
+            n += 1
+        used.add(candidate.lower())
+        outputs.append(os.path.join(output_dir, candidate))
+    return outputs
+
+
+def gs_device_args(resolution, quality, gs_args=()):
+    """pdfwrite 장치/해상도/품질 인자 (gs_args: 성능 프로필의 메모리/스레드 인자)"""
+    return [
+        "-sDEVICE=pdfwrite",
+        f"-r{resolution}",
+        *QUALITY_SETTINGS.get(quality, QUALITY_SETTINGS[DEFAULT_QUALITY]),
+        *gs_args
+    ]
+
+
+def build_gs_command(gs_command, in_file, out_pdf, resolution, quality, extra=(), gs_args=()):
+    """Ghostscript pdfwrite 명령 구성 (extra는 출력 파일 앞에 붙는 추가 인자)
+
+    in_file에 경로 목록을 주면 모든 입력을 차례로 해석해 PDF 하나로 만든다.
+    입력 앞에 EndPage 훅을 넣어 페이지마다 진행 표시 줄이 나오게 한다 (run_gs가 읽음).
+    """
+    inputs = [in_file] if isinstance(in_file, str) else list(in_file)
+    return [
+        gs_command,
+        "-dNOPAUSE",
+        "-dBATCH",
+        "-dSAFER",
+        *gs_device_args(resolution, quality, gs_args),
+        *extra,
+        f"-sOutputFile={out_pdf}",
+        *GS_PAGE_HOOK,
+        *inputs
+    ]
+
+
+def gs_input_args(paths, arg_file):
+    """Ghostscript 입력 인자 (명령줄이 너무 길면 arg_file에 적어 @응답 파일로 넘김, Windows 명령줄은 32K자 제한)"""
+    if sum(len(p) + 3 for p in paths) <= GS_MAX_ARGS_CHARS:
+        return list(paths)
+    with open(arg_file, "w", encoding="utf-8") as fh:
+        for path in paths:
+            # Ghostscript 응답 파일은 공백으로 나누므로 따옴표로 감싸고 / 구분자 사용
+            fh.write('"' + os.path.abspath(path).replace("\\", "/") + '"\n')
+    return ["@" + arg_file]
+
+
+def split_groups(sizes, groups):
+    """입력 순서를 유지한 채 크기 합이 비슷한 연속 구간 [(첫, 끝+1), ...]으로 나눔"""
+    groups = max(1, min(groups, len(sizes)))
+    weights = sizes if sum(sizes) else [1] * len(sizes)
+    total = sum(weights)
+    bounds = []
+    start = acc = 0
+    for i, weight in enumerate(weights[:-1]):
+        acc += weight
+        left = groups - len(bounds) - 1
+        remaining = len(weights) - (i + 1)
+        # 목표 크기에 도달하면 끊되, 남은 구간마다 파일이 하나 이상 남도록 함
+        if left and remaining >= left and (acc >= total * (len(bounds) + 1) / groups or remaining == left):
+            bounds.append((start, i + 1))
+            start = i + 1
+    bounds.append((start, len(weights)))
+    return bounds
+
+
+def remove_stale_output(out_pdf):
+    """기존 출력 삭제 (캐시 파일과 하드링크되어 있을 수 있으므로 덮어쓰지 않음)"""
+    if os.path.exists(out_pdf):
+        os.remove(out_pdf)
+
+
+def discard_output(out_pdf):
+    """실패/취소로 덜 쓰인 출력 삭제"""
+    try:
+        remove_stale_output(out_pdf)
+    except OSError:
+        pass
+
+
+def gs_timeout(size, pages=None):
+    """입력 크기(바이트)와 페이지 수에 비례한 Ghostscript 제한 시간 (초)"""
+    seconds = TIMEOUT_BASE + TIMEOUT_PER_MB * size / (1024 * 1024) + TIMEOUT_PER_PAGE * (pages or 0)
+    return min(TIMEOUT_MAX, seconds)
+
+
+def ps_timeout(in_file):
+    """PS 파일 전체 변환의 제한 시간 (%%Pages: 주석이 있으면 페이지 수 반영)"""
+    try:
+        size = os.path.getsize(in_file)
+    except OSError:
+        size = 0
+    fmt = detect_format(in_file)
+    if fmt is not None and fmt.compressed:
+        size *= COMPRESSED_SIZE_FACTOR
+    return gs_timeout(size, header_page_count(in_file))
+
+
+def run_gs(cmd, on_page=None, timeout=TIMEOUT_BASE, cancel=None, stdin=None, stdout=None):
+    """Ghostscript 실행 (실패 시 RuntimeError, 시간 초과 시 subprocess.TimeoutExpired,
+    취소 시 ConversionCancelled)
+
+    출력을 실행 중에 읽어 EndPage 훅(build_gs_command)의 표시 줄마다 on_page(N)을 호출한다
+    (N은 이번 실행에서 끝낸 페이지 수, 여러 입력을 넣으면 입력을 넘어 이어서 셈).
+    stdin(이진 스트림)을 주면 별도 스레드에서 Ghostscript 표준 입력으로 흘려 넣는다 (입력 파일 "-").
+    stdout(쓰기 가능한 이진 스트림)을 주면 표준 출력(-sOutputFile=-)을 조각 단위로 그대로 옮겨 쓰고,
+    메시지는 표준 오류에서 읽는다 (명령에 -sstdout=%stderr 필요).
+    """
+    if cancel is not None:
+        cancel.check()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE if stdout is not None else subprocess.STDOUT,
+                            stdin=subprocess.PIPE if stdin is not None else None,
+                            **process_group_kwargs())
+    if cancel is not None:
+        cancel.register(proc)
+    feed_errors = []
+    feeder = None
+    copier = None
+    if stdout is not None:
+        def copy():
+            try:
+                for block in iter(lambda: proc.stdout.read(STREAM_CHUNK), b""):
+                    stdout.write(block)
+            except Exception as e:
+                # 받는 쪽이 끊기면 더 만들 필요가 없으므로 바로 종료
+                feed_errors.append(e)
+                kill_process_tree(proc)
+
+        copier = threading.Thread(target=copy, name="ps2pdf-stdout", daemon=True)
+        copier.start()
+    if stdin is not None:
+        def feed():
+            try:
+                for block in iter(lambda: stdin.read(STREAM_CHUNK), b""):
+                    proc.stdin.write(block)
+            except BrokenPipeError:
+                # Ghostscript가 먼저 끝남 (오류/취소/시간 초과), 종료 코드로 판단
+                pass
+            except Exception as e:
+                # 손상된 압축 파일 등: 잘린 입력으로 만든 PDF를 성공으로 치지 않도록 기록
+                feed_errors.append(e)
+            finally:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+
+        feeder = threading.Thread(target=feed, name="ps2pdf-stdin", daemon=True)
+        feeder.start()
+    # 출력이 멈춘 채로 걸려 있어도 제한 시간이 지나면 종료
+    timed_out = threading.Event()
+
+    def expire():
+        timed_out.set()
+        kill_process_tree(proc)
+
+    timer = threading.Timer(timeout, expire)
+    timer.daemon = True
+    timer.start()
+    tail = collections.deque(maxlen=50)
+    messages = proc.stderr if stdout is not None else proc.stdout
+    pages = 0
+    try:
+        for raw in iter(messages.readline, b""):
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            if line == PAGE_MARKER:
+                pages += 1
+                if on_page:
+                    on_page(pages)
+            else:
+                tail.append(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            kill_process_tree(proc)
+            proc.wait()
+        if copier is not None:
+            copier.join()
+        proc.stdout.close()
+        if proc.stderr is not None:
+            proc.stderr.close()
+        if cancel is not None:
+            cancel.unregister(proc)
+        if feeder is not None:
+            feeder.join()
+    if cancel is not None:
+        cancel.check()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if returncode != 0:
+        raise RuntimeError("\n".join(tail).strip() or "Ghostscript 오류")
+    if feed_errors:
+        raise RuntimeError(f"입출력 스트림 오류: {feed_errors[0]}")
+
+
+def count_pages(in_file, pages=None):
+    """진행률 표시용 PS 페이지 수 (%%Pages: 주석, 없으면 %%Page: 수, 모르면 None)
+
+    pages(페이지 범위 문자열)를 주면 그중 실제로 변환할 페이지 수
+    """
+    fmt = detect_format(in_file)
+    if fmt is not None and fmt.compressed:
+        # 압축 파일은 풀어 보기 전에는 알 수 없음
+        return None
+    if pages:
+        index = load_index(in_file)
+        if index is None:
+            return None
+        try:
+            return sum(last - first for first, last in parse_page_spec(pages, index.page_count))
+        except ValueError:
+            return None
+    total = header_page_count(in_file)
+    if total is None:
+        index = load_index(in_file)
+        total = index.page_count if index is not None else None
+    return total
+
+
+def select_pages(in_file, pages, tmp_dir):
+    """페이지 범위만 변환하기 위한 (입력 파일, 추가 Ghostscript 인자)
+
+    DSC 색인이 있으면 선택한 페이지만 뽑은 PS 파일을 tmp_dir에 만들어 해석할 양 자체를 줄이고,
+    DSC 규격이 아니면 Ghostscript -sPageList로 출력할 페이지만 고른다 (ValueError: 형식 오류).
+    """
+    index = load_index(in_file)
+    if index is None:
+        parse_page_spec(pages)
+        return in_file, [f"-sPageList={pages.replace(' ', '')}"]
+    ranges = parse_page_spec(pages, index.page_count)
+    return write_pages(index, ranges, os.path.join(tmp_dir, "pages.ps")), []
+
+
+def convert_ps_split(in_file, out_pdf, gs_command, resolution, quality, chunks, log, on_page=None,
+                     timeout=None, cancel=None, tracer=None, gs_args=()):
+    """DSC %%Page: 기준으로 나눈 구간을 동시에 변환한 뒤 순서대로 이어 붙임
+
+    DSC 규격이 아니거나 페이지가 적으면 False를 반환 (전체 파일 변환으로 대체)
+    timeout이 None이면 구간마다 크기/페이지 수로 제한 시간을 정함
+    """
+    index = load_index(in_file)
+    if index is None or index.page_count < 2 * MIN_PAGES_PER_CHUNK:
+        return False
+    ranges = page_ranges(index.page_count, chunks, MIN_PAGES_PER_CHUNK)
+    if len(ranges) < 2:
+        return False
+
+    log(f"  페이지 분할 변환: {index.page_count}페이지 → {len(ranges)}개 구간")
+    with tempfile.TemporaryDirectory(prefix="ps2pdf_") as tmp_dir:
+        chunk_pdfs = []
+        commands = []
+        for n, (first, last) in enumerate(ranges):
+            chunk_ps = write_page_range(index, first, last, os.path.join(tmp_dir, f"chunk{n:04d}.ps"))
+            chunk_pdf = os.path.join(tmp_dir, f"chunk{n:04d}.pdf")
+            chunk_pdfs.append(chunk_pdf)
+            chunk_timeout = timeout or gs_timeout(os.path.getsize(chunk_ps), last - first)
+            commands.append((build_gs_command(gs_command, chunk_ps, chunk_pdf, resolution, quality,
+                                              gs_args=gs_args),
+                             chunk_timeout))
+
+        with ThreadPoolExecutor(max_workers=len(commands), thread_name_prefix="ps2pdf-chunk") as executor:
+            list(executor.map(lambda c: run_gs(c[0], on_page, c[1], cancel), commands))
+
+        from pdf_merge import merge_pdfs
+        merge_pdfs(chunk_pdfs, out_pdf)
+    return True
+
+
+def run_gs_file(gs_command, src, out_pdf, resolution, quality, extra, compression, on_page, limit, cancel,
+                log, gs_args=()):
+    """입력 파일 하나를 Ghostscript 개별 실행으로 변환 (압축 파일은 풀면서 표준 입력으로 넘김)"""
+    if compression:
+        cmd = build_gs_command(gs_command, "-", out_pdf, resolution, quality, extra, gs_args)
+        log(f"  실행: {' '.join(cmd)} < {os.path.basename(src)}")
+        with open_stream(src, compression) as stream:
+            run_gs(cmd, on_page, limit, cancel, stdin=stream)
+    else:
+        cmd = build_gs_command(gs_command, src, out_pdf, resolution, quality, extra, gs_args)
+        log(f"  실행: {' '.join(cmd)}")
+        run_gs(cmd, on_page, limit, cancel)
+
+
+def compare_eps_raster(in_file, compression, resolution, vector_bytes, vector_seconds, limit, cancel, log):
+    """같은 EPS를 Pillow 래스터로도 변환해 벡터 변환과 크기/시간을 비교한 결과를 로그로 남김"""
+    with tempfile.TemporaryDirectory(prefix="ps2pdf_") as tmp_dir:
+        raster_pdf = os.path.join(tmp_dir, "raster.pdf")
+        started = time.perf_counter()
+        try:
+            shared_pool().render("eps", in_file, raster_pdf, compression, resolution, limit, cancel)
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            log(f"  EPS 비교: Pillow 래스터 변환 실패 ({e})")
+            return
+        raster_seconds = time.perf_counter() - started
+        raster_bytes = os.path.getsize(raster_pdf)
+    log(f"  EPS 비교: 벡터 {format_bytes(vector_bytes)}, {vector_seconds:.2f}초 / "
+        f"Pillow 래스터({resolution} DPI) {format_bytes(raster_bytes)}, {raster_seconds:.2f}초 → "
+        f"크기 {raster_bytes / max(1, vector_bytes):.1f}배, 시간 {raster_seconds / max(vector_seconds, 1e-6):.1f}배 차이")
+
+
+def convert_one(result, gs_command, resolution, quality, log=None, chunks=1, interpreter=None,
+                on_page=None, timeout=None, cancel=None, pages=None, compare_eps=False, gs_args=()):
+    """파일 하나를 변환하고 결과를 채워 반환
+
+    chunks > 1 이면 여러 페이지로 된 PS 파일을 최대 chunks 개의 Ghostscript로 나눠 변환
+    interpreter(GhostscriptInterpreter)를 주면 통째 변환을 상주 gs에서 실행
+    on_page는 Ghostscript가 페이지를 하나 끝낼 때마다 호출됨 (작업자 스레드)
+    timeout은 Ghostscript 제한 시간 (초, None이면 입력 크기/페이지 수로 결정)
+    cancel(CancelToken)이 취소되면 실행 중인 Ghostscript를 종료하고 출력을 지움
+    pages는 PS 파일에서 변환할 페이지 범위 ("1-3,7,10-", None이면 전체)
+    compare_eps면 EPS를 Pillow 래스터로도 변환해 벡터 변환과의 크기/시간 차이를 로그로 남김
+    gs_args는 Ghostscript 실행마다 붙는 성능 프로필 인자 (메모리/스레드)
+    """
+    log = log or (lambda message: None)
+    in_file = result.input_path
+    out_pdf = result.output_path
+    started = time.perf_counter()
+    limit = timeout
+    try:
+        fmt = detect_format(in_file)
+        ext = fmt.ext if fmt is not None else ""
+        compression = fmt.compression if fmt is not None else None
+
+        if ext == ".ps":
+            if not gs_command:
+                result.status = "skipped"
+                result.message = "Ghostscript가 없어 PS 변환 불가: 스킵"
+                return result
+            remove_stale_output(out_pdf)
+            # Ghostscript 사용
+            with tempfile.TemporaryDirectory(prefix="ps2pdf_") if pages else nullcontext() as tmp_dir:
+                src, extra = in_file, []
+                if pages:
+                    src, extra = select_pages(in_file, pages, tmp_dir)
+                    log(f"  페이지 범위 {pages}: " + ("선택한 페이지만 추출" if src != in_file
+                                                     else "Ghostscript PageList 사용"))
+                    # 상주 gs는 입력 폴더만 읽을 수 있고 PageList도 받지 않으므로 개별 실행
+                    interpreter = None
+                if compression:
+                    # 압축 파일은 임시 파일 없이 풀면서 Ghostscript 표준 입력으로 넘김
+                    log(f"  {compression} 압축 입력을 풀면서 변환")
+                    interpreter = None
+                if not (chunks > 1 and not extra and not compression and convert_ps_split(src, out_pdf, gs_command,
+                                                                      resolution, quality, chunks, log,
+                                                                      on_page, timeout, cancel,
+                                                                      gs_args=gs_args)):
+                    limit = timeout or ps_timeout(src)
+                    converted = False
+                    if interpreter is not None:
+                        try:
+                            interpreter.convert(src, out_pdf, limit, on_page=on_page, cancel=cancel)
+                            converted = True
+                        except RuntimeError as e:
+                            if cancel is not None:
+                                cancel.check()
+                            # 인터프리터는 이미 재시작 대기 상태. 개별 실행으로 한 번 더 시도
+                            log(f"  상주 Ghostscript 실패, 개별 실행으로 재시도: {e}")
+                            remove_stale_output(out_pdf)
+                    if not converted:
+                        run_gs_file(gs_command, src, out_pdf, resolution, quality, extra, compression,
+                                    on_page, limit, cancel, log, gs_args)
+        elif ext == ".eps" and gs_command:
+            remove_stale_output(out_pdf)
+            # Ghostscript pdfwrite로 벡터 그대로 변환 (-dEPSCrop: 페이지를 바운딩 박스에 맞춤)
+            limit = timeout or ps_timeout(in_file)
+            eps_started = time.perf_counter()
+            run_gs_file(gs_command, in_file, out_pdf, resolution, quality, ["-dEPSCrop"], compression,
+                        on_page, limit, cancel, log, gs_args)
+            vector_seconds = time.perf_counter() - eps_started
+            vector_bytes = os.path.getsize(out_pdf)
+            log(f"  벡터 EPS 변환: {format_bytes(vector_bytes)}, {vector_seconds:.2f}초")
+            if compare_eps:
+                compare_eps_raster(in_file, compression, resolution, vector_bytes, vector_seconds,
+                                   limit, cancel, log)
+        elif ext in (".svg", ".eps"):
+            remove_stale_output(out_pdf)
+            # CairoSVG / Pillow 사용 (EPS는 Ghostscript가 없을 때만 Pillow로 래스터 변환).
+            # GIL을 오래 잡으므로 상주 작업 프로세스에서 실행하고, 입력은 경로로만 넘김
+            if ext == ".eps":
+                log("  Ghostscript가 없어 Pillow로 EPS를 래스터 변환합니다 (벡터가 유지되지 않음)")
+            limit = timeout or gs_timeout(os.path.getsize(in_file) * (COMPRESSED_SIZE_FACTOR if compression else 1))
+            shared_pool().render(fmt.name, in_file, out_pdf, compression, resolution, limit, cancel)
+        elif ext == ".pdf":
+            if compression:
+                # 압축된 PDF는 풀어서 출력 폴더에 저장
+                remove_stale_output(out_pdf)
+                with open_stream(in_file, compression) as src, open(out_pdf, "wb") as dst:
+                    for block in iter(lambda: src.read(STREAM_CHUNK), b""):
+                        dst.write(block)
+            else:
+                # 이미 PDF면 변환/복사 없이 원본을 그대로 병합 단계로 넘김
+                result.output_path = in_file
+                result.passthrough = True
+                result.message = "PDF 그대로 사용"
+        else:
+            result.status = "skipped"
+            result.message = "지원되지 않는 형식 (PS/EPS/SVG/PDF가 아님)"
+            return result
+
+        result.status = "ok"
+    except subprocess.TimeoutExpired as e:
+        result.status = "failed"
+        result.message = f"변환 시간 초과 ({limit or e.timeout:.0f}초)"
+        discard_output(out_pdf)
+    except Exception as e:
+        if cancel is not None and cancel.cancelled:
+            result.status = "cancelled"
+            result.message = "취소됨"
+        else:
+            result.status = "failed"
+            result.message = str(e)
+        discard_output(out_pdf)
+    finally:
+        result.elapsed = time.perf_counter() - started
+    return result
+
+
+class ConversionPool:
+    """Ghostscript/CairoSVG/Pillow 변환을 N개 작업자로 동시에 실행"""
+
+    def __init__(self, gs_command, resolution="300", quality=DEFAULT_QUALITY, workers=None,
+                 split_pages=True, cache=None, persistent=False, max_jobs=DEFAULT_MAX_JOBS,
+                 timeout=None, cancel=None, tracer=None, pages=None, compare_eps=False, gs_args=()):
+        self.gs_command = gs_command
+        self.resolution = resolution
+        self.quality = quality
+        self.workers = max(1, int(workers or default_workers()))
+        # 파일 수가 작업자 수보다 적으면 남는 작업자로 큰 PS 파일을 페이지 단위로 분할
+        self.split_pages = split_pages
+        # ConversionCache (None이면 캐시 사용 안 함)
+        self.cache = cache
+        # 작업자마다 상주 Ghostscript를 띄워 재사용 (max_jobs번 변환 후 재시작)
+        self.persistent = persistent
+        self.max_jobs = max_jobs
+        # Ghostscript 제한 시간 (초, None이면 입력 크기/페이지 수로 결정)
+        self.timeout = timeout
+        self.cancel = cancel or CancelToken()
+        # 단계별 시간 기록 (tracing.Tracer)
+        self.tracer = tracer or NULL_TRACER
+        # PS 파일에서 변환할 페이지 범위 ("1-3,7,10-", None이면 전체)
+        self.pages = pages
+        # EPS를 Pillow 래스터로도 변환해 벡터 변환과 크기/시간 비교 (로그)
+        self.compare_eps = compare_eps
+        # 성능 프로필의 Ghostscript 메모리/스레드 인자 (출력 내용은 같으므로 캐시 키에는 넣지 않음)
+        self.gs_args = list(gs_args)
+
+    def cache_params(self, in_file):
+        """캐시 키에 들어가는 실제 변환 옵션"""
+        ext = detect_extension(in_file)
+        params = {"ext": ext, "resolution": str(self.resolution)}
+        if ext == ".eps":
+            # Ghostscript 벡터 변환과 Pillow 래스터 변환은 결과가 다름
+            params["backend"] = backend_name(ext, self.gs_command)
+        if backend_name(ext, self.gs_command) == "ghostscript":
+            params["quality"] = QUALITY_SETTINGS.get(self.quality, QUALITY_SETTINGS[DEFAULT_QUALITY])
+            params["gs_version"] = gs_version(self.gs_command)
+            if self.pages and ext == ".ps":
+                params["pages"] = self.pages.replace(" ", "")
+        return params
+
+    def convert(self, result, chunks=1, log=None, interpreter=None, on_page=None):
+        """캐시를 확인한 뒤 필요할 때만 변환 (단계마다 시간 기록)"""
+        tracer = self.tracer
+        in_file = result.input_path
+        with tracer.span("sniff", in_file) as span:
+            ext = detect_extension(in_file)
+            span["ext"] = ext
+        labels = {"backend": backend_name(ext, self.gs_command), "preset": preset_name(self.quality)}
+
+        key = None
+        # PDF는 그대로 쓰거나 압축만 풀면 되므로 캐시하지 않음
+        if self.cache is not None and ext != ".pdf":
+            with tracer.span("cache_lookup", in_file, **labels) as span:
+                try:
+                    key = self.cache.key(in_file, self.cache_params(in_file))
+                    if self.cache.fetch(key, result.output_path):
+                        result.status = "ok"
+                        result.cached = True
+                except OSError as e:
+                    key = None
+                    span["status"] = "error"
+                    if log:
+                        log(f"  캐시 확인 실패: {e}")
+                span["hit"] = result.cached
+            tracer.count("ps2pdf_cache_requests_total", {"result": "hit" if result.cached else "miss"},
+                         help_text="캐시 확인 횟수 (적중/미적중)")
+            if result.cached:
+                tracer.count("ps2pdf_files_total", dict(labels, status="cached"), help_text="처리한 파일 수")
+                return result
+
+        with tracer.span("convert", in_file, **labels) as span:
+            convert_one(result, self.gs_command, self.resolution, self.quality, log=log, chunks=chunks,
+                        interpreter=interpreter, on_page=on_page, timeout=self.timeout, cancel=self.cancel,
+                        pages=self.pages, compare_eps=self.compare_eps, gs_args=self.gs_args)
+            span["status"] = result.status
+            span["chunks"] = chunks
+            if result.ok and os.path.exists(result.output_path):
+                span["output_bytes"] = os.path.getsize(result.output_path)
+        tracer.count("ps2pdf_files_total", dict(labels, status=result.status), help_text="처리한 파일 수")
+
+        if key is not None and result.ok:
+            with tracer.span("cache_store", in_file, **labels) as span:
+                try:
+                    self.cache.store(key, result.output_path)
+                except OSError as e:
+                    span["status"] = "error"
+                    if log:
+                        log(f"  캐시 저장 실패: {e}")
+        return result
+
+    def run(self, input_paths, output_dir, on_start=None, on_result=None, log=None,
+            on_progress=None, outputs=None):
+        """입력 순서를 유지한 FileResult 목록 반환
+
+        on_start/on_result/on_progress 콜백은 작업자 스레드에서 호출되므로
+        GUI에서는 메인 스레드로 넘겨서 처리해야 한다.
+        outputs를 주면 출력 경로를 새로 정하지 않고 그대로 사용 (이어서 변환할 때)
+        """
+        outputs = outputs or plan_outputs(input_paths, output_dir)
+        results = [FileResult(i, in_file, out_pdf)
+                   for i, (in_file, out_pdf) in enumerate(zip(input_paths, outputs))]
+        lock = threading.Lock()
+        # 파일당 Ghostscript 수: 전체 동시 실행 수가 workers를 넘지 않도록 배분
+        chunks = max(1, self.workers // max(1, len(results))) if self.split_pages else 1
+
+        # 상주 Ghostscript: 작업자 스레드마다 하나씩 (지원되지 않으면 개별 실행)
+        interpreters = []
+        local = threading.local()
+        persistent = self.persistent and bool(self.gs_command)
+        if persistent and not supports_resident(gs_version(self.gs_command)):
+            persistent = False
+            if log:
+                log("상주 Ghostscript를 지원하지 않는 버전입니다. 파일마다 개별 실행합니다.")
+        read_dirs = {os.path.dirname(os.path.abspath(p)) for p in input_paths}
+
+        sizes = []
+        for in_file in input_paths:
+            try:
+                sizes.append(os.path.getsize(in_file))
+            except OSError:
+                sizes.append(0)
+        tracker = ProgressTracker(sizes, on_progress)
+
+        def get_interpreter():
+            if not persistent:
+                return None
+            interp = getattr(local, "interpreter", None)
+            if interp is None:
+                interp = GhostscriptInterpreter(
+                    self.gs_command, gs_device_args(self.resolution, self.quality, self.gs_args),
+                    read_dirs, [output_dir], max_jobs=self.max_jobs)
+                local.interpreter = interp
+                with lock:
+                    interpreters.append(interp)
+            return interp
+
+        def task(result):
+            # 일시 정지 중이면 새 파일을 시작하지 않고 대기, 취소되면 남은 파일은 건너뜀
+            self.cancel.wait_if_paused()
+            if self.cancel.cancelled:
+                result.status = "cancelled"
+                result.message = "취소됨"
+            else:
+                convert_task(result)
+            if on_result:
+                # 콜백이 동시에 호출되지 않도록 직렬화
+                with lock:
+                    on_result(result)
+            return result
+
+        def convert_task(result):
+            if on_start:
+                on_start(result)
+            pages_total = None
+            if detect_extension(result.input_path) == ".ps":
+                pages_total = count_pages(result.input_path, self.pages)
+            tracker.file_started(result.index, os.path.basename(result.input_path), pages_total)
+            self.convert(result, chunks=chunks, log=log, interpreter=get_interpreter(),
+                         on_page=lambda n: tracker.page_done(result.index))
+            tracker.file_done(result.index)
+
+        workers = min(self.workers, len(results)) or 1
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ps2pdf") as executor:
+                list(executor.map(task, results))
+        finally:
+            for interp in interpreters:
+                interp.close()
+        return results
+
+    def run_merged(self, input_paths, merged_path, on_start=None, on_result=None, log=None,
+                   on_progress=None):
+        """파일별 PDF 없이 모든 입력을 Ghostscript pdfwrite 한 번에 넣어 병합 PDF를 바로 만듦
+
+        입력이 많고 작업자가 여럿이면 입력 순서대로 몇 묶음으로 나눠 동시에 변환한 뒤 묶음 PDF만 이어 붙인다.
+        Ghostscript가 바로 읽지 못하는 입력(SVG, 압축 파일)은 먼저 임시 PDF로 변환한다.
+        (FileResult 목록, 병합 PDF 경로 또는 실패 시 None) 반환
+        """
+        log = log or (lambda message: None)
+        tracer = self.tracer
+        results = [FileResult(i, p, merged_path) for i, p in enumerate(input_paths)]
+        for r in results:
+            if same_path(r.input_path, merged_path):
+                # 이전 병합 PDF를 읽으면서 덮어쓰게 되므로 제외
+                r.status, r.message = "skipped", MERGED_INPUT_MESSAGE
+        lock = threading.Lock()
+
+        def finish(result):
+            if on_result:
+                with lock:
+                    on_result(result)
+
+        with tempfile.TemporaryDirectory(prefix="ps2pdf_") as tmp_dir:
+            sources = list(input_paths)
+            indirect = []
+            for i, path in enumerate(input_paths):
+                if results[i].status == "skipped":
+                    continue
+                fmt = detect_format(path)
+                if fmt is None or fmt.compressed or fmt.ext not in (".ps", ".eps", ".pdf"):
+                    indirect.append(i)
+            if indirect:
+                log(f"Ghostscript가 바로 읽을 수 없는 입력 {len(indirect)}개를 먼저 PDF로 변환")
+                converted = self.run([input_paths[i] for i in indirect], tmp_dir, log=log)
+                for i, r in zip(indirect, converted):
+                    if r.ok:
+                        sources[i] = r.output_path
+                    else:
+                        results[i].status = r.status
+                        results[i].message = r.message
+                # 지원되지 않는 형식(skipped)은 빼고 병합, 실패/취소가 있으면 병합하지 않음
+                if any(results[i].status in ("failed", "cancelled") for i in indirect):
+                    for r in results:
+                        if r.status == "pending":
+                            r.status = "skipped"
+                            r.message = "다른 파일이 실패하여 병합하지 않음"
+                    for r in results:
+                        finish(r)
+                    return results, None
+
+            included = [r for r in results if r.status == "pending"]
+            if not included:
+                for r in results:
+                    finish(r)
+                return results, None
+            sizes = []
+            for r in included:
+                try:
+                    sizes.append(os.path.getsize(sources[r.index]))
+                except OSError:
+                    sizes.append(0)
+            # 진행 상황은 병합에 들어가는 파일 기준 (included 안의 위치로 보고)
+            position = {r.index: k for k, r in enumerate(included)}
+            tracker = ProgressTracker(sizes, on_progress)
+            groups = split_groups(sizes, min(self.workers, max(1, len(included) // MIN_FILES_PER_GROUP)))
+            extra = ["-dEPSCrop"] if any(detect_extension(sources[r.index]) == ".eps" for r in included) else []
+            labels = {"backend": "ghostscript", "preset": preset_name(self.quality)}
+            log(f"바로 병합: 입력 {len(included)}개 → Ghostscript {len(groups)}회 실행")
+
+            def run_group(n, first, last):
+                members = included[first:last]
+                self.cancel.wait_if_paused()
+                if self.cancel.cancelled:
+                    for r in members:
+                        r.status = "cancelled"
+                        r.message = "취소됨"
+                    return None
+                out_pdf = merged_path if len(groups) == 1 else os.path.join(tmp_dir, f"part{n:04d}.pdf")
+                # 페이지 수를 아는 파일은 페이지 표시 줄 수로 어느 파일을 처리 중인지 따라감
+                totals = [count_pages(sources[r.index]) if detect_extension(sources[r.index]) == ".ps"
+                          else None for r in members]
+                current = [0]
+
+                def start(k):
+                    r = members[k]
+                    if on_start:
+                        on_start(r)
+                    tracker.file_started(position[r.index], os.path.basename(r.input_path), totals[k])
+
+                def on_page(_):
+                    k = current[0]
+                    tracker.page_done(position[members[k].index])
+                    progress = tracker.files.get(position[members[k].index])
+                    if totals[k] and progress is not None and progress.pages_done >= totals[k] \
+                            and k + 1 < len(members):
+                        tracker.file_done(position[members[k].index])
+                        current[0] = k + 1
+                        start(k + 1)
+
+                start(0)
+                limit = self.timeout or min(TIMEOUT_MAX, sum(ps_timeout(sources[r.index]) for r in members))
+                started = time.perf_counter()
+                with tracer.span("convert", merged_path, **labels) as span:
+                    span["files"] = len(members)
+                    try:
+                        inputs = gs_input_args([sources[r.index] for r in members],
+                                               os.path.join(tmp_dir, f"inputs{n:04d}.txt"))
+                        cmd = build_gs_command(self.gs_command, inputs, out_pdf,
+                                               self.resolution, self.quality, extra, self.gs_args)
+                        log(f"  실행: {' '.join(cmd)}")
+                        run_gs(cmd, on_page, limit, self.cancel)
+                        status, message = "ok", f"병합 파일에 포함 → {os.path.basename(merged_path)}"
+                    except subprocess.TimeoutExpired:
+                        status, message = "failed", f"변환 시간 초과 ({limit:.0f}초, 묶음 {n + 1})"
+                    except Exception as e:
+                        if self.cancel.cancelled:
+                            status, message = "cancelled", "취소됨"
+                        else:
+                            status, message = "failed", f"묶음 {n + 1} 변환 실패: {e}"
+                    span["status"] = status
+                elapsed = time.perf_counter() - started
+                for r in members:
+                    r.status, r.message, r.elapsed = status, message, elapsed
+                    tracker.file_done(position[r.index])
+                    tracer.count("ps2pdf_files_total", dict(labels, status=status), help_text="처리한 파일 수")
+                return out_pdf if status == "ok" else None
+
+            workers = min(self.workers, len(groups))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ps2pdf-merge") as executor:
+                futures = [executor.submit(run_group, n, first, last) for n, (first, last) in enumerate(groups)]
+                parts = [f.result() for f in futures]
+            for r in results:
+                finish(r)
+
+            if not all(parts):
+                discard_output(merged_path)
+                return results, None
+            if len(parts) > 1:
+                # 묶음 PDF는 몇 개뿐이므로 이어 붙이는 비용은 작음
+                from pdf_merge import merge_pdfs
+                try:
+                    with tracer.span("merge", merged_path, preset=preset_name(self.quality)) as span:
+                        stats = merge_pdfs(parts, merged_path)
+                        span.update(documents=stats.documents, pages=stats.pages,
+                                    output_bytes=stats.bytes_written)
+                except Exception as e:
+                    log(f"✗ 묶음 PDF 병합 실패: {e}")
+                    for r in results:
+                        r.status, r.message = "failed", f"묶음 PDF 병합 실패: {e}"
+                    return results, None
+        return results, merged_path
+
+
+@dataclass
+class ConversionJob:
+    """변환 작업 명세"""
+    inputs: list
+    output_dir: str
+    quality: str = DEFAULT_QUALITY
+    resolution: str = "300"
+    workers: int = None           # None이면 CPU 코어 수
+    split_pages: bool = True
+    use_cache: bool = True
+    persistent: bool = False      # 작업자마다 상주 Ghostscript 사용
+    merge: bool = True            # 출력이 2개 이상이면 MERGED_NAME으로 병합
+    gs_command: str = None        # None이면 PATH에서 자동 탐색
+    timeout: float = None         # Ghostscript 제한 시간 (초), None이면 입력 크기/페이지 수로 결정
+    pages: str = None             # PS 파일에서 변환할 페이지 범위 ("1-3,7,10-"), None이면 전체
+    compare_eps: bool = False     # EPS를 Pillow 래스터로도 변환해 벡터 변환과 크기/시간 비교 (로그)
+    per_file: bool = True         # False면 병합할 때 파일별 PDF 없이 Ghostscript 한 번에 바로 병합
+    optimize: bool = False        # 병합 PDF에서 같은 글꼴/이미지를 합치고 객체 스트림으로 압축
+    profile: str = None           # 성능 프로필 (throughput / low_memory / low_latency), None이면 사용 안 함
+    recalibrate: bool = False     # 저장된 성능 프로필을 쓰지 않고 다시 측정
+    outputs: list = None          # 입력별 출력 PDF 경로 (None이면 plan_outputs로 output_dir 안에 정함)
+
+
+@dataclass
+class EngineEvent:
+    """엔진이 작업 중 내보내는 이벤트
+
+    kind: log / file_start / progress / file_done / merge_start / merge_done
+    progress 이벤트에는 ProgressSnapshot이 실림
+    """
+    kind: str
+    message: str = ""
+    result: FileResult = None
+    progress: object = None
+
+
+@dataclass
+class JobResult:
+    """변환 작업 결과"""
+    results: list = field(default_factory=list)
+    merged_path: str = None
+    elapsed: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    bytes_saved: int = 0  # 병합 PDF 최적화로 줄어든 크기
+    job_id: str = None    # 작업 기록(job_journal)의 작업 ID
+    merge_error: str = None  # 파일은 변환했지만 병합에 실패한 이유
+
+    @property
+    def outputs(self):
+        """성공한 출력 PDF (입력 순서, 바로 병합했으면 병합 PDF 하나)"""
+        return list(dict.fromkeys(r.output_path for r in self.results if r.ok))
+
+    @property
+    def failed(self):
+        return [r for r in self.results if r.status == "failed"]
+
+    @property
+    def cancelled(self):
+        return [r for r in self.results if r.cancelled]
+
+    def to_dict(self):
+        """JSON 요약용 사전"""
+        return {
+            "files": [
+                {
+                    "input": r.input_path,
+                    "output": r.output_path if r.ok else None,
+                    "status": r.status,
+                    "cached": r.cached,
+                    "resumed": r.resumed,
+                    "message": r.message,
+                    "elapsed": round(r.elapsed, 3),
+                }
+                for r in self.results
+            ],
+            "converted": sum(1 for r in self.results if r.ok),
+            "failed": len(self.failed),
+            "skipped": sum(1 for r in self.results if r.status == "skipped"),
+            "cancelled": len(self.cancelled),
+            "merged": self.merged_path,
+            "merge_error": self.merge_error,
+            "job_id": self.job_id,
+            "bytes_saved": self.bytes_saved,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+
+def optimize_merged(merged_path, tracer, emit):
+    """병합 PDF의 중복 리소스 제거 (실패해도 병합 PDF는 그대로 두고 로그만 남김). 줄어든 바이트 수 반환"""
+    from pdf_optimize import optimize_pdf
+    emit(EngineEvent("log", "병합 PDF 최적화 중 (중복 글꼴/이미지 제거) ..."))
+    with tracer.span("optimize", merged_path) as span:
+        try:
+            stats = optimize_pdf(merged_path)
+        except Exception as e:
+            span["status"] = "failed"
+            emit(EngineEvent("log", f"  최적화 실패 (병합 PDF는 그대로 사용): {e}"))
+            return 0
+        span.update(objects_removed=stats.duplicates, bytes_saved=stats.bytes_saved)
+    emit(EngineEvent("log", f"  최적화: {stats.summary()}"))
+    return stats.bytes_saved
+
+
+def run_job(job, on_event=None, cache=None, cancel=None, tracer=None, journal=None, resume=None):
+    """작업 명세대로 변환/병합 실행 후 JobResult 반환
+
+    on_event는 작업자 스레드에서 호출될 수 있다.
+    cache를 주면 그 ConversionCache를 사용 (job.use_cache가 False면 무시).
+    cancel(CancelToken)으로 다른 스레드에서 일시 정지/취소할 수 있다.
+    tracer(tracing.Tracer)를 주면 파일/단계별 소요 시간을 기록한다.
+    journal(job_journal.JobJournal)을 주면 작업과 파일별 결과를 기록하고,
+    resume에 기록된 작업 ID를 주면 출력이 확인된 파일은 건너뛰고 나머지만 이어서 변환한다
+    (job은 journal.load_job(resume)으로 만든 것이어야 함).
+    """
+    tracer = tracer or NULL_TRACER
+    tracer.new_job()
+    emit = on_event or (lambda event: None)
+    started = time.perf_counter()
+
+    if not job.inputs:
+        raise ValueError("입력 파일 목록이 비어 있습니다.")
+    if job.pages:
+        # 형식 오류는 파일마다 실패시키지 않고 작업 시작 전에 알림
+        parse_page_spec(job.pages)
+
+    gs_command = job.gs_command if job.gs_command is not None else find_ghostscript()
+    if job.use_cache:
+        cache = cache or ConversionCache()
+        cache.reset_stats()
+    else:
+        cache = None
+
+    workers, split_pages, persistent, gs_args = job.workers, job.split_pages, job.persistent, []
+    if job.profile:
+        from perf_profile import get_profile
+        profile = get_profile(job.profile, gs_command, recalibrate=job.recalibrate,
+                              log=lambda m: emit(EngineEvent("log", m)))
+        emit(EngineEvent("log", f"성능 프로필 {profile.summary()}"))
+        # 작업에 직접 지정한 동시 작업 수가 우선, 페이지 분할은 둘 다 허용할 때만
+        workers = workers or profile.workers
+        split_pages = split_pages and profile.split_pages
+        persistent = persistent or profile.persistent
+        gs_args = profile.gs_args
+
+    pool = ConversionPool(
+        gs_command,
+        resolution=job.resolution,
+        quality=job.quality,
+        workers=workers,
+        split_pages=split_pages,
+        cache=cache,
+        persistent=persistent,
+        timeout=job.timeout,
+        cancel=cancel,
+        tracer=tracer,
+        pages=job.pages,
+        compare_eps=job.compare_eps,
+        gs_args=gs_args
+    )
+    emit(EngineEvent("log", f"동시 작업 수: {pool.workers}"))
+
+    on_start = lambda r: emit(EngineEvent(
+        "file_start",
+        f"▶ {os.path.basename(r.input_path)} 변환 시작 → {os.path.basename(r.output_path)}",
+        r))
+    log = lambda m: emit(EngineEvent("log", m))
+    on_progress = lambda p: emit(EngineEvent("progress", progress=p))
+
+    job_id, verified = None, {}
+    if journal is not None:
+        if resume:
+            job_id = resume
+            journal.reopen(job_id)
+            verified = journal.verified_outputs(job_id)
+            emit(EngineEvent("log", f"작업 {job_id} 이어서 변환: 이전 출력 확인 {len(verified)}/{len(job.inputs)}개"))
+        else:
+            job_id = journal.start(job)
+
+    direct = job.merge and not job.per_file and len(job.inputs) > 1 and gs_command and not job.pages
+    if direct:
+        # 파일별 PDF를 만들었다가 다시 읽어 병합하지 않고 Ghostscript에 모든 입력을 한 번에 넣음
+        merged_path = os.path.join(job.output_dir, MERGED_NAME)
+        if len(verified) == len(job.inputs):
+            # 병합까지 끝난 뒤 중단되었음 (바로 병합은 중간 출력이 없으므로 일부만 이어서 할 수 없음)
+            results = [FileResult(i, p, merged_path, status="ok", message="이전 작업에서 완료됨 (출력 확인)",
+                                  resumed=True) for i, p in enumerate(job.inputs)]
+            job_result = JobResult(results=results, merged_path=merged_path, job_id=job_id)
+            for r in results:
+                emit(EngineEvent("file_done", r.message, r))
+            emit(EngineEvent("merge_done", f"✓ 이전 작업의 병합 PDF 사용 → {merged_path}"))
+        else:
+            emit(EngineEvent("merge_start", "PDF 바로 병합 시작 ..."))
+            on_result = lambda r: emit(EngineEvent("file_done", r.message, r))
+            results, merged = pool.run_merged(job.inputs, merged_path, on_start=on_start,
+                                              on_result=on_result, log=log, on_progress=on_progress)
+            job_result = JobResult(results=results, merged_path=merged, job_id=job_id)
+            if merged:
+                emit(EngineEvent("merge_done", f"✓ 병합 완료 → {merged_path}"))
+                if job.optimize:
+                    job_result.bytes_saved = optimize_merged(merged_path, tracer, emit)
+            elif pool.cancel.cancelled:
+                emit(EngineEvent("log", f"작업이 취소되었습니다 (취소된 파일 {len(job_result.cancelled)}개)"))
+            if journal is not None:
+                # 병합 PDF가 다 만들어진 뒤에 기록 (모든 파일이 같은 출력을 가리키므로 해시는 한 번만)
+                digest = file_digest(merged) if merged else None
+                for r in results:
+                    journal.record(job_id, r.index, r, digest=digest)
+        if journal is not None:
+            journal.finish(job_id, job_result)
+        job_result.elapsed = time.perf_counter() - started
+        return job_result
+
+    merged_path = os.path.join(job.output_dir, MERGED_NAME)
+    # 이전 병합 PDF가 입력에 있으면 덮어쓸 파일을 다시 병합하게 되므로 빼고,
+    # 다른 입력의 출력 이름도 병합 PDF와 겹치지 않게 함
+    excluded = [i for i, p in enumerate(job.inputs) if job.merge and same_path(p, merged_path)]
+    outputs = job.outputs or plan_outputs(job.inputs, job.output_dir, reserved=[MERGED_NAME] if job.merge else ())
+    remaining = [i for i in range(len(job.inputs)) if i not in verified and i not in excluded]
+
+    def on_result(r):
+        # r.index는 남은 파일 목록 안의 순번
+        if journal is not None:
+            journal.record(job_id, remaining[r.index], r)
+        emit(EngineEvent("file_done", r.message, r))
+
+    results = [None] * len(job.inputs)
+    for i in excluded:
+        results[i] = FileResult(i, job.inputs[i], None, status="skipped", message=MERGED_INPUT_MESSAGE)
+        if journal is not None:
+            journal.record(job_id, i, results[i])
+        emit(EngineEvent("file_done", results[i].message, results[i]))
+    for i, out_pdf in verified.items():
+        if i in excluded:
+            continue
+        results[i] = FileResult(i, job.inputs[i], out_pdf, status="ok",
+                                message="이전 작업에서 완료됨 (출력 확인)", resumed=True,
+                                passthrough=out_pdf == job.inputs[i])
+        emit(EngineEvent("file_done", results[i].message, results[i]))
+    if remaining:
+        converted = pool.run([job.inputs[i] for i in remaining], job.output_dir, on_start=on_start,
+                             on_result=on_result, log=log, on_progress=on_progress,
+                             outputs=[outputs[i] for i in remaining])
+        for i, r in zip(remaining, converted):
+            r.index = i
+            results[i] = r
+    job_result = JobResult(results=results, job_id=job_id)
+    if cache is not None:
+        job_result.cache_hits = cache.hits
+        job_result.cache_misses = cache.misses
+        emit(EngineEvent("log", f"캐시: 적중 {cache.hits}개, 미적중 {cache.misses}개"))
+
+    if pool.cancel.cancelled:
+        emit(EngineEvent("log", f"작업이 취소되었습니다 (취소된 파일 {len(job_result.cancelled)}개)"))
+
+    # 입력 순서대로 병합 (완료 순서와 무관). 실패/취소된 파일이 있으면 병합하지 않음
+    pdf_files = job_result.outputs
+    if job.merge and len(pdf_files) > 1 and not job_result.failed and not job_result.cancelled:
+        emit(EngineEvent("merge_start", "PDF 병합 시작 ..."))
+        from pdf_merge import merge_pdfs
+        try:
+            with tracer.span("merge", merged_path, preset=preset_name(job.quality)) as span:
+                stats = merge_pdfs(pdf_files, merged_path)
+                span.update(documents=stats.documents, pages=stats.pages, output_bytes=stats.bytes_written)
+        except Exception as e:
+            # 손상되거나 읽을 수 없는 PDF: 파일별 출력은 그대로 두고 병합만 실패로 보고
+            job_result.merge_error = str(e) or type(e).__name__
+            emit(EngineEvent("merge_done", f"✗ 병합 실패: {job_result.merge_error}"))
+        else:
+            job_result.merged_path = merged_path
+            emit(EngineEvent("merge_done", f"✓ 병합 완료 → {merged_path}"))
+            emit(EngineEvent("log", f"  병합: {stats.summary()}"))
+            if job.optimize:
+                job_result.bytes_saved = optimize_merged(merged_path, tracer, emit)
+
+    if journal is not None:
+        journal.finish(job_id, job_result)
+    job_result.elapsed = time.perf_counter() - started
+    return job_result
+
+
+def run_job_interruptible(job, on_event=None, cache=None, cancel=None, on_interrupt=None, tracer=None,
+                          journal=None, resume=None):
+    """콘솔용 run_job: Ctrl+C를 받으면 작업을 취소하고 정리가 끝난 JobResult 반환
+
+    Ghostscript는 별도 프로세스 그룹으로 실행되어 Ctrl+C가 직접 전달되지 않으므로
+    작업은 다른 스레드에서 돌리고 메인 스레드에서 인터럽트를 받아 취소한다.
+    """
+    cancel = cancel or CancelToken()
+    outcome = {}
+    done = threading.Event()
+
+    def work():
+        try:
+            outcome["result"] = run_job(job, on_event=on_event, cache=cache, cancel=cancel, tracer=tracer,
+                                        journal=journal, resume=resume)
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    threading.Thread(target=work, daemon=True).start()
+    while not done.is_set():
+        try:
+            done.wait(0.2)
+        except KeyboardInterrupt:
+            if not cancel.cancelled:
+                if on_interrupt:
+                    on_interrupt()
+                cancel.cancel()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
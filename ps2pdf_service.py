@@ -0,0 +1,645 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 HTTP 변환 서비스
+여러 도구가 각자 Ghostscript를 띄우지 않고 하나의 변환기(같은 엔진, 캐시, Ghostscript 탐색 결과)를
+함께 쓰도록 localhost에서 HTTP로 변환 요청을 받음 (asyncio, 표준 라이브러리만 사용)
+
+    POST /convert?preset=printer&dpi=600   요청 본문(PS/EPS/SVG/PDF, 압축 가능)을 변환해 PDF를 조각 단위로 응답
+    POST /jobs                             {"inputs": [경로...], "output_dir": 경로} 로컬 파일 변환
+                                           (--allow-dir로 허용한 폴더만, 진행 상황을 JSON-lines로 응답)
+    GET  /health                           상태 (종료 중이면 503)
+    GET  /metrics                          Prometheus 텍스트 형식 지표
+
+동시에 변환하는 요청은 작업자 수까지, 기다리는 요청은 --queue개까지 받고 넘치면 429로 거절.
+종료 신호(Ctrl+C, SIGTERM)를 받으면 새 요청은 503으로 거절하고 받아 둔 요청이 끝날 때까지 기다림
+
+사용 예:
+    python -m ps2pdf_service --port 8765 -j 4 --queue 16 --allow-dir D:\\data
+    curl --data-binary @report.ps "http://127.0.0.1:8765/convert?preset=printer" -o report.pdf
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import parse_qsl, urlsplit
+
+from cancellation import CancelToken, ConversionCancelled
+from conversion_cache import ConversionCache
+from formats import STREAM_CHUNK
+from ps2pdf_engine import (COMPRESSED_SIZE_FACTOR, DEFAULT_QUALITY, PRESETS, ConversionJob, default_workers,
+                           find_ghostscript, gs_timeout, gs_version, run_job)
+from ps2pdf_stream import iter_convert
+from ps_dsc import parse_page_spec
+from tracing import Metrics, Tracer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# 작업자가 모두 바쁠 때 기다리게 할 수 있는 최대 요청 수 (넘으면 429)
+DEFAULT_QUEUE = 16
+
+# 요청 줄/헤더 최대 크기와 수신 제한 시간 (초)
+MAX_HEADER_BYTES = 64 * 1024
+HEADER_TIMEOUT = 30
+
+# 업로드 최대 크기 기본값 (MB)과 /jobs 요청 본문(JSON) 최대 크기
+DEFAULT_MAX_UPLOAD_MB = 1024
+MAX_JSON_BYTES = 1024 * 1024
+
+# 업로드가 이 시간 동안 한 조각도 오지 않으면 변환 실패 처리 (초)
+BODY_READ_TIMEOUT = 60
+
+# 종료 시 진행 중인 요청을 기다리는 최대 시간 (초, 넘으면 남은 변환 취소)
+DEFAULT_DRAIN_TIMEOUT = 60
+
+# 429 응답의 Retry-After (초)
+RETRY_AFTER = 5
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    411: "Length Required",
+    413: "Payload Too Large",
+    415: "Unsupported Media Type",
+    429: "Too Many Requests",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+# 지표 라벨로 쓰는 경로 (그 밖의 경로는 other)
+ENDPOINTS = ("/convert", "/jobs", "/health", "/metrics")
+
+
+class HTTPError(Exception):
+    """응답 상태 코드와 메시지를 담은 오류 (응답을 보내기 전에만 사용)"""
+
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+
+class _BodyReader:
+    """요청 본문(asyncio StreamReader)을 변환 스레드에서 읽는 동기 읽기 스트림 (Content-Length까지만)"""
+
+    def __init__(self, reader, length, loop):
+        self._reader = reader
+        self._loop = loop
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            # SVG/Pillow 변환은 문서 전체가 필요함
+            blocks = []
+            while self.remaining > 0:
+                blocks.append(self.read(STREAM_CHUNK))
+            return b"".join(blocks)
+        size = min(size, self.remaining)
+        if size <= 0:
+            return b""
+        future = asyncio.run_coroutine_threadsafe(self._reader.read(size), self._loop)
+        try:
+            data = future.result(BODY_READ_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise OSError("요청 본문 수신 시간 초과")
+        if not data:
+            raise OSError("요청 본문이 Content-Length보다 짧습니다")
+        self.remaining -= len(data)
+        return data
+
+
+async def _watch_disconnect(reader, cancel, body=None):
+    """요청 본문을 다 받은 뒤 클라이언트가 연결을 끊으면 변환 취소 (응답을 기다리는 동안 소켓 감시)"""
+    # 본문을 읽는 중에는 변환 스레드가 같은 StreamReader를 쓰므로 다 읽을 때까지 기다림
+    # (그 사이에 끊기면 본문 읽기가 실패해 변환도 실패함)
+    while body is not None and body.remaining > 0 and not cancel.cancelled:
+        await asyncio.sleep(0.2)
+    try:
+        data = await reader.read(1)
+    except (ConnectionError, OSError):
+        data = b""
+    if not data:
+        cancel.cancel()
+
+
+def _quality(params):
+    """preset 인자 → 품질 라벨 (없으면 None)"""
+    preset = params.get("preset")
+    if preset is None:
+        return None
+    if preset not in PRESETS:
+        raise HTTPError(400, f"알 수 없는 preset: {preset} ({', '.join(PRESETS)})")
+    return PRESETS[preset]
+
+
+def _resolution(params, default):
+    dpi = params.get("dpi", default)
+    try:
+        dpi = int(dpi)
+    except (TypeError, ValueError):
+        raise HTTPError(400, f"dpi가 올바르지 않습니다: {dpi}")
+    if not 72 <= dpi <= 2400:
+        raise HTTPError(400, "dpi는 72~2400 사이여야 합니다")
+    return str(dpi)
+
+
+def _conversion_error(e):
+    """변환 예외 → HTTPError (응답을 보내기 전)"""
+    if isinstance(e, HTTPError):
+        return e
+    if isinstance(e, ConversionCancelled):
+        return HTTPError(503, "변환이 취소되었습니다 (서비스 종료 또는 연결 끊김)")
+    if isinstance(e, subprocess.TimeoutExpired):
+        return HTTPError(504, f"변환 시간 초과 ({e.timeout:.0f}초)")
+    if isinstance(e, ValueError):
+        return HTTPError(415, str(e))
+    if isinstance(e, OSError):
+        return HTTPError(400, f"요청 본문을 읽을 수 없습니다: {e}")
+    return HTTPError(500, str(e) or type(e).__name__)
+
+
+class ConversionService:
+    """변환 요청을 작업자 수만큼 동시에 처리하는 HTTP 서비스 (메서드는 이벤트 루프에서 호출)"""
+
+    def __init__(self, workers=None, queue_size=DEFAULT_QUEUE, allow_dirs=(), gs_command=None,
+                 quality=DEFAULT_QUALITY, resolution="300", timeout=None, use_cache=True,
+                 max_upload=DEFAULT_MAX_UPLOAD_MB * 1024 * 1024, trace_path=None, log=print):
+        self.workers = workers or default_workers()
+        self.queue_size = queue_size
+        self.capacity = self.workers + queue_size
+        # Ghostscript는 시작할 때 한 번만 찾음 (없으면 "": 요청마다 다시 찾지 않음)
+        self.gs_command = gs_command if gs_command is not None else (find_ghostscript() or "")
+        self.allow_dirs = [os.path.realpath(d) for d in allow_dirs]
+        self.quality = quality
+        self.resolution = resolution
+        self.timeout = timeout
+        self.cache = ConversionCache() if use_cache else None
+        self.max_upload = max_upload
+        self.metrics = Metrics()
+        self.tracer = Tracer(trace_path, self.metrics)
+        self.log = log
+        # 변환 스레드: 변환마다 결과를 기다리는 스레드 하나 + 요청 본문/조각을 옮기는 여유분
+        self.executor = ThreadPoolExecutor(max_workers=self.workers * 2, thread_name_prefix="ps2pdf-service")
+        self.pending = 0        # 받아 들인 요청 수 (대기 + 실행)
+        self.active = 0         # 실행 중인 요청 수
+        self.draining = False   # 종료 중: 새 요청 거절
+        self.aborting = False   # 종료 대기 시간 초과: 대기 중인 요청도 시작하지 않음
+        self.tokens = set()     # 실행 중인 변환의 CancelToken
+        self._slots = None
+        self._idle = None
+
+    # ---- 요청 수용/작업자 배정 ----
+
+    def _admit(self):
+        """대기열에 자리가 있으면 요청을 받아 들임 (없으면 429, 종료 중이면 503)"""
+        if self.draining:
+            raise HTTPError(503, "서비스가 종료 중입니다")
+        if self.pending >= self.capacity:
+            self.tracer.count("ps2pdf_service_rejected_total", help_text="대기열이 가득 차 거절한 요청 수")
+            raise HTTPError(429, f"대기열이 가득 찼습니다 (작업자 {self.workers}개, 대기 {self.queue_size}개)",
+                            {"Retry-After": str(RETRY_AFTER)})
+        self.pending += 1
+        self._idle.clear()
+
+    def _release(self):
+        self.pending -= 1
+        if self.pending == 0:
+            self._idle.set()
+
+    async def _run_slot(self, handler):
+        """작업자 자리가 날 때까지 기다렸다가 handler() 실행 (_admit 이후 호출)"""
+        try:
+            async with self._slots:
+                if self.aborting:
+                    raise HTTPError(503, "서비스 종료로 변환이 취소되었습니다")
+                self.active += 1
+                try:
+                    return await handler()
+                finally:
+                    self.active -= 1
+        finally:
+            self._release()
+
+    # ---- HTTP ----
+
+    async def handle(self, reader, writer):
+        """연결 하나 처리 (요청 하나 받고 응답 후 연결 닫음)"""
+        started = time.perf_counter()
+        endpoint, status = "other", 500
+        try:
+            method, target, headers = await self._read_head(reader)
+            url = urlsplit(target)
+            if url.path in ENDPOINTS:
+                endpoint = url.path
+            status = await self._dispatch(method, url.path, dict(parse_qsl(url.query)), headers, reader, writer)
+        except HTTPError as e:
+            status = e.status
+            try:
+                await self._send_json(writer, e.status, {"error": e.message}, e.headers)
+            except ConnectionError:
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # 클라이언트가 먼저 연결을 끊음
+            status = 499
+        except Exception as e:
+            self.log(f"요청 처리 오류: {type(e).__name__}: {e}")
+            try:
+                await self._send_json(writer, 500, {"error": str(e)})
+            except ConnectionError:
+                pass
+        finally:
+            labels = {"endpoint": endpoint, "code": status}
+            self.tracer.count("ps2pdf_service_requests_total", labels, help_text="처리한 HTTP 요청 수")
+            self.metrics.observe("ps2pdf_service_request_seconds", time.perf_counter() - started,
+                                 {"endpoint": endpoint}, help_text="요청 처리 시간 (초, 응답 전송 포함)")
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def _read_head(self, reader):
+        """요청 줄과 헤더 읽기 → (메서드, 대상, {소문자 헤더 이름: 값})"""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), HEADER_TIMEOUT)
+        except asyncio.LimitOverrunError:
+            raise HTTPError(431, "요청 헤더가 너무 큽니다")
+        except asyncio.TimeoutError:
+            raise HTTPError(408, "요청 헤더 수신 시간 초과")
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise HTTPError(400, "요청 줄이 올바르지 않습니다")
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        return method.upper(), target, headers
+
+    async def _dispatch(self, method, path, query, headers, reader, writer):
+        routes = {
+            "/convert": ("POST", self.convert_upload),
+            "/jobs": ("POST", self.convert_paths),
+            "/health": ("GET", self.health),
+            "/metrics": ("GET", self.render_metrics),
+        }
+        if path not in routes:
+            raise HTTPError(404, f"없는 경로: {path}")
+        allowed, handler = routes[path]
+        if method != allowed:
+            raise HTTPError(405, f"{path}는 {allowed}만 지원합니다", {"Allow": allowed})
+        return await handler(query, headers, reader, writer)
+
+    async def _send_head(self, writer, status, content_type, length=None, headers=None):
+        """응답 줄과 헤더 전송 (length가 None이면 chunked)"""
+        lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+                 f"Content-Type: {content_type}",
+                 f"Content-Length: {length}" if length is not None else "Transfer-Encoding: chunked",
+                 "Cache-Control: no-store",
+                 "Connection: close"]
+        lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+    async def _send_json(self, writer, status, obj, headers=None):
+        data = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        await self._send_head(writer, status, "application/json; charset=utf-8", len(data), headers)
+        writer.write(data)
+        await writer.drain()
+
+    @staticmethod
+    async def _send_chunk(writer, data):
+        writer.write(b"%X\r\n" % len(data) + data + b"\r\n")
+        await writer.drain()
+
+    @staticmethod
+    def _content_length(headers, limit):
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HTTPError(411, "chunked 요청 본문은 지원하지 않습니다 (Content-Length 필요)")
+        try:
+            length = int(headers["content-length"])
+        except KeyError:
+            raise HTTPError(411, "Content-Length가 필요합니다")
+        except ValueError:
+            raise HTTPError(400, "Content-Length가 올바르지 않습니다")
+        if length <= 0:
+            raise HTTPError(400, "요청 본문이 비어 있습니다")
+        if length > limit:
+            raise HTTPError(413, f"요청 본문이 너무 큽니다 (최대 {limit // (1024 * 1024)} MB)")
+        return length
+
+    @staticmethod
+    async def _continue(headers, writer):
+        """Expect: 100-continue면 본문을 보내도 된다고 알림 (자리를 받은 뒤에 보내 429는 업로드 전에 감)"""
+        if headers.get("expect", "").lower() == "100-continue":
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            await writer.drain()
+
+    # ---- 엔드포인트 ----
+
+    async def convert_upload(self, query, headers, reader, writer):
+        """요청 본문을 변환해 PDF를 만들어지는 대로 chunked로 응답"""
+        length = self._content_length(headers, self.max_upload)
+        quality = _quality(query) or self.quality
+        resolution = _resolution(query, self.resolution)
+        # 압축 입력은 풀린 크기를 모르므로 넉넉히 어림
+        timeout = self.timeout or gs_timeout(length * COMPRESSED_SIZE_FACTOR)
+        self._admit()
+
+        async def stream():
+            loop = asyncio.get_running_loop()
+            await self._continue(headers, writer)
+            cancel = CancelToken()
+            self.tokens.add(cancel)
+            body = _BodyReader(reader, length, loop)
+            watcher = asyncio.ensure_future(_watch_disconnect(reader, cancel, body))
+            chunks = iter_convert(body, quality=quality, resolution=resolution,
+                                  gs_command=self.gs_command or None, timeout=timeout, cancel=cancel)
+            done = object()
+            next_chunk = partial(next, chunks, done)
+            sent = 0
+            try:
+                try:
+                    chunk = await loop.run_in_executor(self.executor, next_chunk)
+                except Exception as e:
+                    raise _conversion_error(e)
+                await self._send_head(writer, 200, "application/pdf",
+                                      headers={"Content-Disposition": 'attachment; filename="output.pdf"'})
+                while chunk is not done:
+                    await self._send_chunk(writer, chunk)
+                    sent += len(chunk)
+                    try:
+                        chunk = await loop.run_in_executor(self.executor, next_chunk)
+                    except Exception as e:
+                        # 이미 응답을 보내기 시작했으므로 마지막 조각 없이 연결을 끊어 잘린 PDF임을 알림
+                        self.log(f"변환 실패 (응답 중단): {e}")
+                        writer.transport.abort()
+                        return _conversion_error(e).status
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+                return 200
+            except ConnectionError:
+                cancel.cancel()
+                raise
+            finally:
+                watcher.cancel()
+                self.tracer.count("ps2pdf_service_output_bytes_total", value=sent,
+                                  help_text="/convert로 보낸 PDF 바이트 수")
+                # 제너레이터를 닫으면 아직 돌고 있는 변환(Ghostscript)도 종료
+                try:
+                    await loop.run_in_executor(self.executor, chunks.close)
+                except ValueError:
+                    cancel.cancel()
+                self.tokens.discard(cancel)
+
+        return await self._run_slot(stream)
+
+    def _allowed(self, path):
+        real = os.path.realpath(path)
+        return any(os.path.commonpath([real, root]) == root for root in self.allow_dirs)
+
+    async def convert_paths(self, query, headers, reader, writer):
+        """로컬 파일을 엔진(run_job)으로 변환하고 파일별 결과와 요약을 JSON-lines로 응답"""
+        if not self.allow_dirs:
+            raise HTTPError(403, "경로 변환이 꺼져 있습니다 (--allow-dir로 허용할 폴더 지정)")
+        length = self._content_length(headers, MAX_JSON_BYTES)
+        await self._continue(headers, writer)
+        try:
+            body = json.loads(await reader.readexactly(length))
+        except ValueError as e:
+            raise HTTPError(400, f"JSON이 올바르지 않습니다: {e}")
+        if not isinstance(body, dict):
+            raise HTTPError(400, "요청 본문은 JSON 객체여야 합니다")
+        inputs = body.get("inputs")
+        if not inputs or not isinstance(inputs, list) or not all(isinstance(p, str) for p in inputs):
+            raise HTTPError(400, "inputs에 입력 파일 경로 목록이 필요합니다")
+        inputs = [os.path.abspath(p) for p in inputs]
+        output_dir = os.path.abspath(body.get("output_dir") or os.path.dirname(inputs[0]))
+        denied = [p for p in inputs + [output_dir] if not self._allowed(p)]
+        if denied:
+            raise HTTPError(403, f"허용되지 않은 경로: {', '.join(denied)}")
+        missing = [p for p in inputs if not os.path.isfile(p)]
+        if missing:
+            raise HTTPError(400, f"입력 파일이 없습니다: {', '.join(missing)}")
+        pages = body.get("pages")
+        if pages:
+            try:
+                parse_page_spec(pages)
+            except ValueError as e:
+                raise HTTPError(400, str(e))
+        job = ConversionJob(
+            inputs=inputs,
+            output_dir=output_dir,
+            quality=_quality(body) or self.quality,
+            resolution=_resolution(body, self.resolution),
+            # 요청 하나가 작업자 자리 하나만 차지하므로 Ghostscript도 한 번에 하나만 실행
+            # (파일을 차례로 변환, 페이지 분할/묶음 병합도 나누지 않음)
+            workers=1,
+            use_cache=self.cache is not None,
+            merge=bool(body.get("merge", False)),
+            per_file=bool(body.get("per_file", True)),
+            optimize=bool(body.get("optimize", False)),
+            pages=pages or None,
+            timeout=self.timeout,
+            gs_command=self.gs_command
+        )
+        self._admit()
+
+        async def stream():
+            loop = asyncio.get_running_loop()
+            os.makedirs(output_dir, exist_ok=True)
+            events = asyncio.Queue()
+            cancel = CancelToken()
+            self.tokens.add(cancel)
+            watcher = asyncio.ensure_future(_watch_disconnect(reader, cancel))
+
+            def on_event(event):
+                if event.kind == "file_done":
+                    r = event.result
+                    line = {"event": "file_done", "input": r.input_path, "output": r.output_path if r.ok else None,
+                            "status": r.status, "cached": r.cached, "message": r.message}
+                elif event.kind == "merge_done":
+                    line = {"event": "merge_done", "message": event.message}
+                else:
+                    return
+                loop.call_soon_threadsafe(events.put_nowait, line)
+
+            def work():
+                try:
+                    return run_job(job, on_event=on_event, cache=self.cache, cancel=cancel, tracer=self.tracer)
+                finally:
+                    loop.call_soon_threadsafe(events.put_nowait, None)
+
+            future = loop.run_in_executor(self.executor, work)
+            try:
+                await self._send_head(writer, 200, "application/x-ndjson; charset=utf-8")
+                while True:
+                    line = await events.get()
+                    if line is None:
+                        break
+                    await self._send_chunk(writer, (json.dumps(line, ensure_ascii=False) + "\n").encode("utf-8"))
+                try:
+                    summary = dict({"event": "done"}, **(await future).to_dict())
+                except Exception as e:
+                    summary = {"event": "error", "message": str(e) or type(e).__name__}
+                await self._send_chunk(writer, (json.dumps(summary, ensure_ascii=False) + "\n").encode("utf-8"))
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+                return 200
+            except ConnectionError:
+                # 결과를 받을 곳이 없으므로 남은 변환 취소
+                cancel.cancel()
+                await asyncio.wait([future])
+                raise
+            finally:
+                watcher.cancel()
+                self.tokens.discard(cancel)
+
+        return await self._run_slot(stream)
+
+    async def health(self, query, headers, reader, writer):
+        status = 503 if self.draining else 200
+        await self._send_json(writer, status, {
+            "status": "draining" if self.draining else "ok",
+            "ghostscript": gs_version(self.gs_command) or None,
+            "workers": self.workers,
+            "active": self.active,
+            "queued": self.pending - self.active,
+            "capacity": self.capacity,
+        })
+        return status
+
+    async def render_metrics(self, query, headers, reader, writer):
+        gauges = [
+            ("ps2pdf_service_active", "실행 중인 변환 요청 수", self.active),
+            ("ps2pdf_service_queued", "작업자 자리를 기다리는 요청 수", self.pending - self.active),
+            ("ps2pdf_service_capacity", "받아 들일 수 있는 최대 요청 수 (작업자 + 대기열)", self.capacity),
+        ]
+        lines = [self.metrics.render().rstrip("\n")]
+        for name, help_text, value in gauges:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+        data = ("\n".join(line for line in lines if line) + "\n").encode("utf-8")
+        await self._send_head(writer, 200, "text/plain; version=0.0.4; charset=utf-8", len(data))
+        writer.write(data)
+        await writer.drain()
+        return 200
+
+    # ---- 실행/종료 ----
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, drain_timeout=DEFAULT_DRAIN_TIMEOUT):
+        """종료 신호를 받을 때까지 요청 처리 후 진행 중인 요청이 끝나기를 기다림"""
+        loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                # Windows: 이벤트 루프 신호 처리기가 없으므로 일반 신호 처리기에서 루프로 넘김
+                signal.signal(sig, lambda *_: loop.call_soon_threadsafe(stop.set))
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES)
+        address = server.sockets[0].getsockname()
+        gs = f"Ghostscript {gs_version(self.gs_command)}" if self.gs_command else "Ghostscript 없음 (PS 변환 불가)"
+        self.log(f"변환 서비스 시작: http://{address[0]}:{address[1]} "
+                 f"(작업자 {self.workers}개, 대기열 {self.queue_size}개, {gs})")
+        if self.allow_dirs:
+            self.log(f"경로 변환 허용 폴더: {', '.join(self.allow_dirs)}")
+        await stop.wait()
+        await self.drain(server, drain_timeout)
+
+    async def drain(self, server, timeout):
+        """새 요청을 막고 받아 둔 요청이 끝날 때까지 대기 (시간을 넘기면 남은 변환 취소)"""
+        self.draining = True
+        server.close()
+        if self.pending:
+            self.log(f"종료 중: 받아 둔 요청 {self.pending}개가 끝나기를 기다립니다 (최대 {timeout:.0f}초)")
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.log(f"대기 시간 초과: 남은 요청 {self.pending}개를 취소합니다")
+            self.aborting = True
+            for token in list(self.tokens):
+                token.cancel()
+            try:
+                await asyncio.wait_for(self._idle.wait(), 10)
+            except asyncio.TimeoutError:
+                pass
+        self.executor.shutdown(wait=False)
+        self.tracer.close()
+        self.log("변환 서비스 종료")
+
+
+def main(argv=None):
+    """명령줄: 서비스 실행 (종료 코드 0, 인자 오류 2)"""
+    parser = argparse.ArgumentParser(
+        prog="ps2pdf_service",
+        description="localhost에서 HTTP로 PS/EPS/SVG → PDF 변환 요청을 받는 서비스를 실행합니다.")
+    parser.add_argument("--host", default=DEFAULT_HOST,
+                        help=f"받을 주소 (기본값: {DEFAULT_HOST}, 인증이 없으므로 외부 주소는 권장하지 않음)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본값: {DEFAULT_PORT})")
+    parser.add_argument("-j", "--workers", type=int, help="동시에 변환할 요청 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--queue", type=int, default=DEFAULT_QUEUE,
+                        help=f"작업자가 모두 바쁠 때 기다리게 할 최대 요청 수, 넘으면 429 (기본값: {DEFAULT_QUEUE})")
+    parser.add_argument("--allow-dir", action="append", default=[], metavar="DIR",
+                        help="POST /jobs로 변환할 수 있는 입력/출력 폴더 (여러 번 지정 가능, 없으면 경로 변환 사용 안 함)")
+    parser.add_argument("-p", "--preset", choices=list(PRESETS), default="ebook",
+                        help="기본 PDF 품질 프리셋 (요청의 preset 인자가 우선, 기본값: ebook)")
+    parser.add_argument("-r", "--dpi", type=int, default=300, help="기본 해상도 DPI (기본값: 300)")
+    parser.add_argument("--timeout", type=float, metavar="SEC",
+                        help="Ghostscript 제한 시간 (초, 기본값: 입력 크기에 맞춰 자동)")
+    parser.add_argument("--max-upload-mb", type=int, default=DEFAULT_MAX_UPLOAD_MB,
+                        help=f"업로드 최대 크기 (MB, 기본값: {DEFAULT_MAX_UPLOAD_MB})")
+    parser.add_argument("--drain-timeout", type=float, default=DEFAULT_DRAIN_TIMEOUT, metavar="SEC",
+                        help=f"종료 시 진행 중인 요청을 기다리는 최대 시간 (초, 기본값: {DEFAULT_DRAIN_TIMEOUT})")
+    parser.add_argument("--no-cache", action="store_true", help="변환 캐시를 사용하지 않음 (/jobs)")
+    parser.add_argument("--trace", metavar="PATH", help="파일/단계별 소요 시간을 JSON-lines로 추가 기록")
+    args = parser.parse_args(argv)
+
+    missing = [d for d in args.allow_dir if not os.path.isdir(d)]
+    if missing:
+        parser.error(f"폴더가 없습니다: {', '.join(missing)}")
+    if args.queue < 0:
+        parser.error("--queue는 0 이상이어야 합니다.")
+
+    service = ConversionService(
+        workers=args.workers,
+        queue_size=args.queue,
+        allow_dirs=args.allow_dir,
+        quality=PRESETS[args.preset],
+        resolution=str(args.dpi),
+        timeout=args.timeout,
+        use_cache=not args.no_cache,
+        max_upload=args.max_upload_mb * 1024 * 1024,
+        trace_path=args.trace,
+        log=lambda message: print(message, flush=True)
+    )
+    asyncio.run(service.serve(args.host, args.port, args.drain_timeout))
+    return 0
+
+
+if __name__ == "__main__":
+    # 실행 파일로 묶였을 때 SVG/EPS 작업 프로세스(spawn)가 프로그램을 다시 띄우지 않도록
+    multiprocessing.freeze_support()
+    sys.exit(main())
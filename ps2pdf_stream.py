@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트림 변환 API
+디스크에 임시 파일을 쓰지 않고 bytes 또는 읽기 스트림을 받아 PDF를 bytes나 쓰기 스트림으로 돌려줌
+(서비스에 변환기를 넣어 쓸 때 사용)
+
+사용 예:
+    pdf = convert_bytes(ps_data)                       # bytes → bytes
+    with open("in.ps.gz", "rb") as src, open("out.pdf", "wb") as dst:
+        convert_stream(src, dst, quality="프린터(고화질)")  # 스트림 → 스트림 (조각 단위)
+    for chunk in iter_convert(src):                     # 만들어지는 대로 조각을 받음
+        response.write(chunk)
+
+PS는 Ghostscript 표준 입력/출력(-sOutputFile=- -)으로 조각 단위로 흘려보내므로
+큰 문서도 메모리에 통째로 올리지 않는다 (EPS도 Ghostscript가 있으면 같은 방식).
+SVG(CairoSVG)와 Ghostscript가 없을 때의 EPS(Pillow)는 라이브러리가
+문서 전체를 읽어야 하므로 메모리로 읽은 뒤 공유 메모리로 작업 프로세스(render_pool)에 넘긴다.
+"""
+
+import io
+import lzma
+import queue
+import threading
+
+from cancellation import CancelToken
+from formats import COMPRESSIONS, SNIFF_BYTES, STREAM_CHUNK, compression_of, sniff_bytes
+from ps2pdf_engine import (DEFAULT_QUALITY, TIMEOUT_MAX, build_gs_command, find_ghostscript,
+                           gs_timeout, run_gs)
+from render_pool import shared_pool
+
+# iter_convert가 쌓아 둘 수 있는 최대 조각 수 (받는 쪽이 느리면 변환도 기다림)
+ITER_QUEUE_CHUNKS = 8
+
+
+class _PrefixedReader(io.RawIOBase):
+    """형식을 보려고 먼저 읽은 앞부분을 되돌려 놓은 읽기 스트림"""
+
+    def __init__(self, head, stream):
+        self._head = memoryview(head)
+        self._stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._head:
+            n = min(len(buffer), len(self._head))
+            buffer[:n] = self._head[:n]
+            self._head = self._head[n:]
+            return n
+        data = self._stream.read(len(buffer))
+        n = len(data)
+        buffer[:n] = data
+        return n
+
+
+class _CountingWriter:
+    """쓴 바이트 수를 세는 쓰기 스트림 래퍼"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.bytes_written = 0
+
+    def write(self, data):
+        self._stream.write(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+
+def _as_stream(source):
+    """bytes/bytearray/memoryview면 BytesIO로, 스트림이면 그대로"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    return source
+
+
+def open_source(source):
+    """입력의 (형식 이름, 압축 이름, 압축이 풀린 읽기 스트림) (형식을 모르면 ValueError)
+
+    앞부분만 읽어 형식을 보고, 압축 입력은 읽는 대로 풀리는 스트림으로 감싼다.
+    """
+    stream = _as_stream(source)
+    head = stream.read(SNIFF_BYTES)
+    compression = compression_of(head)
+    stream = io.BufferedReader(_PrefixedReader(head, stream), STREAM_CHUNK)
+    if compression is not None:
+        stream = COMPRESSIONS[compression][1](stream, "rb")
+        try:
+            head = stream.read(SNIFF_BYTES)
+        except (OSError, EOFError, lzma.LZMAError) as e:
+            raise ValueError(f"{compression} 압축을 풀 수 없습니다: {e}") from e
+        stream = io.BufferedReader(_PrefixedReader(head, stream), STREAM_CHUNK)
+    found = sniff_bytes(head)
+    if found is None:
+        raise ValueError("지원되지 않는 형식 (PS/EPS/SVG/PDF가 아님)")
+    return found[0], compression, stream
+
+
+def convert_stream(source, dest, quality=DEFAULT_QUALITY, resolution="300", gs_command=None,
+                   timeout=None, cancel=None, on_page=None):
+    """source(bytes 또는 읽기 스트림)를 PDF로 변환해 dest(쓰기 스트림)에 쓰고 쓴 바이트 수 반환
+
+    timeout을 주지 않으면 bytes 입력은 크기에 맞춰, 크기를 모르는 스트림은 최대 제한 시간을 쓴다.
+    PDF 입력은 변환하지 않고 그대로 옮겨 쓴다.
+    on_page(N)은 Ghostscript가 페이지를 하나 끝낼 때마다 호출된다 (PS/EPS).
+    """
+    cancel = cancel or CancelToken()
+    cancel.check()
+    size = len(source) if isinstance(source, (bytes, bytearray, memoryview)) else None
+    name, compression, stream = open_source(source)
+    writer = _CountingWriter(dest)
+
+    if name in ("ps", "eps"):
+        gs_command = gs_command or find_ghostscript()
+        if not gs_command and name == "ps":
+            raise RuntimeError("Ghostscript가 없어 PS 변환 불가")
+
+    if name in ("ps", "eps") and gs_command:
+        if timeout is None:
+            timeout = gs_timeout(size) if size is not None and not compression else TIMEOUT_MAX
+        # 출력 PDF가 표준 출력으로 나가므로 시작 안내문은 -q로 끄고 PostScript 출력/메시지
+        # (EndPage 훅의 페이지 표시 줄 포함)는 표준 오류로 돌림. EPS는 바운딩 박스에 맞춰 벡터 그대로 변환
+        extra = ["-q", "-sstdout=%stderr"] + (["-dEPSCrop"] if name == "eps" else [])
+        cmd = build_gs_command(gs_command, "-", "-", resolution, quality, extra)
+        run_gs(cmd, on_page, timeout, cancel, stdin=stream, stdout=writer)
+    elif name in ("svg", "eps"):
+        # 작업 프로세스에 공유 메모리로 넘겨 변환 (EPS는 Ghostscript가 없을 때만 Pillow 래스터 변환,
+        # Pillow의 PDF 저장은 되돌아가 쓰므로 결과는 bytes로 받음)
+        data = stream.read()
+        if timeout is None:
+            timeout = gs_timeout(len(data))
+        writer.write(shared_pool().render_bytes(name, data, resolution, timeout, cancel))
+    else:
+        for block in iter(lambda: stream.read(STREAM_CHUNK), b""):
+            cancel.check()
+            writer.write(block)
+    cancel.check()
+    return writer.bytes_written
+
+
+def convert_bytes(data, **options):
+    """bytes(또는 읽기 스트림) → PDF bytes (옵션은 convert_stream과 같음)"""
+    out = io.BytesIO()
+    convert_stream(data, out, **options)
+    return out.getvalue()
+
+
+def iter_convert(source, **options):
+    """PDF를 만들어지는 대로 조각(bytes) 단위로 내보내는 제너레이터 (옵션은 convert_stream과 같음)
+
+    변환은 별도 스레드에서 돌고, 받는 쪽이 조각을 가져가지 않으면 ITER_QUEUE_CHUNKS개에서 멈춘다.
+    중간에 제너레이터를 닫으면 변환을 취소한다.
+    """
+    cancel = options.pop("cancel", None) or CancelToken()
+    chunks = queue.Queue(maxsize=ITER_QUEUE_CHUNKS)
+    done = object()
+    outcome = {}
+
+    class _QueueWriter:
+        def write(self, data):
+            while True:
+                cancel.check()
+                try:
+                    chunks.put(bytes(data), timeout=0.2)
+                    return len(data)
+                except queue.Full:
+                    continue
+
+    def work():
+        try:
+            convert_stream(source, _QueueWriter(), cancel=cancel, **options)
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            while True:
+                try:
+                    chunks.put(done, timeout=0.2)
+                    break
+                except queue.Full:
+                    if cancel.cancelled:
+                        break
+
+    worker = threading.Thread(target=work, name="ps2pdf-iter", daemon=True)
+    worker.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is done:
+                break
+            yield chunk
+    finally:
+        if worker.is_alive():
+            cancel.cancel()
+            # 작업 스레드가 대기에서 빠져나오도록 남은 조각을 비움
+            while worker.is_alive():
+                try:
+                    chunks.get(timeout=0.2)
+                except queue.Empty:
+                    pass
+    if "error" in outcome:
+        raise outcome["error"]
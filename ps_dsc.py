@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PostScript DSC(Document Structuring Conventions) 분석 도구
+파일을 메모리 매핑해 프롤로그/셋업/트레일러와 %%Page: 구간의 바이트 위치를 색인하고
+(크기/수정 시각과 함께 캐시), 페이지 구간만 뽑아 독립된 PS 파일로 만듦
+
+사용 예:
+    python -m ps_dsc report.ps          # 페이지 수와 구간 정보
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import threading
+from dataclasses import dataclass, field, asdict
+
+# 이 구간 안의 %%Page: 는 포함된 문서/데이터의 것이므로 무시
+NESTED_BEGIN = (b"%%BeginDocument", b"%%BeginData", b"%%BeginBinary")
+NESTED_END = (b"%%EndDocument", b"%%EndData", b"%%EndBinary")
+
+# %%Pages: 주석을 찾을 때 읽는 파일 앞/뒤 크기
+PAGES_PROBE_BYTES = 64 * 1024
+PAGES_RE = re.compile(rb"^%%Pages:[ \t]*(\d+|\(atend\))", re.MULTILINE)
+
+# 색인 캐시 파일 형식 버전과 메모리에 보관할 색인 수
+INDEX_VERSION = 1
+MEMO_SIZE = 256
+
+_memo = {}  # 절대 경로 → (크기, 수정 시각, DSCIndex 또는 None)
+_memo_lock = threading.Lock()
+
+
+@dataclass
+class DSCIndex:
+    """DSC 구조 색인 (바이트 오프셋 기준)"""
+    path: str
+    size: int
+    prolog_end: int                              # 헤더/프롤로그/셋업 끝 = 첫 페이지 시작
+    pages: list = field(default_factory=list)    # [(시작, 끝), ...]
+    trailer: tuple = None                        # (시작, 끝) 또는 None
+    prolog: tuple = None                         # 헤더 끝 ~ %%EndProlog 줄 끝, 없으면 None
+    setup: tuple = None                          # %%BeginSetup ~ %%EndSetup 줄 끝, 없으면 None
+
+    @property
+    def page_count(self):
+        return len(self.pages)
+
+
+def _line_end(mm, pos, size):
+    """pos가 속한 줄의 다음 줄 시작 위치 (\n, \r\n, \r 줄바꿈 모두 처리)"""
+    limit = min(size, pos + 4096)
+    ends = [e for e in (mm.find(b"\n", pos, limit), mm.find(b"\r", pos, limit)) if e != -1]
+    if not ends:
+        return size
+    end = min(ends)
+    if mm[end:end + 2] == b"\r\n":
+        return end + 2
+    return end + 1
+
+
+def scan_dsc(path):
+    """PS 파일의 DSC 색인 생성 (DSC 규격이 아니면 None)
+
+    파일을 메모리 매핑해 줄 첫머리의 %% 주석만 찾아보므로 파일 전체를 줄 단위로 읽지 않는다.
+    """
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0:
+            return None
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:11] != b"%!PS-Adobe-":
+                return None
+            pages = []
+            trailer_start = None
+            prolog = setup = None
+            header_end = None
+            setup_start = None
+            depth = 0
+            pos = mm.find(b"%%", 1)
+            while pos != -1:
+                # 줄 첫머리의 %% 만 DSC 주석
+                if mm[pos - 1:pos] not in (b"\n", b"\r"):
+                    pos = mm.find(b"%%", pos + 2)
+                    continue
+                keyword = mm[pos:pos + 20]
+                if keyword.startswith(NESTED_BEGIN):
+                    depth += 1
+                elif keyword.startswith(NESTED_END):
+                    depth = max(0, depth - 1)
+                elif depth == 0:
+                    if keyword.startswith(b"%%Page:"):
+                        if trailer_start is not None:
+                            # 트레일러 뒤에 페이지가 다시 나오면 규격 위반
+                            return None
+                        if pages:
+                            pages[-1] = (pages[-1][0], pos)
+                        pages.append((pos, None))
+                    elif keyword.startswith(b"%%Trailer"):
+                        trailer_start = pos
+                    elif not pages:
+                        if keyword.startswith(b"%%EndComments") and header_end is None:
+                            header_end = _line_end(mm, pos, size)
+                        elif keyword.startswith(b"%%EndProlog"):
+                            prolog = (header_end or 0, _line_end(mm, pos, size))
+                        elif keyword.startswith(b"%%BeginSetup"):
+                            setup_start = pos
+                        elif keyword.startswith(b"%%EndSetup") and setup_start is not None:
+                            setup = (setup_start, _line_end(mm, pos, size))
+                pos = mm.find(b"%%", pos + 2)
+
+    if not pages:
+        return None
+    trailer = None
+    if trailer_start is not None:
+        trailer = (trailer_start, size)
+    pages[-1] = (pages[-1][0], trailer_start if trailer_start is not None else size)
+    return DSCIndex(path=path, size=size, prolog_end=pages[0][0], pages=pages, trailer=trailer,
+                    prolog=prolog, setup=setup)
+
+
+def index_cache_path(path):
+    """파일별 색인 캐시 경로 (사용자 캐시 폴더, 입력 폴더는 읽기 전용일 수 있음)"""
+    from conversion_cache import user_cache_dir
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    return os.path.join(user_cache_dir(), "dsc_index", digest[:2], digest + ".json")
+
+
+def _load_cached(path, size, mtime):
+    try:
+        with open(index_cache_path(path), "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return False, None
+    if data.get("version") != INDEX_VERSION or data.get("size") != size or data.get("mtime") != mtime:
+        return False, None
+    info = data.get("index")
+    if info is None:
+        return True, None  # DSC 규격이 아님을 기억해 둔 것
+    try:
+        info["pages"] = [tuple(p) for p in info["pages"]]
+        for key in ("trailer", "prolog", "setup"):
+            if info.get(key) is not None:
+                info[key] = tuple(info[key])
+        info["path"] = path
+        return True, DSCIndex(**info)
+    except (KeyError, TypeError):
+        return False, None
+
+
+def _save_cached(path, size, mtime, index):
+    cache_path = index_cache_path(path)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"version": INDEX_VERSION, "size": size, "mtime": mtime,
+                       "index": asdict(index) if index is not None else None}, fh, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def load_index(path):
+    """DSC 색인 (크기/수정 시각이 같으면 메모리나 캐시 파일에서 바로 반환, DSC 규격이 아니면 None)"""
+    abs_path = os.path.abspath(path)
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        return None
+    key = (st.st_size, st.st_mtime)
+    with _memo_lock:
+        memo = _memo.get(abs_path)
+    if memo is not None and memo[:2] == key:
+        index = memo[2]
+    else:
+        found, index = _load_cached(abs_path, *key)
+        if not found:
+            index = scan_dsc(abs_path)
+            _save_cached(abs_path, st.st_size, st.st_mtime, index)
+        with _memo_lock:
+            if len(_memo) >= MEMO_SIZE:
+                _memo.pop(next(iter(_memo)))
+            _memo[abs_path] = (st.st_size, st.st_mtime, index)
+    if index is not None and index.path != path:
+        # 호출한 쪽이 준 경로를 유지 (write_pages 등에서 그대로 사용)
+        index = DSCIndex(**dict(vars(index), path=path))
+    return index
+
+
+def header_page_count(path):
+    """%%Pages: 주석의 페이지 수 (전체 파일을 훑지 않음, 없으면 None)
+
+    헤더에 (atend)로 되어 있으면 트레일러가 있는 파일 끝부분에서 찾는다.
+    """
+    try:
+        with open(path, "rb") as fh:
+            head = fh.read(PAGES_PROBE_BYTES)
+            if not head.startswith(b"%!PS-Adobe-"):
+                return None
+            m = PAGES_RE.search(head)
+            if m is None:
+                return None
+            if m.group(1) != b"(atend)":
+                return int(m.group(1))
+            fh.seek(max(0, os.fstat(fh.fileno()).st_size - PAGES_PROBE_BYTES))
+            matches = [int(v) for v in PAGES_RE.findall(fh.read()) if v != b"(atend)"]
+    except OSError:
+        return None
+    return matches[-1] if matches else None
+
+
+def page_ranges(page_count, chunks, min_pages=1):
+    """page_count 페이지를 최대 chunks 개의 연속 구간 [(첫, 끝+1), ...]으로 균등 분할"""
+    chunks = max(1, min(chunks, page_count // max(1, min_pages)))
+    base, extra = divmod(page_count, chunks)
+    ranges = []
+    start = 0
+    for i in range(chunks):
+        end = start + base + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def parse_page_spec(spec, page_count=None):
+    """"1-3,7,10-" 형식(1부터 시작) → 0부터 시작하는 [(첫, 끝+1), ...] (ValueError: 형식 오류)
+
+    끝을 생략하면 마지막 페이지까지 (page_count를 모르면 끝은 None).
+    page_count를 주면 범위를 벗어난 부분은 잘라낸다.
+    """
+    ranges = []
+    for part in spec.replace(" ", "").split(","):
+        if not part:
+            continue
+        if not re.fullmatch(r"\d*-?\d*", part) or part == "-":
+            raise ValueError(f"잘못된 페이지 범위: {part}")
+        open_end = False
+        if "-" in part:
+            first, _, last = part.partition("-")
+            first = int(first) if first else 1
+            open_end = not last
+            last = page_count if open_end else int(last)
+        else:
+            first = last = int(part)
+        # "30-"처럼 끝을 생략한 범위는 형식 오류가 아니라 페이지 수로 잘라낸 뒤 빈 선택으로 처리
+        if first < 1 or (last is not None and last < first and not open_end):
+            raise ValueError(f"잘못된 페이지 범위: {part}")
+        if last is None:
+            ranges.append((first - 1, None))
+            continue
+        if page_count is not None:
+            last = min(last, page_count)
+            if first > last:
+                continue
+        ranges.append((first - 1, last))
+    if not ranges:
+        total = f" (전체 {page_count}페이지)" if page_count is not None else ""
+        raise ValueError(f"선택한 범위에 페이지가 없습니다{total}: {spec}")
+    return ranges
+
+
+def write_pages(index, ranges, out_path):
+    """프롤로그 + 선택한 페이지 구간들 + 트레일러로 독립된 PS 파일 생성
+
+    ranges는 [(첫, 끝+1), ...] (0부터 시작). 연속된 구간은 한 번에 복사한다.
+    """
+    spans = [(0, index.prolog_end)]
+    for first, last in ranges:
+        start, end = index.pages[first][0], index.pages[last - 1][1]
+        if spans[-1][1] == start:
+            spans[-1] = (spans[-1][0], end)
+        else:
+            spans.append((start, end))
+    if index.trailer:
+        spans.append(index.trailer)
+    with open(index.path, "rb") as src, open(out_path, "wb") as dst:
+        for start, end in spans:
+            src.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                block = src.read(min(remaining, 1024 * 1024))
+                if not block:
+                    break
+                dst.write(block)
+                remaining -= len(block)
+    return out_path
+
+
+def write_page_range(index, first, last, out_path):
+    """프롤로그 + pages[first:last] + 트레일러로 독립된 PS 파일 생성"""
+    return write_pages(index, [(first, last)], out_path)
+
+
+def main(argv=None):
+    """명령줄: 파일별 페이지 수와 DSC 구간 출력"""
+    for path in (argv if argv is not None else sys.argv[1:]):
+        index = load_index(path)
+        if index is None:
+            print(f"{path}: DSC 규격이 아님 (%%Pages: {header_page_count(path) or '?'})")
+            continue
+        print(f"{path}: {index.page_count}페이지, 프롤로그 {index.prolog_end:,}바이트"
+              + (f", 셋업 {index.setup[0]:,}-{index.setup[1]:,}" if index.setup else "")
+              + (f", 트레일러 {index.trailer[0]:,}-{index.trailer[1]:,}" if index.trailer else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
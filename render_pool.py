@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CairoSVG/Pillow 변환용 상주 작업 프로세스
+파이썬 안에서 도는 변환기(SVG, EPS)는 GIL을 오래 잡아 스레드로는 동시에 돌지 않으므로
+작업 프로세스에서 실행함. 작업 프로세스는 cairosvg/PIL을 한 번만 가져와 두고 재사용하며,
+입력은 경로(파일) 또는 공유 메모리 이름(메모리 데이터)으로 넘겨 피클링하지 않음.
+작업 프로세스가 비정상 종료되어도(잘못된 SVG로 인한 충돌 등) 해당 파일만 실패하고
+다음 작업은 새 프로세스에서 실행됨
+"""
+
+import atexit
+import io
+import multiprocessing
+import subprocess
+import threading
+import time
+from multiprocessing import shared_memory
+
+from cancellation import ConversionCancelled
+
+# 작업 프로세스 하나가 이만큼 변환하면 새 프로세스로 교체 (라이브러리 메모리 누수 대비)
+RENDER_MAX_JOBS = 200
+
+# 취소/제한 시간을 확인하는 간격 (초)
+POLL_INTERVAL = 0.1
+
+
+def _read_input(src, compression):
+    """작업 프로세스 쪽: 경로 또는 ("shm", 이름, 크기)에서 입력 bytes 읽기"""
+    if isinstance(src, tuple):
+        _, name, size = src
+        shm = _attach_shared_memory(name)
+        try:
+            return bytes(shm.buf[:size])
+        finally:
+            shm.close()
+    from formats import open_stream
+    with open_stream(src, compression) as fh:
+        return fh.read()
+
+
+def _attach_shared_memory(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python 3.12 이하: 부모의 resource_tracker를 함께 쓰므로 부모가 unlink할 때 정리됨
+        return shared_memory.SharedMemory(name=name)
+
+
+def _render_svg(src, out_pdf, compression, resolution):
+    import cairosvg
+    if isinstance(src, str) and compression is None:
+        # 경로로 주면 상대 경로 이미지/글꼴도 찾을 수 있음
+        return cairosvg.svg2pdf(url=src, write_to=out_pdf)
+    return cairosvg.svg2pdf(bytestring=_read_input(src, compression), write_to=out_pdf)
+
+
+def _render_eps(src, out_pdf, compression, resolution):
+    from PIL import Image
+    if isinstance(src, str) and compression is None:
+        img = Image.open(src)
+    else:
+        img = Image.open(io.BytesIO(_read_input(src, compression)))
+    target = out_pdf if out_pdf is not None else io.BytesIO()
+    img.save(target, "PDF", resolution=int(resolution))
+    return None if out_pdf is not None else target.getvalue()
+
+
+def _render_svg_png(src, out_png, compression, resolution):
+    # 미리 보기용 PNG (out_png가 None이면 bytes로 반환)
+    import cairosvg
+    if isinstance(src, str) and compression is None:
+        return cairosvg.svg2png(url=src, write_to=out_png, dpi=float(resolution))
+    return cairosvg.svg2png(bytestring=_read_input(src, compression), write_to=out_png, dpi=float(resolution))
+
+
+RENDERERS = {"svg": _render_svg, "eps": _render_eps, "svg_png": _render_svg_png}
+
+
+def _worker_main(conn):
+    """작업 프로세스 본체: 작업을 받아 변환하고 ("ok", 결과) 또는 ("error", 메시지)로 응답"""
+    # 시작할 때 한 번만 가져와 둠 (없으면 작업할 때 ImportError로 알림)
+    for module in ("cairosvg", "PIL.Image", "PIL.EpsImagePlugin", "PIL.PdfImagePlugin"):
+        try:
+            __import__(module)
+        except Exception:
+            pass
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            break
+        if task is None:
+            break
+        kind, src, out_pdf, compression, resolution = task
+        try:
+            conn.send(("ok", RENDERERS[kind](src, out_pdf, compression, resolution)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class RenderWorker:
+    """작업 프로세스 하나 (한 번에 한 작업)"""
+
+    def __init__(self, context):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child,), name="ps2pdf-render",
+                                       daemon=True)
+        self.process.start()
+        child.close()
+        self.jobs = 0
+
+    @property
+    def alive(self):
+        return self.process.is_alive()
+
+    def run(self, task, timeout, cancel=None):
+        """작업 실행 후 결과 반환 (실패 시 RuntimeError, 시간 초과 시 subprocess.TimeoutExpired,
+        취소 시 ConversionCancelled. 시간 초과/취소/충돌이면 이 프로세스는 종료됨)"""
+        self.jobs += 1
+        self.conn.send(task)
+        deadline = time.monotonic() + timeout
+        while not self.conn.poll(POLL_INTERVAL):
+            if cancel is not None and cancel.cancelled:
+                self.kill()
+                raise ConversionCancelled("사용자가 취소했습니다.")
+            if time.monotonic() > deadline:
+                self.kill()
+                raise subprocess.TimeoutExpired(task[0], timeout)
+            if not self.alive:
+                break
+        try:
+            status, value = self.conn.recv()
+        except (EOFError, OSError):
+            self.kill()
+            raise RuntimeError(f"변환 프로세스가 비정상 종료됨 (종료 코드 {self.process.exitcode})")
+        if status != "ok":
+            raise RuntimeError(value)
+        return value
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(5)
+        self.conn.close()
+
+    def close(self):
+        """작업 프로세스에 종료를 알리고 정리"""
+        if self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+            self.process.join(2)
+        self.kill()
+
+
+class RenderPool:
+    """CairoSVG/Pillow 작업 프로세스 모음
+
+    놀고 있는 프로세스가 있으면 재사용하고, 없으면 새로 띄움 (동시 실행 수는 호출하는 스레드 수와 같음).
+    """
+
+    def __init__(self, max_jobs=RENDER_MAX_JOBS):
+        # fork는 Tk/스레드가 있는 프로세스에서 안전하지 않고 Windows와 동작을 맞추기 위해 spawn 사용
+        self.context = multiprocessing.get_context("spawn")
+        self.max_jobs = max_jobs
+        self._idle = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _acquire(self):
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive:
+                    return worker
+                worker.kill()
+        return RenderWorker(self.context)
+
+    def _release(self, worker):
+        if worker.alive and worker.jobs < self.max_jobs:
+            with self._lock:
+                if not self._closed:
+                    self._idle.append(worker)
+                    return
+        worker.close()
+
+    def _run(self, task, timeout, cancel):
+        if cancel is not None:
+            cancel.check()
+        worker = self._acquire()
+        try:
+            return worker.run(task, timeout, cancel)
+        finally:
+            self._release(worker)
+
+    def render(self, kind, in_file, out_pdf, compression=None, resolution="300", timeout=600, cancel=None):
+        """파일 → PDF 파일 (작업 프로세스에는 경로만 넘김, out_pdf가 None이면 결과를 bytes로 반환)"""
+        return self._run((kind, in_file, out_pdf, compression, str(resolution)), timeout, cancel)
+
+    def render_bytes(self, kind, data, resolution="300", timeout=600, cancel=None):
+        """메모리 데이터 → PDF bytes (입력은 공유 메모리로 넘김)"""
+        shm = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+        try:
+            shm.buf[:len(data)] = data
+            return self._run((kind, ("shm", shm.name, len(data)), None, None, str(resolution)),
+                             timeout, cancel)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool():
+    """프로세스 전체에서 함께 쓰는 RenderPool (작업 사이에도 프로세스를 살려 둠)"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RenderPool()
+            atexit.register(_shared.close)
+        return _shared
@@ -124,13 +124,20 @@ executable = Executable(
     shortcut_dir="DesktopFolder"
 )
 
+# 명령줄 변환기 (GUI 없이 일괄 변환)
+cli_executable = Executable(
+    script="ps2pdf_cli.py",
+    base=None,  # 콘솔 애플리케이션
+    target_name="ps2pdf.exe"
+)
+
 # 설정
 setup(
     name="PS2PDF Converter",
     version=VERSION,
     description=DESCRIPTION,
     author=AUTHOR,
-    executables=[executable],
+    executables=[executable, cli_executable],
     options={
         "build_exe": build_exe_options,
         "bdist_msi": bdist_msi_options
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시작 시간 벤치마크
+첫 창 표시까지 시간(time-to-first-window)과 Ghostscript 확인까지 끝난 시간(time-to-ready),
+모듈별 import 시간을 측정하고 저장된 기준값과 비교
+
+사용 예:
+    python startup_benchmark.py --runs 5 --save startup_baseline.json
+    python startup_benchmark.py --exe dist/PS2PDF_Converter.exe --baseline startup_baseline.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+MAIN_SCRIPT = SCRIPT_DIR / "ps2pdf_converter.py"
+
+# 비교할 지표 (초)
+METRICS = ["time_to_first_window", "time_to_ready", "imports", "import_total"]
+
+IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure_once(command, timeout=60):
+    """프로그램을 한 번 실행해 시작 단계별 시간 측정 (실패 시 None)"""
+    fd, probe_path = tempfile.mkstemp(suffix=".json", prefix="ps2pdf_startup_")
+    os.close(fd)
+    os.remove(probe_path)
+    env = dict(os.environ)
+    env["PS2PDF_STARTUP_PROBE"] = probe_path
+    env["PS2PDF_STARTUP_T0"] = repr(time.time())
+    try:
+        subprocess.run(command, env=env, cwd=SCRIPT_DIR, timeout=timeout,
+                       capture_output=True)
+        with open(probe_path, "r", encoding="utf-8") as fh:
+            marks = json.load(fh)
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        return None
+    finally:
+        if os.path.exists(probe_path):
+            os.remove(probe_path)
+
+    launch = marks.get("launch") or 0.0
+    return {
+        "launch": launch,
+        "imports": marks["imports"],
+        "time_to_first_window": launch + marks["first_window"],
+        "time_to_ready": launch + marks["ready"],
+    }
+
+
+def import_breakdown(top=15):
+    """-X importtime으로 소스 실행 시 모듈별 누적 import 시간 (밀리초)"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import ps2pdf_converter"],
+                          cwd=SCRIPT_DIR, capture_output=True, text=True)
+    entries = []
+    for line in proc.stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        if m:
+            entries.append((int(m.group(2)) / 1000, len(m.group(3)) // 2, m.group(4)))
+
+    # importtime은 하위 모듈을 부모보다 먼저 출력하므로 ps2pdf_converter 줄 바로 앞
+    # (직전의 깊이 0 줄 이후) 구간이 ps2pdf_converter가 가져온 모듈들
+    subtree = []
+    for i, (_, depth, name) in enumerate(entries):
+        if depth == 0 and name == "ps2pdf_converter":
+            start = i
+            while start > 0 and entries[start - 1][1] > 0:
+                start -= 1
+            subtree = entries[start:i + 1]
+            break
+
+    direct = {}
+    heaviest = []
+    for cumulative_ms, depth, name in subtree:
+        heaviest.append((cumulative_ms, name))
+        # ps2pdf_converter가 직접 가져오는 모듈 (깊이 1)
+        if depth == 1:
+            direct[name] = round(cumulative_ms, 1)
+    heaviest.sort(reverse=True)
+    return {
+        "total": round(subtree[-1][0], 1) if subtree else None,
+        "direct": dict(sorted(direct.items(), key=lambda kv: -kv[1])),
+        "heaviest": [{"module": n, "ms": round(ms, 1)} for ms, n in heaviest[:top]],
+    }
+
+
+def compare(current, baseline, threshold):
+    """기준값 대비 threshold% 이상 느려진 지표 목록"""
+    regressions = []
+    for metric in METRICS:
+        old = baseline.get("median", {}).get(metric)
+        new = current.get("median", {}).get(metric)
+        if not old or new is None:
+            continue
+        change = (new - old) / old * 100
+        status = "느려짐" if change > threshold else "OK"
+        print(f"  {metric:22s} {old * 1000:8.1f} ms → {new * 1000:8.1f} ms ({change:+.1f}%) {status}")
+        if change > threshold:
+            regressions.append(metric)
+    return regressions
+
+
+def main(argv=None):
+    """메인 함수 (기준값 대비 느려지면 종료 코드 1)"""
+    parser = argparse.ArgumentParser(description="PS2PDF 변환기 시작 시간 벤치마크")
+    parser.add_argument("--exe", help="빌드된 실행 파일 경로 (없으면 소스 실행)")
+    parser.add_argument("--runs", type=int, default=5, help="반복 횟수 (기본값: 5)")
+    parser.add_argument("--save", help="결과를 JSON으로 저장")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=20.0,
+                        help="느려짐으로 판단할 변화율 %% (기본값: 20)")
+    args = parser.parse_args(argv)
+
+    command = [args.exe] if args.exe else [sys.executable, str(MAIN_SCRIPT)]
+    print(f"측정 대상: {' '.join(command)} ({args.runs}회)")
+
+    runs = []
+    for i in range(args.runs):
+        result = measure_once(command)
+        if result is None:
+            print(f"  {i + 1}회차: 측정 실패 (화면이 없는 환경이거나 실행 오류)")
+            continue
+        runs.append(result)
+        print(f"  {i + 1}회차: 첫 창 {result['time_to_first_window'] * 1000:.0f} ms, "
+              f"준비 완료 {result['time_to_ready'] * 1000:.0f} ms, "
+              f"import {result['imports'] * 1000:.0f} ms")
+
+    report = {
+        "target": "exe" if args.exe else "source",
+        "runs": runs,
+        "median": {m: statistics.median(r[m] for r in runs) for m in METRICS} if runs else {},
+    }
+    if not args.exe:
+        report["imports_ms"] = import_breakdown()
+        if report["imports_ms"]["total"] is not None:
+            # -X importtime 기준 ps2pdf_converter 전체 import 시간 (화면 없이도 비교 가능)
+            report["median"]["import_total"] = report["imports_ms"]["total"] / 1000
+        print("\nimport 시간 (ps2pdf_converter가 직접 가져오는 모듈, 누적 ms):")
+        for name, ms in report["imports_ms"]["direct"].items():
+            print(f"  {name:30s} {ms:8.1f}")
+
+    if report["median"]:
+        print("\n중앙값:")
+        for metric, value in report["median"].items():
+            print(f"  {metric:22s} {value * 1000:8.1f} ms")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        print(f"\n기준값 비교 ({args.baseline}, 허용 {args.threshold:.0f}%):")
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"✗ 느려진 지표: {', '.join(regressions)}")
+            return 1
+        print("✓ 기준값 대비 느려진 지표 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계별 시간 추적과 집계 지표
+변환 파이프라인의 단계(형식 판별, 캐시 확인, 변환, 캐시 저장, 병합)마다 걸린 시간을
+JSON-lines 추적 파일에 한 줄씩 기록하고, 백엔드/프리셋별 카운터와 지연 시간 히스토그램을
+Prometheus 텍스트 형식으로 내보냄
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+# 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+# 추적 파일이 이 크기를 넘으면 .1로 옮기고 새로 시작
+TRACE_MAX_BYTES = 20 * 1024 * 1024
+
+
+def _label_text(labels):
+    """Prometheus 라벨 문자열 ({a="x",b="y"}, 라벨이 없으면 "")"""
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+class Metrics:
+    """카운터와 히스토그램 누적 (스레드 안전, 프로세스가 살아 있는 동안 계속 누적)"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counters = {}    # (이름, 라벨) → 값
+        self._histograms = {}  # (이름, 라벨) → [구간별 개수..., 합계, 개수]
+        self._help = {}
+        self._lock = threading.Lock()
+
+    def count(self, name, labels=None, value=1, help_text=""):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+            if help_text:
+                self._help.setdefault(name, help_text)
+
+    def observe(self, name, seconds, labels=None, help_text=""):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = [0] * (len(self.buckets) + 2)
+            i = bisect.bisect_left(self.buckets, seconds)
+            if i < len(self.buckets):
+                hist[i] += 1
+            hist[-2] += seconds
+            hist[-1] += 1
+            if help_text:
+                self._help.setdefault(name, help_text)
+
+    def render(self):
+        """Prometheus 텍스트 형식"""
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+            help_texts = dict(self._help)
+
+        seen = set()
+        for (name, labels), value in counters:
+            if name not in seen:
+                seen.add(name)
+                if name in help_texts:
+                    lines.append(f"# HELP {name} {help_texts[name]}")
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{_label_text(labels)} {value}")
+
+        for (name, labels), hist in histograms:
+            if name not in seen:
+                seen.add(name)
+                if name in help_texts:
+                    lines.append(f"# HELP {name} {help_texts[name]}")
+                lines.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for bound, n in zip(self.buckets, hist):
+                cumulative += n
+                lines.append(f"{name}_bucket{_label_text(labels + (('le', bound),))} {cumulative}")
+            lines.append(f"{name}_bucket{_label_text(labels + (('le', '+Inf'),))} {hist[-1]}")
+            lines.append(f"{name}_sum{_label_text(labels)} {hist[-2]:.6f}")
+            lines.append(f"{name}_count{_label_text(labels)} {hist[-1]}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Prometheus 텍스트 파일로 저장 (node_exporter textfile 수집기용, 임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            fh.write(self.render())
+        os.replace(tmp_path, path)
+
+
+class Tracer:
+    """단계별 시간 기록기
+
+    사용법:
+        with tracer.span("convert", in_file, backend="ghostscript", preset="ebook") as span:
+            ...
+            span["status"] = "failed"   # 기본값은 예외 없으면 ok, 예외면 error
+
+    trace_path가 None이면 추적 파일을 쓰지 않고, metrics가 None이면 집계하지 않는다.
+    """
+
+    def __init__(self, trace_path=None, metrics=None, max_bytes=TRACE_MAX_BYTES):
+        self.trace_path = trace_path
+        self.metrics = metrics
+        self.max_bytes = max_bytes
+        self.job_id = uuid.uuid4().hex[:12]
+        self._fh = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.trace_path is not None or self.metrics is not None
+
+    def new_job(self):
+        """다음 작업부터 쓸 작업 ID 발급"""
+        self.job_id = uuid.uuid4().hex[:12]
+        return self.job_id
+
+    def count(self, name, labels=None, value=1, help_text=""):
+        """집계 카운터 증가 (metrics가 없으면 무시)"""
+        if self.metrics is not None:
+            self.metrics.count(name, labels, value, help_text)
+
+    @contextmanager
+    def span(self, stage, file=None, **labels):
+        record = {"status": "ok"}
+        if not self.enabled:
+            yield record
+            return
+        started_wall = time.time()
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record["status"] = "error"
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            self.record(stage, file, duration, started_wall, labels, record)
+
+    def record(self, stage, file, duration, started_wall=None, labels=None, extra=None):
+        """이미 잰 시간을 기록 (span을 쓸 수 없는 곳에서 사용)"""
+        labels = {k: v for k, v in (labels or {}).items() if v is not None}
+        extra = dict(extra or {})
+        status = extra.pop("status", "ok")
+        if self.metrics is not None:
+            self.metrics.observe("ps2pdf_stage_seconds", duration, dict(labels, stage=stage),
+                                 help_text="변환 단계별 소요 시간 (초)")
+            if status != "ok":
+                self.metrics.count("ps2pdf_stage_errors_total", dict(labels, stage=stage, status=status),
+                                   help_text="ok가 아닌 단계 수 (실패/취소/스킵)")
+        if self.trace_path is not None:
+            line = json.dumps({
+                "ts": round(started_wall if started_wall is not None else time.time() - duration, 6),
+                "job": self.job_id,
+                "stage": stage,
+                "file": file,
+                **labels,
+                "duration": round(duration, 6),
+                "status": status,
+                **extra,
+            }, ensure_ascii=False)
+            self._write(line)
+
+    def _write(self, line):
+        with self._lock:
+            try:
+                if self._fh is None:
+                    os.makedirs(os.path.dirname(os.path.abspath(self.trace_path)), exist_ok=True)
+                    self._fh = open(self.trace_path, "a", encoding="utf-8")
+                self._fh.write(line + "\n")
+                self._fh.flush()
+                if self._fh.tell() > self.max_bytes:
+                    self._fh.close()
+                    self._fh = None
+                    os.replace(self.trace_path, self.trace_path + ".1")
+            except OSError:
+                # 추적 기록 실패가 변환을 막지 않도록 무시
+                pass
+
+    def close(self):
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+# 추적/집계를 하지 않을 때 쓰는 기록기
+NULL_TRACER = Tracer()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+감시 폴더 변환기
+폴더를 주기적으로 훑어(os.scandir 폴링, 네트워크 공유 폴더 지원)
+새로 생기거나 바뀐 파일만 변환하고, 색인을 저장해 재시작 후에도 다시 변환하지 않음
+
+사용 예:
+    python -m watch_folder \\\\server\\share\\acq -o D:\\pdf -p printer --interval 10
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from conversion_cache import file_digest, user_cache_dir
+from cancellation import CancelToken
+from tracing import NULL_TRACER, Metrics, Tracer
+from ps2pdf_engine import (ConversionJob, run_job_interruptible, detect_extension, find_ghostscript,
+                           plan_outputs, same_path, PRESETS, default_workers)
+
+# 변환 대상 형식 (PDF는 출력 폴더와 겹치면 결과를 다시 입력으로 잡을 수 있어 제외)
+WATCH_EXTENSIONS = (".ps", ".svg", ".eps")
+
+# 확장자만으로 알 수 없어 내용을 확인하는 파일 (확장자 없음, 압축 파일)
+SNIFF_EXTENSIONS = ("", ".gz", ".bz2", ".xz")
+
+# 색인 파일 형식 버전
+INDEX_VERSION = 1
+
+
+def default_index_path():
+    """기본 색인 파일 경로"""
+    return os.path.join(user_cache_dir(), "watch_index.json")
+
+
+class WatchIndex:
+    """(경로, 크기, 수정 시각, 내용 해시, 출력 PDF) 색인"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+
+    def load(self):
+        """저장된 색인 읽기 (없거나 손상되었으면 빈 색인)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if data.get("version") == INDEX_VERSION:
+                self.entries = data.get("files", {})
+        except (OSError, ValueError):
+            self.entries = {}
+        return self
+
+    def save(self):
+        """색인 저장 (임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"version": INDEX_VERSION, "files": self.entries}, fh,
+                      ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+def scan_tree(root):
+    """root 아래의 변환 대상 파일 {경로: (크기, 수정 시각)}"""
+    found = {}
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            ext = os.path.splitext(entry.name)[1].lower()
+                            if ext in WATCH_EXTENSIONS or (ext in SNIFF_EXTENSIONS
+                                                           and detect_extension(entry.path) in WATCH_EXTENSIONS):
+                                st = entry.stat()
+                                found[os.path.abspath(entry.path)] = (st.st_size, st.st_mtime)
+                    except OSError:
+                        # 스캔 도중 삭제/권한 문제 등은 다음 폴링에서 다시 확인
+                        continue
+        except OSError:
+            continue
+    return found
+
+
+class FolderWatcher:
+    """감시 폴더를 폴링해 새로 생기거나 바뀐 파일만 변환"""
+
+    def __init__(self, folders, job_template, index_path=None, settle=2.0,
+                 remove_outputs=True, log=print, tracer=None, metrics_path=None):
+        self.folders = [os.path.abspath(f) for f in folders]
+        # 출력 폴더 아래에 감시 폴더별로 만들 하위 폴더 이름 (감시 폴더가 여러 개일 때만, 이름이 같으면 번호)
+        self._roots = {}
+        if len(self.folders) > 1:
+            used = set()
+            for folder in self.folders:
+                name = base = os.path.basename(folder.rstrip(os.sep)) or "root"
+                n = 2
+                while name.lower() in used:
+                    name = f"{base}_{n}"
+                    n += 1
+                used.add(name.lower())
+                self._roots[folder] = name
+        # inputs는 비워 두고 옵션만 사용 (output_dir가 비어 있으면 입력 파일 폴더에 저장)
+        self.job_template = job_template
+        if job_template.gs_command is None:
+            # 폴링할 때마다 찾지 않도록 한 번만 탐색 ("" = 없음)
+            job_template.gs_command = find_ghostscript() or ""
+        self.index = WatchIndex(index_path or default_index_path()).load()
+        self.settle = settle
+        self.remove_outputs = remove_outputs
+        self.log = log
+        self._pending = {}  # 경로 → (크기, 수정 시각, 처음 본 시각): 쓰는 중일 수 있는 파일
+        self.cancel = CancelToken()
+        # 단계별 시간 기록, 변환할 때마다 집계 지표 파일 갱신
+        self.tracer = tracer or NULL_TRACER
+        self.metrics_path = metrics_path
+
+    def poll(self):
+        """한 번 훑어서 변환이 필요한 파일을 변환. 변환한 파일 수 반환"""
+        now = time.time()
+        dirty = False
+        current = {}
+        for folder in self.folders:
+            current.update(scan_tree(folder))
+
+        # 삭제된 파일
+        for path in [p for p in self.index.entries if p not in current]:
+            if not any(path.startswith(os.path.join(f, "")) for f in self.folders):
+                continue
+            entry = self.index.entries.pop(path)
+            dirty = True
+            self.log(f"삭제됨: {path}")
+            output = entry.get("output")
+            # 다른 입력의 출력이 된 파일은 지우지 않음
+            shared = any(e.get("output") == output for e in self.index.entries.values())
+            if self.remove_outputs and output and not shared and os.path.exists(output):
+                try:
+                    os.remove(output)
+                    self.log(f"  출력 삭제: {output}")
+                except OSError as e:
+                    self.log(f"  출력 삭제 실패: {e}")
+        for path in [p for p in self._pending if p not in current]:
+            del self._pending[path]
+
+        ready = []
+        for path, (size, mtime) in current.items():
+            entry = self.index.entries.get(path)
+            if entry and entry["size"] == size and entry["mtime"] == mtime:
+                continue
+            # 크기/수정 시각이 settle초 동안 그대로여야 다 쓴 파일로 간주
+            pending = self._pending.get(path)
+            if pending is None or pending[:2] != (size, mtime):
+                self._pending[path] = (size, mtime, now)
+                continue
+            if now - pending[2] < self.settle:
+                continue
+            del self._pending[path]
+            try:
+                digest = file_digest(path)
+            except OSError:
+                continue
+            if entry and entry.get("hash") == digest and not entry.get("failed"):
+                # 내용은 같고 시각만 바뀜: 색인만 갱신 (실패한 파일은 시각이 바뀌면 다시 시도)
+                entry.update(size=size, mtime=mtime)
+                dirty = True
+                continue
+            ready.append((path, size, mtime, digest))
+
+        if ready:
+            self._convert(ready)
+        if ready or dirty:
+            self.index.save()
+        return len(ready)
+
+    def _output_dir(self, path):
+        """입력 파일의 출력 폴더 (출력 폴더를 지정하면 감시 폴더 기준 하위 폴더 구조를 그대로 만듦)
+
+        하위 폴더마다 같은 이름의 파일이 있어도 출력이 서로 덮어쓰지 않도록 함
+        """
+        in_dir = os.path.dirname(path)
+        if not self.job_template.output_dir:
+            return in_dir
+        root = max((f for f in self.folders if path.startswith(os.path.join(f, ""))), key=len, default=None)
+        if root is None:
+            return self.job_template.output_dir
+        parts = [self.job_template.output_dir]
+        if root in self._roots:
+            parts.append(self._roots[root])
+        rel = os.path.relpath(in_dir, root)
+        if rel != os.curdir:
+            parts.append(rel)
+        return os.path.join(*parts)
+
+    def _plan_outputs(self, paths, out_dir):
+        """out_dir 안의 출력 경로 결정 (이전 폴링에서 변환한 파일과 겹치지 않게)
+
+        다시 변환하는 파일은 전에 쓰던 출력을 그대로 쓰고, 다른 입력이 가진 출력 이름은 새 입력에 주지 않는다.
+        """
+        batch = set(paths)
+        taken = {os.path.basename(e["output"]) for p, e in self.index.entries.items()
+                 if p not in batch and e.get("output") and same_path(os.path.dirname(e["output"]), out_dir)}
+        outputs = [None] * len(paths)
+        for i, path in enumerate(paths):
+            previous = (self.index.entries.get(path) or {}).get("output")
+            if previous and same_path(os.path.dirname(previous), out_dir) \
+                    and os.path.basename(previous).lower() not in {n.lower() for n in taken}:
+                outputs[i] = previous
+                taken.add(os.path.basename(previous))
+        for i, path in enumerate(paths):
+            if outputs[i] is None:
+                outputs[i] = plan_outputs([path], out_dir, reserved=taken)[0]
+                taken.add(os.path.basename(outputs[i]))
+        return outputs
+
+    def _convert(self, ready):
+        """출력 폴더별로 묶어 변환하고 색인 갱신"""
+        groups = {}
+        for item in ready:
+            groups.setdefault(self._output_dir(item[0]), []).append(item)
+
+        for out_dir, items in groups.items():
+            try:
+                os.makedirs(out_dir, exist_ok=True)
+            except OSError as e:
+                self.log(f"출력 폴더를 만들 수 없습니다: {out_dir} ({e})")
+                continue
+            t = self.job_template
+            job = ConversionJob(
+                inputs=[item[0] for item in items],
+                output_dir=out_dir,
+                outputs=self._plan_outputs([item[0] for item in items], out_dir),
+                quality=t.quality,
+                resolution=t.resolution,
+                workers=t.workers,
+                split_pages=t.split_pages,
+                use_cache=t.use_cache,
+                persistent=t.persistent,
+                merge=False,
+                gs_command=t.gs_command,
+                timeout=t.timeout
+            )
+            self.log(f"변환: {len(items)}개 파일 → {out_dir}")
+            job_result = run_job_interruptible(job, on_event=self._on_event, cancel=self.cancel,
+                                               tracer=self.tracer)
+            if self.metrics_path and self.tracer.metrics is not None:
+                self.tracer.metrics.write(self.metrics_path)
+            for (path, size, mtime, digest), result in zip(items, job_result.results):
+                if result.ok:
+                    self.index.entries[path] = {
+                        "size": size,
+                        "mtime": mtime,
+                        "hash": digest,
+                        "output": result.output_path,
+                        "converted_at": time.time(),
+                    }
+                elif result.status == "skipped":
+                    # 변환할 수 없는 파일도 기록해 두어 매번 다시 시도하지 않음
+                    self.index.entries[path] = {"size": size, "mtime": mtime, "hash": digest,
+                                                "output": None, "skipped": result.message}
+                elif result.status == "failed":
+                    # 실패한 파일은 크기/수정 시각이 바뀔 때까지 다시 시도하지 않음
+                    self.index.entries[path] = {"size": size, "mtime": mtime, "hash": digest,
+                                                "output": None, "failed": result.message}
+            if self.cancel.cancelled:
+                # 취소된 파일은 색인에 넣지 않으므로 다음 실행 때 다시 변환
+                raise KeyboardInterrupt
+
+    def _on_event(self, event):
+        if event.kind == "file_done":
+            r = event.result
+            name = os.path.basename(r.input_path)
+            if r.ok:
+                self.log(f"  ✓ {name}{' (캐시)' if r.cached else ''}")
+            else:
+                self.log(f"  ✗ {name}: {r.message}")
+
+    def run(self, interval=5.0):
+        """Ctrl+C를 누를 때까지 interval초마다 폴링"""
+        self.log(f"감시 시작: {', '.join(self.folders)} (색인: {self.index.path})")
+        try:
+            while True:
+                self.poll()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            self.log("감시를 종료합니다.")
+        finally:
+            self.index.save()
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(
+        prog="watch_folder",
+        description="폴더를 감시해 새로 생기거나 바뀐 PS/SVG/EPS 파일을 PDF로 변환합니다.")
+    parser.add_argument("folders", nargs="+", help="감시할 폴더")
+    parser.add_argument("-o", "--output-dir", help="출력 폴더 (기본값: 입력 파일과 같은 폴더)")
+    parser.add_argument("-p", "--preset", choices=list(PRESETS), default="ebook")
+    parser.add_argument("-r", "--dpi", type=int, default=300)
+    parser.add_argument("-j", "--workers", type=int, default=default_workers())
+    parser.add_argument("--interval", type=float, default=5.0, help="폴링 간격 (초, 기본값: 5)")
+    parser.add_argument("--settle", type=float, default=2.0,
+                        help="크기/수정 시각이 이 시간 동안 그대로면 다 쓴 파일로 간주 (초, 기본값: 2)")
+    parser.add_argument("--index", help="색인 파일 경로 (기본값: 사용자 캐시 폴더)")
+    parser.add_argument("--keep-outputs", action="store_true",
+                        help="입력이 삭제되어도 출력 PDF를 지우지 않음")
+    parser.add_argument("--no-cache", action="store_true", help="변환 캐시를 사용하지 않음")
+    parser.add_argument("--timeout", type=float, metavar="SEC",
+                        help="Ghostscript 제한 시간 (초, 기본값: 입력 크기/페이지 수에 맞춰 자동)")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="파일/단계별 소요 시간을 JSON-lines로 추가 기록")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="집계 지표를 Prometheus 텍스트 파일로 저장 (변환할 때마다 갱신)")
+    parser.add_argument("--once", action="store_true", help="한 번만 훑고 종료")
+    args = parser.parse_args(argv)
+
+    missing = [f for f in args.folders if not os.path.isdir(f)]
+    if missing:
+        parser.error(f"폴더가 없습니다: {', '.join(missing)}")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    template = ConversionJob(
+        inputs=[],
+        output_dir=args.output_dir,
+        quality=PRESETS[args.preset],
+        resolution=str(args.dpi),
+        workers=args.workers,
+        use_cache=not args.no_cache,
+        timeout=args.timeout
+    )
+    tracer = Tracer(args.trace, Metrics() if args.metrics else None)
+    watcher = FolderWatcher(args.folders, template, index_path=args.index,
+                            settle=args.settle, remove_outputs=not args.keep_outputs,
+                            tracer=tracer, metrics_path=args.metrics)
+    if args.once:
+        # 한 번만 실행할 때는 쓰는 중 판별을 위해 settle 만큼 간격을 두고 두 번 훑음
+        try:
+            watcher.poll()
+            time.sleep(args.settle)
+            watcher.poll()
+        except KeyboardInterrupt:
+            watcher.log("취소되었습니다.")
+        finally:
+            watcher.index.save()
+    else:
+        watcher.run(args.interval)
+    tracer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    # 실행 파일로 묶였을 때 SVG/EPS 작업 프로세스(spawn)가 프로그램을 다시 띄우지 않도록
+    multiprocessing.freeze_support()
+    sys.exit(main())